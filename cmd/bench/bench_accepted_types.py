@@ -0,0 +1,48 @@
+# coding: utf-8
+"""
+Measures AcceptedTypes and SubClass calls per second for functions with 3, 10 and 50 args.
+
+A checker is created once for each position when function is decorated and reused on
+each call. Functions are decorated with ``opt_args_filter`` so the checks are run by
+``_pre_check()`` and not by a generated wrapper.
+
+Usage:
+    python cmd/bench/bench_accepted_types.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import AcceptedTypes, SubClass, DecArgEnum
+
+
+def _get_func(dec: type, count: int):
+    types = [int, (int, str), float] * (count // 3) + [int] * (count % 3)
+
+    @dec(*types, opt_args_filter=DecArgEnum.ARGS)
+    def foo(*args):
+        return args[0]
+    args = tuple([1, 2, 1.5] * (count // 3) + [1] * (count % 3))
+    return foo, args
+
+
+def _get_tail_func(dec: type, count: int):
+    @dec(int, opt_all_args=True, opt_args_filter=DecArgEnum.ARGS)
+    def foo(*args):
+        return args[0]
+    return foo, tuple(range(count))
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for dec in (AcceptedTypes, SubClass):
+        for count in (3, 10, 50):
+            for name, get_func in (("args", _get_func), ("opt_all_args", _get_tail_func)):
+                fn, args = get_func(dec, count)
+                t = min(timeit.repeat(lambda: fn(*args), number=number, repeat=3))
+                label = f"{dec.__name__} {count} {name}"
+                print(f"{label:<28} {number / t:>12,.0f} calls/s")
+
+
+if __name__ == '__main__':
+    main()
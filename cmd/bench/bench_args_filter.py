@@ -0,0 +1,56 @@
+# coding: utf-8
+"""
+Measures decorators that use ``opt_args_filter``.
+
+Filter is resolved once when function is decorated and checks read a read-only view
+of bound args so no filtered dictionary is created on each call.
+
+Usage:
+    python cmd/bench/bench_args_filter.py [number]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import DecArgEnum, TypeCheck, RuleCheckAll, RuleCheckAny
+from kwhelp import rules
+
+
+@TypeCheck(int, float, raise_error=False, opt_args_filter=DecArgEnum.NAMED_ARGS)
+def foo(first, second, *args, third=3, **kwargs):
+    return first
+
+
+@RuleCheckAll(rules.RuleIntPositive, opt_args_filter=DecArgEnum.ARGS | DecArgEnum.KWARGS)
+def bar(first, second, *args, third=3, **kwargs):
+    return first
+
+
+@RuleCheckAny(rules.RuleIntPositive, rules.RuleIntZero, opt_args_filter=DecArgEnum.NO_ARGS)
+def baz(first, second, *args, third=3, **kwargs):
+    return first
+
+
+def _get_peak(fn, args, kwargs) -> int:
+    fn(*args, **kwargs)
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    args = (1, 2, 3, 4)
+    kwargs = {'third': 5, 'other': 6}
+    for name, fn in (("TypeCheck", foo), ("RuleCheckAll", bar), ("RuleCheckAny", baz)):
+        t = min(timeit.repeat(lambda: fn(*args, **kwargs), number=number, repeat=3))
+        peak = _get_peak(fn, args, kwargs)
+        print(f"{name:<14} {t / number * 1e6:8.2f}us per call  peak: {peak:>6,} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# coding: utf-8
+"""
+Measures ``KwargsHelper.assign()`` calls per second with and without assign event handlers.
+
+When no handlers for ``before_assign`` or ``after_assign`` are registered, values are validated
+and assigned without creating event args.
+
+Usage:
+    python cmd/bench/bench_assign.py [number]
+"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp import KwargsHelper
+from kwhelp import rules
+
+
+class Runner:
+    pass
+
+
+def _on_assign(helper: KwargsHelper, args) -> None:
+    pass
+
+
+def run(number: int, handlers: bool) -> float:
+    kwargs = {"name": "n", "age": 2, "speed": 2.5}
+    start = time.perf_counter()
+    for _ in range(number):
+        kw = KwargsHelper(Runner(), kwargs)
+        if handlers:
+            kw.add_handler_before_assign(_on_assign)
+            kw.add_handler_after_assign(_on_assign)
+        kw.assign(key="name", types=[str], require=True)
+        kw.assign(key="age", types=[int], rules_all=[rules.RuleIntPositive])
+        kw.assign(key="speed", rules_any=[rules.RuleIntPositive, rules.RuleFloatPositive])
+        kw.assign(key="city", types=[str], default="")
+    return number * 4 / (time.perf_counter() - start)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    without = run(number, handlers=False)
+    with_cb = run(number, handlers=True)
+    print(f"assigns: {number * 4:,}")
+    print(f"without handlers: {without:>12,.0f} assigns/s")
+    print(f"with handlers:    {with_cb:>12,.0f} assigns/s  ratio: {without / with_cb:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
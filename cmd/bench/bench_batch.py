@@ -0,0 +1,55 @@
+# coding: utf-8
+"""
+Compares validating records in one process with ``validate_records()`` against
+validating them in chunks in worker processes with ``validate_batch()``.
+
+Usage:
+    python cmd/bench/bench_batch.py [number] [chunk_size]
+"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp import AssignBuilder
+from kwhelp.records import validate_records, validate_batch
+from kwhelp import rules
+
+
+def _get_builder() -> AssignBuilder:
+    ab = AssignBuilder()
+    ab.append(key="name", require=True, types=[str], rules_all=[rules.RuleStrNotNullEmptyWs])
+    ab.append(key="age", types=[int], default=18, rules_all=[rules.RuleIntPositive])
+    ab.append(key="speed", types=[int, float], rules_any=[rules.RuleIntPositive, rules.RuleFloatPositive])
+    ab.append(key="city", types=[str], default="")
+    return ab
+
+
+def _records(number: int):
+    for i in range(number):
+        if i % 10 == 0:
+            yield {"name": " ", "age": i}
+        else:
+            yield {"name": f"n{i}", "age": i, "speed": i * 1.5}
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    ab = _get_builder()
+    print(f"records: {number:,}  chunk_size: {chunk_size:,}  cpus: {os.cpu_count()}")
+    start = time.perf_counter()
+    failed = sum(1 for r in validate_records(ab, _records(number)) if not r.valid)
+    base = time.perf_counter() - start
+    print(f"validate_records:          {base:7.3f}s")
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = validate_batch(ab, _records(number), chunk_size=chunk_size, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result.failed == failed
+        print(f"validate_batch workers: {workers:>2} {elapsed:7.3f}s  speedup: {base / elapsed:5.2f}x")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# coding: utf-8
+"""
+Compares validating many values with one call of ``validate_many()`` against
+calling ``validate(**{key: value})`` for each value.
+
+Usage:
+    python cmd/bench/bench_bulk.py [number]
+"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.checks import TypeChecker, SubClassChecker, RuleChecker
+from kwhelp import rules
+
+
+def _per_value(validate, values) -> int:
+    failed = 0
+    for i, v in enumerate(values):
+        if not validate(**{f"v{i}": v}):
+            failed += 1
+    return failed
+
+
+def run(name: str, validate, validate_many, values) -> None:
+    start = time.perf_counter()
+    failed = _per_value(validate, values)
+    t_one = time.perf_counter() - start
+    start = time.perf_counter()
+    result = validate_many(values, mask=True)
+    t_many = time.perf_counter() - start
+    assert result.failed == failed
+    print(f"{name:<16} per value: {t_one:7.3f}s  validate_many: {t_many:7.3f}s  speedup: {t_one / t_many:5.1f}x")
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    values = [i if i % 10 else str(i) for i in range(number)]
+    print(f"values: {number:,}")
+    tc = TypeChecker(int, float, raise_error=False)
+    run("TypeChecker", tc.validate, tc.validate_many, values)
+    sc = SubClassChecker(int, raise_error=False)
+    run("SubClassChecker", sc.validate, sc.validate_many, values)
+    rc = RuleChecker(rules_all=[rules.RuleInt, rules.RuleIntPositive], raise_error=False)
+    run("RuleChecker", rc.validate_all, rc.validate_many_all, values)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# coding: utf-8
+"""
+Compares classifying values as class or instance by raising and catching TypeError
+with classification cached per type that is used by checks and helper.
+
+Usage:
+    python cmd/bench/bench_classify.py [number]
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.helper import _is_instance, is_iterable
+from kwhelp.checks import SubClassChecker
+
+
+def _is_instance_err(obj: object) -> bool:
+    try:
+        if not isinstance(obj, obj):
+            return False
+    except TypeError:
+        pass
+    return True
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+VALUES = (Child(), Base(), Path('.'), 1, 2.5, None)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    t_err = min(timeit.repeat(lambda: [_is_instance_err(v) for v in VALUES], number=number, repeat=3))
+    t_new = min(timeit.repeat(lambda: [_is_instance(v) for v in VALUES], number=number, repeat=3))
+    print(f"is instance, try except:  {t_err:8.3f}s")
+    print(f"is instance, classified:  {t_new:8.3f}s  speed up: {t_err / t_new:5.2f}x")
+    t_iter = min(timeit.repeat(lambda: [is_iterable(v) for v in VALUES], number=number, repeat=3))
+    print(f"is_iterable:              {t_iter:8.3f}s")
+    # values change each time so verdict cache of checker is not used.
+    sc = SubClassChecker(Base, raise_error=False)
+    values = [type(f"C{i}", (Child,), {})() for i in range(1000)]
+    t_sc = min(timeit.repeat(lambda: [sc.validate(v) for v in values], number=max(1, number // 1000), repeat=3))
+    print(f"SubClassChecker new types {t_sc:8.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# coding: utf-8
+"""
+Measures time and memory to decorate many functions with stacked decorators.
+
+Function info such as signature is created once for each function and shared by all
+decorators of the function.
+
+Usage:
+    python cmd/bench/bench_fn_info.py [number]
+"""
+import os
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import RequireArgs, TypeCheckKw, RuleCheckAllKw, ReturnType
+from kwhelp import rules
+
+SRC = "def fn_{0}(first, second=2, *args, third, **kwargs):\n    return first\n"
+
+
+def _decorate(number: int) -> list:
+    ns = {}
+    exec("".join(SRC.format(i) for i in range(number)), ns)
+    result = []
+    for i in range(number):
+        fn = ns[f"fn_{i}"]
+        fn = ReturnType(int)(fn)
+        fn = RuleCheckAllKw(arg_info={"first": rules.RuleIntPositive})(fn)
+        fn = TypeCheckKw(arg_info={"first": int, "third": str})(fn)
+        fn = RequireArgs("first", "third")(fn)
+        result.append(fn)
+    return result
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tracemalloc.start()
+    start = time.perf_counter()
+    fns = _decorate(number)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert fns[0](1, third="3") == 1
+    print(f"decorated {number} functions in {elapsed * 1000:.1f}ms, memory: {current / 1024:,.0f} KiB")
+
+
+if __name__ == '__main__':
+    main()
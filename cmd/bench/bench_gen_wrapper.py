@@ -0,0 +1,42 @@
+# coding: utf-8
+"""
+Compares calls of generated wrappers with interpreted wrappers for
+TypeCheck, AcceptedTypes and SubClass.
+
+Usage:
+    python cmd/bench/bench_gen_wrapper.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import TypeCheck, AcceptedTypes, SubClass, Validate
+
+
+def foo(first, second, third=1.5):
+    return first
+
+
+def get_cases():
+    return [
+        ("TypeCheck", lambda: TypeCheck(int, str, float), (1, 'a')),
+        ("AcceptedTypes", lambda: AcceptedTypes(int, str, float), (1, 'a', 2.5)),
+        ("SubClass", lambda: SubClass(int, str, float), (1, 'a', 2.5)),
+    ]
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    plain = min(timeit.repeat(lambda: foo(1, 'a'), number=number, repeat=3))
+    print(f"{'undecorated':<15} {plain:8.3f}s")
+    for name, get_dec, args in get_cases():
+        fn_gen = get_dec()(foo)
+        # Validate does not generate code, it is used for interpreted timing.
+        fn_interp = Validate(get_dec())(foo)
+        t_gen = min(timeit.repeat(lambda: fn_gen(*args), number=number, repeat=3))
+        t_interp = min(timeit.repeat(lambda: fn_interp(*args), number=number, repeat=3))
+        print(f"{name:<15} interpreted: {t_interp:8.3f}s  generated: {t_gen:8.3f}s  speedup: {t_interp / t_gen:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
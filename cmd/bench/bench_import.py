@@ -0,0 +1,51 @@
+# coding: utf-8
+"""
+Measures import time of kwhelp modules using ``python -X importtime``.
+
+Each import is run in a new interpreter a number of times and the median of the
+cumulative import time reported by ``-X importtime`` is printed.
+
+Usage:
+    python cmd/bench/bench_import.py [number]
+"""
+import os
+import subprocess
+import sys
+from statistics import median
+
+ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..'))
+IMPORTS = (
+    "import kwhelp",
+    "from kwhelp import KwargsHelper",
+    "import kwhelp.rules",
+    "import kwhelp.checks",
+    "import kwhelp.decorator",
+)
+
+
+def import_time(stmt: str) -> int:
+    """Gets cumulative import time in microseconds of top level kwhelp imports of ``stmt``"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt],
+                          cwd=ROOT, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    total = 0
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3:
+            continue
+        name = parts[2].rstrip()
+        # top level imports are indented by a single space.
+        if name.startswith(" kwhelp") and not name.startswith("  "):
+            total += int(parts[1])
+    return total
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"python {sys.version.split()[0]}, runs: {number}")
+    for stmt in IMPORTS:
+        times = [import_time(stmt) for _ in range(number)]
+        print(f"{stmt:<36} {median(times) / 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
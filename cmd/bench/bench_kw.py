@@ -0,0 +1,53 @@
+# coding: utf-8
+"""
+Measures Kw decorators on a function with 30 checked keyword args.
+
+``arg_info`` is resolved into a checker for each key when function is decorated so
+each call only looks up values and runs checks.
+
+Usage:
+    python cmd/bench/bench_kw.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import TypeCheckKw, RuleCheckAllKw, RuleCheckAnyKw, SubClasskKw
+from kwhelp import rules
+
+COUNT = 30
+KEYS = [f"arg{i}" for i in range(COUNT)]
+ARG_INFO = {key: i % 2 for i, key in enumerate(KEYS)}
+KWARGS = {key: (i if i % 2 == 0 else str(i)) for i, key in enumerate(KEYS)}
+
+
+@TypeCheckKw(arg_info=ARG_INFO, types=[int, str])
+def type_check(**kwargs):
+    return len(kwargs)
+
+
+@SubClasskKw(arg_info=ARG_INFO, types=[int, str])
+def sub_class(**kwargs):
+    return len(kwargs)
+
+
+@RuleCheckAllKw(arg_info=ARG_INFO, rules=[(rules.RuleInt,), (rules.RuleStr,)])
+def rule_all(**kwargs):
+    return len(kwargs)
+
+
+@RuleCheckAnyKw(arg_info=ARG_INFO, rules=[(rules.RuleIntZero, rules.RuleIntPositive), (rules.RuleStr,)])
+def rule_any(**kwargs):
+    return len(kwargs)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for name, fn in (("TypeCheckKw", type_check), ("SubClasskKw", sub_class),
+                     ("RuleCheckAllKw", rule_all), ("RuleCheckAnyKw", rule_any)):
+        t = min(timeit.repeat(lambda: fn(**KWARGS), number=number, repeat=3))
+        print(f"{name:<16} {t / number * 1e6:8.2f}us per call")
+
+
+if __name__ == '__main__':
+    main()
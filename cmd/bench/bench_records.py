@@ -0,0 +1,64 @@
+# coding: utf-8
+"""
+Compares validating records with ``validate_records()`` against creating an object
+and a ``KwargsHelper`` for each record.
+
+Usage:
+    python cmd/bench/bench_records.py [number]
+"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp import AssignBuilder, KwargsHelper
+from kwhelp.records import validate_records
+from kwhelp import rules
+
+
+class Record:
+    pass
+
+
+def _get_builder() -> AssignBuilder:
+    ab = AssignBuilder()
+    ab.append(key="name", require=True, types=[str], rules_all=[rules.RuleStrNotNullEmptyWs])
+    ab.append(key="age", types=[int], default=18, rules_all=[rules.RuleIntPositive])
+    ab.append(key="speed", types=[int, float], rules_any=[rules.RuleIntPositive, rules.RuleFloatPositive])
+    ab.append(key="city", types=[str], default="")
+    return ab
+
+
+def _records(number: int):
+    for i in range(number):
+        if i % 10 == 0:
+            yield {"name": " ", "age": i}
+        else:
+            yield {"name": f"n{i}", "age": i, "speed": i * 1.5}
+
+
+def _per_record(ab: AssignBuilder, number: int) -> int:
+    valid = 0
+    for record in _records(number):
+        kw = KwargsHelper(Record(), record, rule_error=False)
+        if all(kw.assign_helper(helper) for helper in ab):
+            valid += 1
+    return valid
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    ab = _get_builder()
+    start = time.perf_counter()
+    valid_kw = _per_record(ab, number)
+    t_kw = time.perf_counter() - start
+    start = time.perf_counter()
+    valid = sum(1 for r in validate_records(ab, _records(number), rule_error=False) if r.valid)
+    t_rec = time.perf_counter() - start
+    assert valid == valid_kw
+    print(f"records: {number:,}  valid: {valid:,}")
+    print(f"KwargsHelper per record: {t_kw:7.3f}s")
+    print(f"validate_records:        {t_rec:7.3f}s  speedup: {t_kw / t_rec:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# coding: utf-8
+"""
+Compares validating values with every built in rule by creating a rule instance
+and by calling rule ``check()`` class method that ``RuleChecker`` and ``KwargsHelper`` use.
+
+Usage:
+    python cmd/bench/bench_rules.py [number]
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp import rules
+from kwhelp.checks import RuleChecker
+
+VALUES = (None, 0, 12, -3, 2.5, "", "abc", True, [1, 2], Path('.'))
+
+
+def get_rules():
+    return [r for r in vars(rules).values()
+            if isinstance(r, type) and issubclass(r, rules._StatelessRule) and r is not rules._StatelessRule]
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    all_rules = get_rules()
+
+    def by_instance():
+        for rule in all_rules:
+            for v in VALUES:
+                rule(key='arg', name='arg', value=v, raise_errors=False, originator=None).validate()
+
+    def by_check():
+        for rule in all_rules:
+            check = rule.check
+            for v in VALUES:
+                check(v, 'arg', 'arg', None, False)
+    t_inst = min(timeit.repeat(by_instance, number=number, repeat=3))
+    t_check = min(timeit.repeat(by_check, number=number, repeat=3))
+    print(f"{len(all_rules)} rules x {len(VALUES)} values")
+    print(f"rule instance: {t_inst:8.3f}s")
+    print(f"check():       {t_check:8.3f}s  speed up: {t_inst / t_check:5.2f}x")
+    print()
+    for rule in all_rules:
+        rc = RuleChecker(rules_any=[rule], raise_error=False)
+        t_rc = min(timeit.repeat(lambda: rc.validate_any(*VALUES), number=number, repeat=3))
+        print(f"RuleChecker {rule.__name__:<26} {t_rc / number * 1e6:8.3f}us per call")
+
+
+if __name__ == '__main__':
+    main()
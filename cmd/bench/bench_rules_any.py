@@ -0,0 +1,46 @@
+# coding: utf-8
+"""
+Measures RuleCheckAny and RuleCheckAnyKw when the rule that matches is last.
+
+Rules that do not match are run without raising errors so no exceptions are created
+unless all rules fail.
+
+Usage:
+    python cmd/bench/bench_rules_any.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import RuleCheckAny, RuleCheckAnyKw
+from kwhelp import rules
+
+RULES = [rules.RuleStrEmpty, rules.RuleBool, rules.RuleIntNegative, rules.RuleFloat, rules.RuleIntPositive]
+
+
+@RuleCheckAny(*RULES)
+def foo(first, second, third):
+    return first
+
+
+@RuleCheckAnyKw(arg_info={"first": 0, "second": 0, "third": 0}, rules=[RULES])
+def bar(first, second, third):
+    return first
+
+
+@RuleCheckAny(*RULES, opt_return=False)
+def baz(first, second, third):
+    return first
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, fn, args in (("RuleCheckAny", foo, (1, 2, 3)),
+                           ("RuleCheckAnyKw", bar, (1, 2, 3)),
+                           ("RuleCheckAny fail", baz, (1, 2, "a"))):
+        t = min(timeit.repeat(lambda: fn(*args), number=number, repeat=3))
+        print(f"{name:<18} {t / number * 1e6:8.2f}us per call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# coding: utf-8
+"""
+Compares call overhead of decorated functions with and without a sample policy.
+
+Usage:
+    python cmd/bench/bench_sample.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import (Validate, TypeCheck, RuleCheckAllKw, RequireArgs, ReturnType,
+                              SamplePolicy, set_sample_policy, clear_sample_policies)
+from kwhelp import rules
+
+
+def foo(speed, limit, **kwargs):
+    return f"{speed} {limit}"
+
+
+fn_dec = Validate(
+    RequireArgs("speed", "limit"),
+    TypeCheck(int, str),
+    RuleCheckAllKw(arg_info={"speed": 0, "limit": 0}, rules=[rules.RuleIntPositive]),
+    ReturnType(str)
+)(foo)
+fn_gen = TypeCheck(int, str)(foo)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    policies = (None, SamplePolicy(every=1), SamplePolicy(every=10),
+                SamplePolicy(every=100), SamplePolicy(rate=0.01))
+    t_plain = min(timeit.repeat(lambda: foo(45, 60), number=number, repeat=3))
+    print(f"undecorated: {t_plain:8.3f}s")
+    for policy in policies:
+        clear_sample_policies()
+        if policy is not None:
+            set_sample_policy(policy)
+        for name, fn in (("Validate", fn_dec), ("TypeCheck", fn_gen)):
+            t = min(timeit.repeat(lambda: fn(45, 60), number=number, repeat=3))
+            print(f"{name:<10} {str(policy):<26} {t:8.3f}s  overhead per call: {(t - t_plain) / number * 1e6:8.2f}us")
+    clear_sample_policies()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# coding: utf-8
+"""
+Compares assigning attributes of many objects with ``KwargsHelper.assign_helper()``
+for each item of an ``AssignBuilder`` against ``KwargsHelper.assign_schema()``
+with a schema compiled once.
+
+Usage:
+    python cmd/bench/bench_schema.py [number]
+"""
+import os
+import sys
+import time
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp import AssignBuilder, KwargsHelper
+from kwhelp import rules
+
+
+def _get_builder() -> AssignBuilder:
+    ab = AssignBuilder()
+    ab.append(key="name", require=True, types=[str], rules_all=[rules.RuleStrNotNullEmptyWs])
+    ab.append(key="age", types=[int], default=18, rules_all=[rules.RuleIntPositive])
+    ab.append(key="speed", types=[int, float], rules_any=[rules.RuleIntPositive, rules.RuleFloatPositive])
+    ab.append(key="city", types=[str], default="")
+    ab.append(key="zip", field="zip_code", types=[str], default="")
+    return ab
+
+
+class Runner:
+    def __init__(self, ab: AssignBuilder, **kwargs):
+        kw = KwargsHelper(self, {**kwargs})
+        for helper in ab:
+            kw.assign_helper(helper)
+
+
+class RunnerSchema:
+    def __init__(self, schema, **kwargs):
+        KwargsHelper(self, {**kwargs}).assign_schema(schema)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    ab = _get_builder()
+    start = time.perf_counter()
+    for i in range(number):
+        Runner(ab, name="n", age=i + 1, speed=2.5, city="c")
+    t_helper = time.perf_counter() - start
+    start = time.perf_counter()
+    schema = ab.compile()
+    for i in range(number):
+        RunnerSchema(schema, name="n", age=i + 1, speed=2.5, city="c")
+    t_schema = time.perf_counter() - start
+    print(f"objects: {number:,}")
+    print(f"assign_helper: {t_helper:7.3f}s  {t_helper / number * 1e6:7.2f} us/object")
+    print(f"assign_schema: {t_schema:7.3f}s  {t_schema / number * 1e6:7.2f} us/object  speedup: {t_helper / t_schema:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# coding: utf-8
+"""
+Measures memory of many functions decorated with the same decorator configuration.
+
+Decorators with the same configuration share one checker. The number of distinct
+checkers is reported by ``kwhelp.checks.get_checker_stats()``.
+
+Usage:
+    python cmd/bench/bench_shared.py [number]
+"""
+import os
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import TypeCheck, RuleCheckAll, AcceptedTypes
+from kwhelp.checks import get_checker_stats
+from kwhelp import rules
+
+
+def _make(i: int):
+    @RuleCheckAll(rules.RuleNotNone)
+    @AcceptedTypes(int, (int, str), float)
+    @TypeCheck(int, str, float)
+    def foo(first, second, third):
+        return first
+    foo.__name__ = f"foo_{i}"
+    return foo
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tracemalloc.start()
+    start = time.perf_counter()
+    funcs = [_make(i) for i in range(number)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = get_checker_stats()
+    print(f"functions: {len(funcs):>8,}  time: {elapsed:6.2f}s  memory: {current / 1024 / 1024:6.1f} MiB")
+    print(f"shared checkers: {stats.count:>3}  size: {stats.size:,} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# coding: utf-8
+"""
+Compares call overhead of decorated functions in strict mode and in strip mode.
+
+Usage:
+    python cmd/bench/bench_strip.py [number]
+"""
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import (TypeCheck, RuleCheckAllKw, RequireArgs, ReturnType,
+                              set_strip_mode)
+from kwhelp import rules
+
+
+def foo(speed, limit, **kwargs):
+    return f"{speed} {limit}"
+
+
+def decorate(func):
+    func = ReturnType(str)(func)
+    func = RuleCheckAllKw(arg_info={"speed": 0, "limit": 0}, rules=[rules.RuleIntPositive])(func)
+    func = TypeCheck(int, str)(func)
+    return RequireArgs("speed", "limit")(func)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    set_strip_mode(False)
+    fn_strict = decorate(foo)
+    set_strip_mode(True)
+    fn_strip = decorate(foo)
+    set_strip_mode(False)
+    t_plain = min(timeit.repeat(lambda: foo(45, 60), number=number, repeat=3))
+    t_strict = min(timeit.repeat(lambda: fn_strict(45, 60), number=number, repeat=3))
+    t_strip = min(timeit.repeat(lambda: fn_strip(45, 60), number=number, repeat=3))
+    print(f"undecorated: {t_plain:8.3f}s")
+    print(f"strict:      {t_strict:8.3f}s  overhead per call: {(t_strict - t_plain) / number * 1e6:8.2f}us")
+    print(f"strip:       {t_strip:8.3f}s  overhead per call: {(t_strip - t_plain) / number * 1e6:8.2f}us")
+    print(f"strip is same function: {fn_strip is foo}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+Measures throughput of decorated function calls from a number of worker threads.
+
+Decorators keep call state in a call context object so calls from worker threads
+do not share state. On a free-threaded build of python throughput is expected to
+scale with worker count. On a build with the GIL throughput stays about the same.
+
+Usage:
+    python cmd/bench/bench_threads.py [calls_per_worker] [max_workers]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from kwhelp.decorator import TypeCheck, RuleCheckAll, AcceptedTypes
+from kwhelp import rules
+
+
+@RuleCheckAll(rules.RuleNotNone)
+@AcceptedTypes(int, (int, str), float)
+@TypeCheck(int, str, float)
+def foo(first, second, third):
+    return first
+
+
+def _work(calls: int) -> int:
+    for i in range(calls):
+        foo(i, 'a', 1.5)
+    return calls
+
+
+def run(workers: int, calls: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        total = sum(ex.map(_work, [calls] * workers))
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL enabled: {gil}")
+    base = None
+    workers = 1
+    while workers <= max_workers:
+        ops = run(workers=workers, calls=calls)
+        if base is None:
+            base = ops
+        print(f"workers: {workers:>3}  calls/s: {ops:>12,.0f}  scale: {ops / base:5.2f}x")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
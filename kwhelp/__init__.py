@@ -1,14 +1,48 @@
 # coding: utf-8
-from inspect import isclass
+import sys
 from .helper import NO_THING
 from . helper.base import HelperBase
-from . rules import IRule
 from .exceptions import CancelEventError, ReservedAttributeError, RuleError
-from typing import Iterable, List, Optional, Callable
+from typing import Iterable, List, Optional, Callable, TYPE_CHECKING
 from collections import UserList
-from typing import Any, Dict, List, Optional, Set, Callable, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Callable, Tuple, Union
+if TYPE_CHECKING:
+    from .rules import IRule
 VERSION = __version__ = '2.7.1'
 
+# region Lazy submodules
+# submodules are loaded on first access so that ``import kwhelp`` does not load
+# decorator, checks and rules machinery when only KwargsHelper is used.
+_lazy_submodules = ('checks', 'decorator', 'records', 'rules')
+# names that were imported from submodules before submodules were loaded lazily.
+_lazy_attrs = {'IRule': 'rules'}
+
+
+def __getattr__(name: str):
+    if name in _lazy_submodules:
+        from importlib import import_module
+        return import_module(f"{__name__}.{name}")
+    if name in _lazy_attrs:
+        from importlib import import_module
+        return getattr(import_module(f".{_lazy_attrs[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_submodules) | set(_lazy_attrs))
+
+
+# rule functions used by KwargsHelper, set by _load_rules() when rules are first validated.
+_get_rule_checks = None
+_validate_checks_any = None
+
+
+def _load_rules() -> None:
+    global _get_rule_checks, _validate_checks_any
+    from .rules import _get_rule_checks, _validate_checks_any
+
+# endregion Lazy submodules
+
 # region class HelperArgs
 
 
@@ -150,7 +184,7 @@ class HelperArgs(HelperBase):
         return None
 
     @property
-    def rules_all(self) -> List[Callable[[IRule], bool]]:
+    def rules_all(self) -> List[Callable[['IRule'], bool]]:
         """
         Rules values
 
@@ -160,13 +194,13 @@ class HelperArgs(HelperBase):
         return self._rules_all
 
     @rules_all.setter
-    def rules_all(self, value: List[Callable[[IRule], bool]]) -> None:
+    def rules_all(self, value: List[Callable[['IRule'], bool]]) -> None:
         self._isinstance_prop(value=value, prop_name='rules_all',
                               prop_type=list, raise_error=True)
         self._rules_all = value
 
     @property
-    def rules_any(self) -> List[Callable[[IRule], bool]]:
+    def rules_any(self) -> List[Callable[['IRule'], bool]]:
         """
         Rules values
 
@@ -176,7 +210,7 @@ class HelperArgs(HelperBase):
         return self._rules_any
 
     @rules_any.setter
-    def rules_any(self, value: List[Callable[[IRule], bool]]) -> None:
+    def rules_any(self, value: List[Callable[['IRule'], bool]]) -> None:
         self._isinstance_prop(value=value, prop_name='rules_any',
                               prop_type=list, raise_error=True)
         self._rules_any = value
@@ -196,7 +230,7 @@ class AssignBuilder(UserList):
         super().__init__(initlist=None)
         self._keys = set()
 
-    def append(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = None, types: Optional[List[type]] = None, rules_all: Optional[List[Callable[[IRule], bool]]] = None, rules_any: Optional[List[Callable[[IRule], bool]]] = None):
+    def append(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = None, types: Optional[List[type]] = None, rules_all: Optional[List[Callable[['IRule'], bool]]] = None, rules_any: Optional[List[Callable[['IRule'], bool]]] = None):
         """
         Appends dictionary item of parameters to list
 
@@ -332,6 +366,30 @@ class AssignBuilder(UserList):
         result = f"{self.__class__.__name__}.{method_name}() arg '{arg_name}' {msg}"
         return result
 
+    def compile(self, field_prefix: str = '_') -> 'AssignSchema':
+        """
+        Compiles current items into an immutable schema that can be assigned many times
+        by :py:meth:`~.KwargsHelper.assign_schema`.
+
+        Later changes to this instance do not change compiled schema.
+
+        Args:
+            field_prefix (str, optional): prefix of field names of items that do not have a ``field``.
+                Default ``_``.
+
+        Raises:
+            TypeError: if ``field_prefix`` is not instance of ``str``.
+            TypeError: if a rule does not implement ``IRule``.
+
+        Returns:
+            AssignSchema: compiled schema.
+        """
+        if not isinstance(field_prefix, str):
+            raise TypeError(self._get_type_error_method_msg(
+                method_name='compile', arg=field_prefix, arg_name='field_prefix', expected_type='str'
+            ))
+        return AssignSchema(self, field_prefix)
+
     # region dunder methods
     def __getitem__(self, i: int) -> HelperArgs:
         return super().__getitem__(i)
@@ -355,6 +413,98 @@ class AssignBuilder(UserList):
     # endregion dunder methods
 # endregion class AssignBuilder
 
+# region class AssignSchema
+
+
+class _SchemaArgs(HelperArgs):
+    """Read-only ``HelperArgs`` of a compiled schema. Field name and rules are resolved once."""
+
+    def __init__(self, helper: HelperArgs, field_prefix: str):
+        super().__init__(key=helper.key, require=helper.require, default=helper.default,
+                         field=helper.field if helper.field else f"{field_prefix}{helper.key}")
+        if _get_rule_checks is None:
+            _load_rules()
+        self._types = frozenset(helper.types)
+        self._rules_all = tuple(helper.rules_all)
+        self._rules_any = tuple(helper.rules_any)
+        self._checks_all = _get_rule_checks(self._rules_all)
+        self._checks_any = _get_rule_checks(self._rules_any)
+        for _, check in self._checks_all + self._checks_any:
+            if check is None:
+                raise TypeError('Rules must implement IRule')
+        self._frozen = True
+
+    def _to_helper(self) -> HelperArgs:
+        # mutable copy for assign handlers, handlers can change it as they can with assign().
+        return HelperArgs(key=self.key, field=self.field, require=self.require, default=self.default,
+                          types=set(self._types), rules_all=list(self._rules_all), rules_any=list(self._rules_any))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError(
+                f"{self.__class__.__name__} of a compiled schema can not be changed.")
+        super().__setattr__(name, value)
+
+
+class AssignSchema:
+    """
+    Immutable schema compiled from :py:class:`~.AssignBuilder` by :py:meth:`~.AssignBuilder.compile`.
+
+    Field names, types and rules of each key are resolved once so that a schema can be assigned to
+    many objects by :py:meth:`~.KwargsHelper.assign_schema`.
+    """
+    __slots__ = ('_items', '_field_prefix', '_required')
+
+    def __init__(self, builder: AssignBuilder, field_prefix: str = '_'):
+        """
+        Constructor
+
+        Args:
+            builder (AssignBuilder): items of schema.
+            field_prefix (str, optional): prefix of field names of items that do not have a ``field``.
+                Default ``_``.
+        """
+        self._field_prefix = field_prefix
+        self._items: Tuple[_SchemaArgs] = tuple(_SchemaArgs(helper, field_prefix) for helper in builder)
+        # only required when there is no default
+        self._required: FrozenSet[str] = frozenset(
+            item.key for item in self._items if item.require and item.default is NO_THING)
+
+    # region dunder methods
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[HelperArgs]:
+        return iter(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return any(item.key == key for item in self._items)
+    # endregion dunder methods
+
+    # region Properties
+    @property
+    def field_prefix(self) -> str:
+        """Gets prefix of field names of items that do not have a ``field``"""
+        return self._field_prefix
+
+    @property
+    def keys(self) -> Tuple[str]:
+        """Gets keys of schema in order"""
+        return tuple(item.key for item in self._items)
+
+    @property
+    def fields(self) -> Dict[str, str]:
+        """Gets field name of each key"""
+        return {item.key: item.field for item in self._items}
+
+    @property
+    def required(self) -> FrozenSet[str]:
+        """Gets keys that are required and have no default"""
+        return self._required
+    # endregion Properties
+
+# endregion class AssignSchema
+
 # region Event Args
 
 
@@ -769,7 +919,7 @@ class KwargsHelper(HelperBase):
     # endregion init
 
     # region Public Methods
-    def auto_assign(self, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[[IRule], bool]]] = None, rules_any: Optional[Iterable[Callable[[IRule], bool]]] = None) -> bool:
+    def auto_assign(self, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[['IRule'], bool]]] = None, rules_any: Optional[Iterable[Callable[['IRule'], bool]]] = None) -> bool:
         """
         Assigns all of the key, value pairs of ``obj_kwargs`` passed into constructor to ``originator``,
         unless the event is canceled in :py:class:`.BeforeAssignAutoEventArgs` then key,
@@ -830,7 +980,7 @@ class KwargsHelper(HelperBase):
                                                  rules_any=rules_any)
         return valid
 
-    def assign(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = NO_THING, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[[IRule], bool]]] = None, rules_any: Optional[Iterable[Callable[[IRule], bool]]] = None) -> bool:
+    def assign(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = NO_THING, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[['IRule'], bool]]] = None, rules_any: Optional[Iterable[Callable[['IRule'], bool]]] = None) -> bool:
         """
         Assigns attribute value to ``obj`` passed in to constructor. Attributes are created if they do not exist.
 
@@ -895,25 +1045,29 @@ class KwargsHelper(HelperBase):
         self._is_arg_bool(
             method_name=m_name, arg=require, arg_name='require', raise_error=True)
 
-        if types == None:
-            types = []
-        if rules_all == None:
-            rules_all = []
-        if rules_any == None:
-            rules_any = []
-        _args = HelperArgs(key=key, require=require, rules_all=rules_all, rules_any=rules_any)
-        _args.field = field
-        # _args.require = require
-        _args.types = set(types)
-        if default is not NO_THING:
-            _args.default = default
-        before_args = BeforeAssignEventArgs(_args, self._obj)
+        if self._is_assign_no_cb_args(field=field, types=types, rules_all=rules_all, rules_any=rules_any):
+            result = self._assign_no_cb(key=key.strip(), field=field, require=require, default=default,
+                                        types=types, rules_all=rules_all, rules_any=rules_any)
+        else:
+            if types == None:
+                types = []
+            if rules_all == None:
+                rules_all = []
+            if rules_any == None:
+                rules_any = []
+            _args = HelperArgs(key=key, require=require, rules_all=rules_all, rules_any=rules_any)
+            _args.field = field
+            # _args.require = require
+            _args.types = set(types)
+            if default is not NO_THING:
+                _args.default = default
+            before_args = BeforeAssignEventArgs(_args, self._obj)
 
-        after_args = AfterAssignEventArgs(_args, self._obj)
-        self._assign(args=_args, before_args=before_args,
-                     after_args=after_args)
-        self._on_after_assign(after_args)
-        result = after_args.success
+            after_args = AfterAssignEventArgs(_args, self._obj)
+            self._assign(args=_args, before_args=before_args,
+                         after_args=after_args)
+            self._on_after_assign(after_args)
+            result = after_args.success
 
         if result == False and self._assign_true_not_required == True and require == False:
             result = True
@@ -934,6 +1088,51 @@ class KwargsHelper(HelperBase):
         d = helper.to_dict()
         return self.assign(**d)
 
+    def assign_schema(self, schema: AssignSchema) -> bool:
+        """
+        Assigns attribute values for all keys of a compiled schema in one pass.
+        Each key is assigned in order as :py:meth:`~.KwargsHelper.assign` does.
+
+        Args:
+            schema (AssignSchema): schema compiled by :py:meth:`.AssignBuilder.compile`.
+
+        Raises:
+            TypeError: if ``schema`` is not instance of ``AssignSchema``.
+            RuleError: If :py:attr:`~KwargsHelper.rule_error` is ``True`` and Validation of
+                ``rules_all`` or ``rules_any`` fails.
+            TypeError: If validation of ``types`` fails.
+            ValueError: If a required key is missing.
+
+        Returns:
+            bool: ``True`` if assignment of all keys is successful; Otherwise, ``False``.
+
+        Note:
+            Field names of schema are built with ``field_prefix`` of schema.
+            :py:attr:`~.KwargsHelper.field_prefix` is not used.
+        """
+        self._isinstance_method(method_name='assign_schema', arg=schema,
+                                arg_name='schema', arg_type=AssignSchema, raise_error=True)
+        result = True
+        no_cb = not self._is_assign_handlers()
+        for args in schema._items:
+            if no_cb:
+                success = self._assign_no_cb(key=args.key, field=args.field, require=args.require,
+                                             default=args.default, types=args.types,
+                                             rules_all=args.rules_all, rules_any=args.rules_any,
+                                             checks_all=args._checks_all, checks_any=args._checks_any)
+            else:
+                # handlers get a copy that can be changed, schema is not changed.
+                helper_args = args._to_helper()
+                before_args = BeforeAssignEventArgs(helper_args, self._obj)
+                after_args = AfterAssignEventArgs(helper_args, self._obj)
+                self._assign(args=helper_args, before_args=before_args,
+                             after_args=after_args)
+                self._on_after_assign(after_args)
+                success = after_args.success
+            if success == False and (self._assign_true_not_required == False or args.require == True):
+                result = False
+        return result
+
     def is_key_existing(self, key: str) -> bool:
         """
         Gets if the key exist in  kwargs dictionary passed in to the constructor by ``obj_kwargs`` arg.
@@ -1021,6 +1220,57 @@ class KwargsHelper(HelperBase):
         after_args._success
         return None
 
+    def _is_assign_no_cb_args(self, field: Optional[str], types: Optional[Iterable[type]], rules_all: Optional[Iterable['IRule']], rules_any: Optional[Iterable['IRule']]) -> bool:
+        '''
+        Gets if assign() can skip event args.
+        Args that HelperArgs would reject take the full path so that errors are the same.
+        '''
+        if self._is_assign_handlers():
+            return False
+        if field is not None and not isinstance(field, str):
+            return False
+        if types is not None and not isinstance(types, (list, tuple, set, frozenset)):
+            return False
+        if rules_all is not None and not isinstance(rules_all, list):
+            return False
+        if rules_any is not None and not isinstance(rules_any, list):
+            return False
+        return True
+
+    def _assign_no_cb(self, key: str, field: Optional[str], require: bool, default: object, types: Optional[Iterable[type]], rules_all: Optional[Iterable['IRule']], rules_any: Optional[Iterable['IRule']], checks_all: Optional[tuple] = None, checks_any: Optional[tuple] = None) -> bool:
+        '''
+        Assigns a key when there are no assign event handlers. Same as _assign() without event args.
+        @return: `True` if attribute is assigned and rules passed; Otherwise, `False`
+        '''
+        if key in self._kwargs:
+            value = self._kwargs[key]
+            if types and not type(value) in types:
+                # message is formated from a set of types as _assign() does.
+                self._validate_type(key=key, value=value, types=set(types))
+        elif default is not NO_THING:
+            value = default
+        elif require:
+            # only test for required when default is not included
+            raise ValueError(f"{self._name} arg '{key}' is required")
+        else:
+            return False
+        _field = field.strip() if field else field
+        if not _field:
+            _field = f"{self._field_prefix}{key}"
+        if self._rule_test_early:
+            if rules_all and not self._validate_rules_all(rules=rules_all, key=key, field=_field, value=value, checks=checks_all):
+                return False
+            if rules_any and not self._validate_rules_any(rules=rules_any, key=key, field=_field, value=value, checks=checks_any):
+                return False
+        setattr(self._obj, _field, value)
+        self._remove_key(key)
+        if self._rule_test_early == False:
+            if rules_all and not self._validate_rules_all(rules=rules_all, key=key, field=_field, value=value, checks=checks_all):
+                return False
+            if rules_any and not self._validate_rules_any(rules=rules_any, key=key, field=_field, value=value, checks=checks_any):
+                return False
+        return True
+
     # endregion internal assign methods
 
     def _get_formated_types(self, types: Iterable[type]) -> str:
@@ -1064,7 +1314,7 @@ class KwargsHelper(HelperBase):
         return result
 
     # region internal validation methods
-    def _auto_assign_validation(self, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[[IRule], bool]]] = None, rules_any: Optional[Iterable[Callable[[IRule], bool]]] = None) -> bool:
+    def _auto_assign_validation(self, types: Optional[Iterable[type]] = None, rules_all: Optional[Iterable[Callable[['IRule'], bool]]] = None, rules_any: Optional[Iterable[Callable[['IRule'], bool]]] = None) -> bool:
         if isinstance(types, Iterable):
             self._validate_types(types)
         valid = True
@@ -1115,7 +1365,7 @@ class KwargsHelper(HelperBase):
             args=args, field=field, value=value, after_args=after_args)
         return result
 
-    def _validate_auto_assign_rules_all(self, rules: Iterable[IRule]) -> bool:
+    def _validate_auto_assign_rules_all(self, rules: Iterable['IRule']) -> bool:
         result = True
         if len(rules) > 0:
             for k, v in self._kwargs.items():
@@ -1127,7 +1377,7 @@ class KwargsHelper(HelperBase):
                     break
         return result
 
-    def _validate_auto_assign_rules_any(self, rules: Iterable[IRule]) -> bool:
+    def _validate_auto_assign_rules_any(self, rules: Iterable['IRule']) -> bool:
         result = True
         if len(rules) > 0:
             for k, v in self._kwargs.items():
@@ -1142,27 +1392,32 @@ class KwargsHelper(HelperBase):
 
     def _validate_assign_rules_all(self, args: HelperArgs, field: str, value: object,  after_args: AfterAssignEventArgs) -> bool:
         # if all rules pass then validations is considered a success
-        result = self._validate_rules_all(rules=args.rules_all, key=after_args.key, field=field, value=value)
+        # rules of a compiled schema are resolved once.
+        result = self._validate_rules_all(rules=args.rules_all, key=after_args.key, field=field, value=value,
+                                          checks=getattr(args, '_checks_all', None))
         after_args._rules_passed = result
         return result
 
     def _validate_assign_rules_any(self, args: HelperArgs, field: str, value: object,  after_args: AfterAssignEventArgs) -> bool:
         # if any rule passes then validations is considered a success
-        result = self._validate_rules_any(rules=args.rules_any, key=after_args.key, field=field, value=value)
+        result = self._validate_rules_any(rules=args.rules_any, key=after_args.key, field=field, value=value,
+                                          checks=getattr(args, '_checks_any', None))
         after_args._rules_passed = result
         return result
 
-    def _validate_rules_all(self, rules: Iterable[IRule], key: str, field: str, value: object) -> bool:
+    def _validate_rules_all(self, rules: Iterable['IRule'], key: str, field: str, value: object, checks: Optional[tuple] = None) -> bool:
         # if all rules pass then validations is considered a success
         result = True
         if len(rules) > 0:
-            for rule in rules:
-                if not isclass(rule) or not issubclass(rule, IRule):
+            if checks is None:
+                if _get_rule_checks is None:
+                    _load_rules()
+                checks = _get_rule_checks(rules)
+            for rule, check in checks:
+                if check is None:
                     raise TypeError('Rules must implement IRule')
-                rule_instance: IRule = rule(
-                    key=key, name=field, value=value, raise_errors=self._rule_error, originator=self._obj)
                 try:
-                    result = result & rule_instance.validate()
+                    result = result & check(value, key, field, self._obj, self._rule_error)
                 except Exception as e:
                     raise RuleError(
                         err_rule=rule, rules_all=rules, arg_name=key, errors=e) from e
@@ -1170,31 +1425,24 @@ class KwargsHelper(HelperBase):
                     break
         return result
 
-    def _validate_rules_any(self, rules: Iterable[IRule], key: str, field: str, value: object) -> bool:
+    def _validate_rules_any(self, rules: Iterable['IRule'], key: str, field: str, value: object, checks: Optional[tuple] = None) -> bool:
         # if any rule passes then validations is considered a success
-        error_lst = []
-        failed_rules = []
-        result = True
-        if len(rules) > 0:
-            for rule in rules:
-                if not isclass(rule) or not issubclass(rule, IRule):
-                    raise TypeError('Rules must implement IRule')
-                rule_instance: IRule = rule(
-                    key=key, name=field, value=value, raise_errors=self._rule_error, originator=self._obj)
-                rule_valid = False
-                try:
-                    rule_valid = rule_instance.validate()
-                except Exception as e:
-                    error_lst.append(e)
-                    failed_rules.append(rule)
-                    rule_valid = False
-                result = rule_valid
-                if rule_valid is True:
-                    break
-        if result is False and self._rule_error is True and len(error_lst) > 0:
-            # raise the first error in error list
-            raise RuleError(rules_any=rules,
-                            err_rule=failed_rules[0], arg_name=key, errors=error_lst) from error_lst[0]
+        if len(rules) == 0:
+            return True
+        # built in rules do not raise errors unless no rule is a match.
+        if _validate_checks_any is None:
+            _load_rules()
+        if checks is None:
+            checks = _get_rule_checks(rules)
+        result, failed = _validate_checks_any(
+            checks, value, key, field, self._obj, self._rule_error)
+        if result is False and self._rule_error is True:
+            error_lst = [r.error for r in failed if r.error is not None]
+            if len(error_lst) > 0:
+                # raise the first error in error list
+                failed_rules = [r.rule for r in failed if r.error is not None]
+                raise RuleError(rules_any=rules,
+                                err_rule=failed_rules[0], arg_name=key, errors=error_lst) from error_lst[0]
         return result
 
     # endregion internal validation methods
@@ -1209,6 +1457,14 @@ class KwargsHelper(HelperBase):
             return True
         return False
 
+    def _is_assign_handlers(self) -> bool:
+        '''
+        Gets if any handler are set for Assign
+        '''
+        if self._callbacks is None:
+            return False
+        return 'on_before_assign' in self._callbacks or 'on_after_assign' in self._callbacks
+
     def _is_auto_assign_handlers(self) -> bool:
         '''
         Gets if any handler are set for Auto Assign
@@ -1479,7 +1735,7 @@ class KwArg:
         """
         self._kw_arg_internal = KwArg._KwArgInternal(orig=self, **kwargs)
 
-    def kw_assign(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = NO_THING, types: Optional[List[type]] = None, rules_all: Optional[List[Callable[[IRule], bool]]] = None, rules_any: Optional[List[Callable[[IRule], bool]]] = None) -> bool:
+    def kw_assign(self, key: str, field: Optional[str] = None, require: bool = False, default: Optional[object] = NO_THING, types: Optional[List[type]] = None, rules_all: Optional[List[Callable[['IRule'], bool]]] = None, rules_any: Optional[List[Callable[['IRule'], bool]]] = None) -> bool:
         """
         Assigns attribute value to current instance passed in to constructor. Attributes automatically.
 
@@ -1609,3 +1865,9 @@ class KwArg:
     # endregion Properties
 
 # endregion class KwArg
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) requires python 3.7.
+    # imported last, records uses classes of this module.
+    from . import checks, decorator, records, rules
+    from .rules import IRule
@@ -1,34 +1,215 @@
 # coding: utf-8
+import sys
+import threading
+import weakref
+from abc import ABCMeta
+from collections import namedtuple
 from inspect import isclass
-from typing import Iterable, Iterator, List, Optional, Tuple, Type, Union
-from ..rules import IRule
-from ..helper import is_iterable, Formatter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from ..rules import IRule, _get_rule_checks, _validate_checks_any
+from ..helper import is_iterable, Formatter, _is_instance, _get_type, _is_plain_type, _StarKey
 from ..exceptions import RuleError
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+"""Verdict cache statistics of a checker. Same fields as ``functools.lru_cache`` ``cache_info()``"""
+
+CheckerStats = namedtuple('CheckerStats', ['count', 'size'])
+"""Number of distinct shared checkers and their approximate size in bytes"""
+
+BulkResult = namedtuple('BulkResult', ['total', 'failed', 'first', 'mask'])
+"""
+Result of validating many values with a checker.
+
+``total`` is number of values validated. ``failed`` is number of values that are not valid.
+``first`` is index of first value that is not valid, for key, value pairs it is the key; Otherwise, ``None``.
+``mask`` is a ``bytearray`` with ``1`` for each valid value and ``0`` for each value that is not valid
+when requested; Otherwise, ``None``.
+"""
+
+
+# region Shared checkers
+# checkers with the same configuration are shared. Entries are removed when no
+# decorator holds the checker.
+_shared: "weakref.WeakValueDictionary[tuple, _CheckBase]" = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+def _get_size(obj: object) -> int:
+    # size of checker, its attributes and the containers it holds.
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is None:
+        return size
+    size += sys.getsizeof(attrs)
+    for value in attrs.values():
+        if isinstance(value, (dict, list, tuple, set, frozenset, str)):
+            size += sys.getsizeof(value)
+    return size
+
+
+def get_checker_stats() -> CheckerStats:
+    """
+    Gets statistics of checkers that are shared by decorators.
+
+    Decorators with the same configuration such as ``@TypeCheck(int, float)`` share one checker.
+
+    Returns:
+        CheckerStats: named tuple of ``count``, number of distinct shared checkers in process
+        and ``size``, approximate memory used by shared checkers in bytes.
+    """
+    with _shared_lock:
+        checkers = list(_shared.values())
+    return CheckerStats(len(checkers), sum(_get_size(c) for c in checkers))
+
+# endregion Shared checkers
+
 
 class _CheckBase:
+    # max number of types kept in verdict cache of a checker.
+    _CACHE_MAX_SIZE = 128
+    # shared checkers can not be changed after construction.
+    _frozen = False
+
     def __init__(self, **kwargs):
         """Constructor"""
 
-    def _is_instance(self, obj: object) -> bool:
-        # when obj is instance then isinstance(obj, obj) raises TypeError
-        # when obj is not instance then isinstance(obj, obj) return False
+    @classmethod
+    def _get_shared_key(cls, args: tuple, kwargs: Dict[str, object]) -> Optional[tuple]:
+        # key of configuration or None if checker can not be shared.
+        return None
+
+    @classmethod
+    def _get_shared(cls, *args, **kwargs) -> "_CheckBase":
+        """
+        Gets a checker that is shared by all callers with the same configuration.
+
+        Shared checkers can not be changed.
+
+        Returns:
+            _CheckBase: checker
+        """
         try:
-            if not isinstance(obj, obj):
-                return False
+            key = cls._get_shared_key(args, kwargs)
+            hash(key)
         except TypeError:
-            pass
+            # unhashable types or rules
+            key = None
+        if key is None:
+            return cls(*args, **kwargs)
+        with _shared_lock:
+            checker = _shared.get(key, None)
+        if checker is not None:
+            return checker
+        checker = cls(*args, **kwargs)
+        checker._freeze()
+        with _shared_lock:
+            return _shared.setdefault(key, checker)
+
+    def _freeze(self) -> None:
+        # shared checker must not keep references to values a caller can change.
+        self._frozen = True
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise AttributeError(
+                f"{self.__class__.__name__} is shared by decorators and can not be changed.")
+
+    def _is_instance(self, obj: object) -> bool:
+        return _is_instance(obj)
+
+    @staticmethod
+    def _validate_bulk(items: Iterable[Tuple[object, object]], is_valid: Callable[[object, object], bool], mask: bool, fail_fast: bool) -> BulkResult:
+        # values are validated without raising errors. Only a count and first failure are kept.
+        result_mask = bytearray() if mask else None
+        total = 0
+        failed = 0
+        first = None
+        for key, value in items:
+            total += 1
+            if is_valid(key, value):
+                if result_mask is not None:
+                    result_mask.append(1)
+                continue
+            if result_mask is not None:
+                result_mask.append(0)
+            if failed == 0:
+                first = key
+            failed += 1
+            if fail_fast:
+                break
+        return BulkResult(total, failed, first, result_mask)
+
+    @staticmethod
+    def _is_any_valid(key: object, value: object) -> bool:
         return True
 
     def _get_type(self, obj: object):
-        # when obj is instance then isinstance(obj, obj) raises TypeError
-        # when obj is not instance then isinstance(obj, obj) return False
-        try:
-            if not isinstance(obj, obj):
-                return obj
-        except TypeError:
-            pass
-        return type(obj)
+        return _get_type(obj)
+
+    # region Verdict cache
+    def _cache_init(self) -> None:
+        self._hits = 0
+        self._misses = 0
+
+    def _cache_add(self, cache: Dict[int, weakref.ref], key: type) -> None:
+        # first in first out. Bounds cache when classes are created dynamically.
+        if len(cache) >= self._CACHE_MAX_SIZE:
+            # cache is shared by threads, iteration fails when another thread changes it.
+            try:
+                del cache[next(iter(cache))]
+            except (StopIteration, RuntimeError, KeyError):
+                pass
+        # keyed on id() so lookup is a plain dict lookup. Cache only holds a weak reference to class,
+        # entry is removed when class is garbage collected and before its id can be reused.
+        cache_id = id(key)
+        cache[cache_id] = weakref.ref(key, lambda _, cache_id=cache_id: cache.pop(cache_id, None))
+
+    @staticmethod
+    def _is_stable_subclass(tp: type, types: Tuple[type]) -> bool:
+        # only True is cached. issubclass() of a class with a custom metaclass such as a runtime Protocol
+        # may depend on the instance. Subclasses registered on abc can only be added, never removed.
+        for t in types:
+            if (type(t) is type or type(t) is ABCMeta) and issubclass(tp, t):
+                return True
+        return False
+
+    def _get_cache_size(self) -> int:
+        return 0
+
+    def _get_types_str(self) -> str:
+        # types do not change after construction. formated once on first failure.
+        t_str = getattr(self, '_types_str', None)
+        if t_str is None:
+            t_str = Formatter.get_formated_types(types=self._types, conj='or')
+            self._types_str = t_str
+        return t_str
+
+    def _cache_reset(self) -> None:
+        pass
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Gets statistics of verdict cache.
+
+        Types of values that are valid are cached so that validating values of the same type
+        again is a single lookup. Values that are not valid are always fully checked.
+        Cache does not keep classes alive.
+
+        Note:
+            ``hits`` and ``misses`` are not synchronized. They are approximate when a checker,
+            such as a checker shared by decorators, is used by more than one thread.
+
+        Returns:
+            CacheInfo: named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+        """
+        return CacheInfo(self._hits, self._misses, self._CACHE_MAX_SIZE, self._get_cache_size())
+
+    def cache_clear(self) -> None:
+        """Clears verdict cache and its statistics."""
+        self._cache_reset()
+        self._cache_init()
+    # endregion Verdict cache
+
 
 class TypeChecker(_CheckBase):
     """Class that validates args match a given type"""
@@ -58,45 +239,56 @@ class TypeChecker(_CheckBase):
         self._raise_error: bool = bool(kwargs.get('raise_error', True))
         self._type_instance_check: bool = bool(
             kwargs.get('type_instance_check', True))
-    
+        # type(value) of valid values
+        self._cache: Dict[int, weakref.ref] = {}
+        self._cache_init()
+
+    @classmethod
+    def _get_shared_key(cls, args: tuple, kwargs: Dict[str, object]) -> Optional[tuple]:
+        types = tuple(dict.fromkeys(_get_type(arg) for arg in args))
+        return (cls, types, bool(kwargs.get('raise_error', True)),
+                bool(kwargs.get('type_instance_check', True)))
+
     def _is_valid_arg(self, arg: Union[str, None]) -> bool:
-        if arg is None:
+        if arg is None or type(arg) is _StarKey:
             return False
         return not Formatter.is_star_num(name=arg)
 
-    def _validate_type(self, value: object,  key: Union[str, None] = None):
-        if self._is_valid_arg(arg=key):
-            _key = key
-        else:
-            _key = None
-        def _is_type_instance(_types: Iterable[type], _value):
-            result = False
-            for t in _types:
-                if isinstance(_value, t):
-                    result = True
-                    break
-            return result
-        result = True
-        if not type(value) in self._types:
+    def _get_cache_size(self) -> int:
+        return len(self._cache)
+
+    def _cache_reset(self) -> None:
+        self._cache = {}
+
+    def _is_type_valid(self, key: object, value: object) -> bool:
+        tp = type(value)
+        if id(tp) in self._cache:
+            self._hits += 1
+            return True
+        self._misses += 1
+        if tp in self._types or (self._type_instance_check and self._is_stable_subclass(tp, self._types)):
+            self._cache_add(self._cache, tp)
+            return True
+        if self._type_instance_check is True:
             # object such as PosixPath inherit from more than on class (Path, PurePosixPath)
             # testing if PosixPath is type of Path is False.
             # for this reason will do an instace check as well. isinstance(_posx, Path) is True
-            is_valid_type = False
-            if self._type_instance_check == True and _is_type_instance(self._types, value):
-                is_valid_type = True
+            for t in self._types:
+                if isinstance(value, t):
+                    return True
+        return False
 
-            if is_valid_type is True:
-                result = True
+    def _validate_type(self, value: object,  key: Union[str, None] = None):
+        if self._is_type_valid(key, value):
+            return True
+        if self._raise_error is True:
+            t_str = self._get_types_str()
+            if self._is_valid_arg(arg=key):
+                msg = f"Arg '{key}' is expected to be of {t_str} but got '{type(value).__name__}'."
             else:
-                result = False
-                if self._raise_error is True:
-                    t_str = Formatter.get_formated_types(types=self._types, conj='or')
-                    if _key is None:
-                        msg = f"Arg Value is expected to be of {t_str} but got '{type(value).__name__}'."
-                    else:
-                        msg = f"Arg '{_key}' is expected to be of {t_str} but got '{type(value).__name__}'."
-                    raise TypeError(msg)
-        return result
+                msg = f"Arg Value is expected to be of {t_str} but got '{type(value).__name__}'."
+            raise TypeError(msg)
+        return False
 
     def validate(self, *args, **kwargs) -> bool:
         """
@@ -119,11 +311,61 @@ class TypeChecker(_CheckBase):
                 break
         if result is False:
             return result
-        for k, v in kwargs.items():
-            result = result & self._validate_type(value=v, key=k)
-            if result is False:
-                break
-        return result
+        return self._validate_items(kwargs.items())
+
+    def _validate_items(self, items: Iterable[Tuple[str, object]]) -> bool:
+        """
+        Validates key, value pairs such as items of a mapping of args.
+
+        Args:
+            items (Iterable[Tuple[str, object]]): key, value pairs.
+
+        Returns:
+            bool: ``True`` if all values match a type; Otherwise; ``False``.
+        """
+        if len(self._types) == 0:
+            return True
+        for k, v in items:
+            if self._validate_type(value=v, key=k) is False:
+                return False
+        return True
+
+    def validate_many(self, values: Iterable[object], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates many values against ``types`` that are passed into constructor.
+
+        Values are validated in a single loop and errors are not raised for values that are not valid,
+        even if ``raise_error`` is ``True``.
+
+        Args:
+            values (Iterable[object]): values to validate.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Returns:
+            BulkResult: result where ``first`` is index of first value that is not valid.
+        """
+        return self.validate_items(enumerate(values), mask=mask, fail_fast=fail_fast)
+
+    def validate_items(self, items: Iterable[Tuple[object, object]], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates values of key, value pairs against ``types`` that are passed into constructor.
+
+        Values are validated in a single loop and errors are not raised for values that are not valid,
+        even if ``raise_error`` is ``True``.
+
+        Args:
+            items (Iterable[Tuple[object, object]]): key, value pairs such as ``dict.items()``.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Returns:
+            BulkResult: result where ``first`` is key of first value that is not valid.
+        """
+        is_valid = self._is_type_valid if len(self._types) > 0 else self._is_any_valid
+        return self._validate_bulk(items, is_valid, mask, fail_fast)
 
     # region Properties
     @property
@@ -142,7 +384,9 @@ class TypeChecker(_CheckBase):
 
     @type_instance_check.setter
     def type_instance_check(self, value: bool) -> bool:
+        self._check_frozen()
         self._type_instance_check = bool(value)
+        self._cache_reset()
 
     @property
     def raise_error(self) -> bool:
@@ -158,6 +402,7 @@ class TypeChecker(_CheckBase):
 
     @raise_error.setter
     def raise_error(self, value: bool) -> bool:
+        self._check_frozen()
         self._raise_error = bool(value)
 
     @property
@@ -213,6 +458,28 @@ class RuleChecker(_CheckBase):
             self._raise_error: bool = bool(kwargs[key])
         else:
             self._raise_error: bool = True
+        # rules are resolved once. Built in rules validate without creating a rule instance.
+        self._checks_all = _get_rule_checks(self._rules_all)
+        self._checks_any = _get_rule_checks(self._rules_any)
+
+    @classmethod
+    def _get_shared_key(cls, args: tuple, kwargs: Dict[str, object]) -> Optional[tuple]:
+        if args:
+            return None
+        rules_all = kwargs.get('rules_all', None)
+        rules_any = kwargs.get('rules_any', None)
+        for rules in (rules_all, rules_any):
+            if rules is not None and not is_iterable(rules):
+                # constructor raises error
+                return None
+        return (cls, None if rules_all is None else tuple(rules_all),
+                None if rules_any is None else tuple(rules_any), bool(kwargs.get('raise_error', True)))
+
+    def _freeze(self) -> None:
+        super()._freeze()
+        # rules of a shared checker are the same as its checks even if a caller changes its list.
+        self._rules_all = tuple(rule for rule, _ in self._checks_all)
+        self._rules_any = tuple(rule for rule, _ in self._checks_any)
 
     # region internal validation methods
 
@@ -228,13 +495,11 @@ class RuleChecker(_CheckBase):
 
         result = True
         if self._len_all > 0:
-            for rule in self._rules_all:
-                if not isclass(rule) or not issubclass(rule, IRule):
+            for rule, check in self._checks_all:
+                if check is None:
                     raise TypeError('Rules must implement IRule')
-                rule_instance: IRule = rule(
-                    key=_key, name=_field, value=value, raise_errors=self._raise_error, originator=self)
                 try:
-                    result = result & rule_instance.validate()
+                    result = result & check(value, _key, _field, self, self._raise_error)
                 except Exception as e:
                     arg_name = _key if valid_arg else None
                     raise RuleError(
@@ -252,36 +517,44 @@ class RuleChecker(_CheckBase):
         else:
             _key = 'arg'
             _field = 'arg'
-        error_lst = []
-        result = True
-        failed_rules = []
-        if self._len_any > 0:
-            for rule in self._rules_any:
-                if not isclass(rule) or not issubclass(rule, IRule):
-                    raise TypeError('Rules must implement IRule')
-                rule_instance: IRule = rule(
-                    key=_key, name=_field, value=value, raise_errors=self._raise_error, originator=self)
-                rule_valid = False
-                try:
-                    rule_valid = rule_instance.validate()
-                except Exception as e:
-                    error_lst.append(e)
-                    failed_rules.append(rule)
-                    rule_valid = False
-                result = rule_valid
-                if rule_valid is True:
-                    break
-        if result is False and self._raise_error is True and len(error_lst) > 0:
-            # raise the last error in error list
-            arg_name = _key if valid_arg else None
-            raise RuleError(rules_any=self._rules_any,
-                            err_rule=failed_rules[0], arg_name=arg_name, errors=error_lst) from error_lst[0]
-
+        if self._len_any == 0:
+            return True
+        # rules do not raise errors unless no rule is a match.
+        result, failed = _validate_checks_any(
+            self._checks_any, value, _key, _field, self, self._raise_error)
+        if result is False and self._raise_error is True:
+            error_lst = [r.error for r in failed if r.error is not None]
+            if len(error_lst) > 0:
+                failed_rules = [r.rule for r in failed if r.error is not None]
+                arg_name = _key if valid_arg else None
+                raise RuleError(rules_any=self._rules_any,
+                                err_rule=failed_rules[0], arg_name=arg_name, errors=error_lst) from error_lst[0]
         return result
 
     def _is_valid_arg(self, arg: str) -> bool:
+        if type(arg) is _StarKey:
+            return False
         return not Formatter.is_star_num(name=arg)
 
+    def _is_rules_all_valid(self, key: object, value: object) -> bool:
+        # rules do not raise errors. index of value passed by validate_many_all() is not a key.
+        _key = key if type(key) is str else 'arg'
+        for rule, check in self._checks_all:
+            if check is None:
+                raise TypeError('Rules must implement IRule')
+            try:
+                if not check(value, _key, _key, self, False):
+                    return False
+            except Exception as e:
+                raise RuleError(
+                    err_rule=rule, rules_all=self._rules_all, arg_name=None, errors=e) from e
+        return True
+
+    def _is_rules_any_valid(self, key: object, value: object) -> bool:
+        _key = key if type(key) is str else 'arg'
+        result, _ = _validate_checks_any(self._checks_any, value, _key, _key, self, False)
+        return result
+
     # endregion internal validation methods
 
     def validate_all(self, *args, **kwargs) -> bool:
@@ -307,11 +580,7 @@ class RuleChecker(_CheckBase):
                 break
         if result is False:
             return result
-        for k, v in kwargs.items():
-            result = result & self._validate_rules_all(key=k, field=k, value=v)
-            if result is False:
-                break
-        return result
+        return self._validate_all_items(kwargs.items())
 
     def validate_any(self, *args, **kwargs) -> bool:
         """
@@ -336,11 +605,121 @@ class RuleChecker(_CheckBase):
                 break
         if result is False:
             return result
-        for k, v in kwargs.items():
-            result = result & self._validate_rules_any(key=k, field=k, value=v)
-            if result is False:
-                break
-        return result
+        return self._validate_any_items(kwargs.items())
+
+    def _validate_all_items(self, items: Iterable[Tuple[str, object]]) -> bool:
+        """
+        Validates key, value pairs against :py:attr:`~.RuleChecker.rules_all`.
+
+        Args:
+            items (Iterable[Tuple[str, object]]): key, value pairs such as items of a mapping of args.
+
+        Returns:
+            bool: ``True`` if all values are valid; Otherwise, ``False``
+        """
+        if self._len_all == 0:
+            return True
+        for k, v in items:
+            if self._validate_rules_all(key=k, field=k, value=v) is False:
+                return False
+        return True
+
+    def _validate_any_items(self, items: Iterable[Tuple[str, object]]) -> bool:
+        """
+        Validates key, value pairs against :py:attr:`~.RuleChecker.rules_any`.
+
+        Args:
+            items (Iterable[Tuple[str, object]]): key, value pairs such as items of a mapping of args.
+
+        Returns:
+            bool: ``True`` if all values are valid; Otherwise, ``False``
+        """
+        if self._len_any == 0:
+            return True
+        for k, v in items:
+            if self._validate_rules_any(key=k, field=k, value=v) is False:
+                return False
+        return True
+
+    def validate_many_all(self, values: Iterable[object], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates many values. Each value must match all :py:attr:`~.RuleChecker.rules_all`.
+
+        Values are validated in a single loop and rules do not raise errors for values
+        that are not valid, even if ``raise_error`` is ``True``.
+
+        Args:
+            values (Iterable[object]): values to validate.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Raises:
+            TypeError: If a rule does not implement ``IRule``.
+
+        Returns:
+            BulkResult: result where ``first`` is index of first value that is not valid.
+        """
+        return self.validate_items_all(enumerate(values), mask=mask, fail_fast=fail_fast)
+
+    def validate_many_any(self, values: Iterable[object], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates many values. Each value must match any one of :py:attr:`~.RuleChecker.rules_any`.
+
+        Values are validated in a single loop and rules do not raise errors for values
+        that are not valid, even if ``raise_error`` is ``True``.
+
+        Args:
+            values (Iterable[object]): values to validate.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Raises:
+            TypeError: If a rule does not implement ``IRule``.
+
+        Returns:
+            BulkResult: result where ``first`` is index of first value that is not valid.
+        """
+        return self.validate_items_any(enumerate(values), mask=mask, fail_fast=fail_fast)
+
+    def validate_items_all(self, items: Iterable[Tuple[object, object]], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates values of key, value pairs. Each value must match all :py:attr:`~.RuleChecker.rules_all`.
+
+        Args:
+            items (Iterable[Tuple[object, object]]): key, value pairs such as ``dict.items()``.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Raises:
+            TypeError: If a rule does not implement ``IRule``.
+
+        Returns:
+            BulkResult: result where ``first`` is key of first value that is not valid.
+        """
+        is_valid = self._is_rules_all_valid if self._len_all > 0 else self._is_any_valid
+        return self._validate_bulk(items, is_valid, mask, fail_fast)
+
+    def validate_items_any(self, items: Iterable[Tuple[object, object]], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates values of key, value pairs. Each value must match any one of :py:attr:`~.RuleChecker.rules_any`.
+
+        Args:
+            items (Iterable[Tuple[object, object]]): key, value pairs such as ``dict.items()``.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Raises:
+            TypeError: If a rule does not implement ``IRule``.
+
+        Returns:
+            BulkResult: result where ``first`` is key of first value that is not valid.
+        """
+        is_valid = self._is_rules_any_valid if self._len_any > 0 else self._is_any_valid
+        return self._validate_bulk(items, is_valid, mask, fail_fast)
 
     # region Properties
     @property
@@ -372,6 +751,7 @@ class RuleChecker(_CheckBase):
 
     @raise_error.setter
     def raise_error(self, value: bool) -> bool:
+        self._check_frozen()
         self._raise_error = bool(value)
     # endregion Properties
 
@@ -402,33 +782,63 @@ class SubClassChecker(_CheckBase):
         self._types: Tuple[type] = tuple(_types)
         self._raise_error: bool = bool(kwargs.get('raise_error', True))
         self._instance_only: bool = bool(kwargs.get('opt_inst_only', True))
+        # type(value) of valid values that are instances
+        self._inst_cache: Dict[int, weakref.ref] = {}
+        # valid values that are classes
+        self._cls_cache: Dict[int, weakref.ref] = {}
+        self._cache_init()
+
+    @classmethod
+    def _get_shared_key(cls, args: tuple, kwargs: Dict[str, object]) -> Optional[tuple]:
+        types = tuple(dict.fromkeys(_get_type(arg) for arg in args))
+        return (cls, types, bool(kwargs.get('raise_error', True)),
+                bool(kwargs.get('opt_inst_only', True)))
 
-    
     def _is_valid_arg(self, arg: Union[str, None]) -> bool:
-        if arg is None:
+        if arg is None or type(arg) is _StarKey:
             return False
         return not Formatter.is_star_num(name=arg)
 
+    def _get_cache_size(self) -> int:
+        return len(self._inst_cache) + len(self._cls_cache)
+
+    def _cache_reset(self) -> None:
+        self._inst_cache = {}
+        self._cls_cache = {}
+
+    def _is_subclass_valid(self, key: object, value: object) -> bool:
+        tp = type(value)
+        if id(tp) in self._inst_cache:
+            self._hits += 1
+            return True
+        is_cls = tp is type or tp is ABCMeta
+        if is_cls and id(value) in self._cls_cache:
+            self._hits += 1
+            return True
+        self._misses += 1
+        if is_cls:
+            if self._instance_only is False and self._is_stable_subclass(value, self._types):
+                self._cache_add(self._cls_cache, value)
+                return True
+        elif _is_plain_type(tp) and self._is_stable_subclass(tp, self._types):
+            self._cache_add(self._inst_cache, tp)
+            return True
+        if self._instance_only is True and not self._is_instance(value):
+            return False
+        t = self._get_type(value)
+        return isclass(t) and issubclass(t, self._types)
+
     def _validate_subclass(self, value: object,  key: Union[str, None] = None):
-        if self._is_valid_arg(arg=key):
-            _key = key
-        else:
-            _key = None
-        result = True
-        if self._instance_only is True:
-            result = self._is_instance(value)
-        if result is True:
-            t = self._get_type(value)
-            if not isclass(t) or not issubclass(t, self._types):
-                result = False
-        if result is False and self._raise_error is True:
-            t_str = Formatter.get_formated_types(types=self._types, conj='or')
-            if _key is None:
-                msg = f"Arg Value is expected to be of a subclass of {t_str}."
+        if self._is_subclass_valid(key, value):
+            return True
+        if self._raise_error is True:
+            t_str = self._get_types_str()
+            if self._is_valid_arg(arg=key):
+                msg = f"Arg '{key}' is expected to be of a subclass of {t_str}."
             else:
-                msg = f"Arg '{_key}' is expected to be of a subclass of {t_str}."
+                msg = f"Arg Value is expected to be of a subclass of {t_str}."
             raise TypeError(msg)
-        return result
+        return False
 
     def validate(self, *args, **kwargs) -> bool:
         """
@@ -457,6 +867,43 @@ class SubClassChecker(_CheckBase):
                 break
         return result
 
+    def validate_many(self, values: Iterable[object], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates many values against ``types`` that are passed into constructor.
+
+        Values are validated in a single loop and errors are not raised for values that are not valid,
+        even if ``raise_error`` is ``True``.
+
+        Args:
+            values (Iterable[object]): values to validate.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Returns:
+            BulkResult: result where ``first`` is index of first value that is not valid.
+        """
+        return self.validate_items(enumerate(values), mask=mask, fail_fast=fail_fast)
+
+    def validate_items(self, items: Iterable[Tuple[object, object]], mask: bool = False, fail_fast: bool = False) -> BulkResult:
+        """
+        Validates values of key, value pairs against ``types`` that are passed into constructor.
+
+        Values are validated in a single loop and errors are not raised for values that are not valid,
+        even if ``raise_error`` is ``True``.
+
+        Args:
+            items (Iterable[Tuple[object, object]]): key, value pairs such as ``dict.items()``.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first value that is not valid.
+                Default ``False``.
+
+        Returns:
+            BulkResult: result where ``first`` is key of first value that is not valid.
+        """
+        is_valid = self._is_subclass_valid if len(self._types) > 0 else self._is_any_valid
+        return self._validate_bulk(items, is_valid, mask, fail_fast)
+
     # region Properties
 
     @property
@@ -473,6 +920,7 @@ class SubClassChecker(_CheckBase):
 
     @raise_error.setter
     def raise_error(self, value: bool) -> bool:
+        self._check_frozen()
         self._raise_error = bool(value)
 
     @property
@@ -490,7 +938,9 @@ class SubClassChecker(_CheckBase):
 
     @instance_only.setter
     def instance_only(self, value: bool) -> bool:
+        self._check_frozen()
         self._instance_only = bool(value)
+        self._cache_reset()
 
     @property
     def types(self) -> Tuple[type]:
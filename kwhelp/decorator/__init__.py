@@ -1,12 +1,18 @@
 import functools
+import itertools
+import os
+import random
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from enum import Enum, IntEnum, IntFlag, auto
+import threading
+import weakref
 from collections import OrderedDict
-from inspect import signature, isclass, Parameter, Signature
+from collections.abc import Mapping, ItemsView
+from inspect import signature, isclass, unwrap, Parameter, Signature
 from logging import Logger, LoggerAdapter
 from ..checks import TypeChecker, RuleChecker, SubClassChecker
 from ..rules import IRule
-from ..helper import is_iterable, Formatter
+from ..helper import is_iterable, Formatter, _is_plain_type, _StarKey
 from ..exceptions import RuleError
 from ..helper import NO_THING
 # import wrapt
@@ -43,6 +49,320 @@ class DecArgEnum(IntFlag):
     """Process All Args"""
 
 
+# region Strip Mode
+STRIP_ENV_VAR = 'KWHELP_STRIP'
+"""Name of environment variable that sets strip mode. Eg: ``KWHELP_STRIP=1``"""
+
+
+def _get_env_strip_mode() -> bool:
+    value = os.environ.get(STRIP_ENV_VAR, None)
+    if value is None:
+        # python -O
+        return not __debug__
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+_strip_mode: bool = _get_env_strip_mode()
+
+
+def set_strip_mode(strip: bool) -> None:
+    """
+    Sets strip mode.
+
+    When strip mode is on, validation decorators such as ``TypeCheck``, ``RuleCheckAll``,
+    ``ReturnType`` and ``Validate`` do not wrap functions and there is no validation.
+    Decorated function is returned unchanged. When a decorator adds attributes such as
+    ``is_types_valid`` a plain wrapper is returned with attributes always ``True``.
+
+    Strip mode only applies to functions decorated after it is set. Call before importing
+    modules that have decorated functions.
+
+    Other decorators such as ``DefaultArgs``, ``calltracker`` and ``AutoFill`` are not
+    affected by strip mode.
+
+    Default strip mode is set by environment variable ``KWHELP_STRIP``. If environment variable
+    is not set then strip mode is on when python is run with ``-O`` option.
+
+    Args:
+        strip (bool): ``True`` to turn on strip mode; Otherwise, ``False``.
+    """
+    global _strip_mode
+    _strip_mode = bool(strip)
+
+
+def is_strip_mode() -> bool:
+    """
+    Gets if strip mode is on.
+
+    Returns:
+        bool: ``True`` if validation decorators are stripped; Otherwise, ``False``.
+    """
+    return _strip_mode
+
+
+class _AttribProbe(object):
+    """Records attributes set by ``_wrapper_setup()``"""
+
+
+def _get_strip_wrapper(func: callable, setup_fns: Iterable[callable]) -> callable:
+    """
+    Gets function to use in place of wrapper when in strip mode.
+
+    Args:
+        func (callable): function being decorated.
+        setup_fns (Iterable[callable]): ``_wrapper_setup`` of decorators.
+
+    Returns:
+        callable: ``func`` if no attributes are set by decorators; Otherwise,
+        a plain wrapper with attributes set.
+    """
+    probe = _AttribProbe()
+    for setup in setup_fns:
+        setup(wrapper=probe)
+    if not vars(probe):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    wrapper.__dict__.update(vars(probe))
+    return wrapper
+# endregion Strip Mode
+
+
+# region Sampling
+class SamplePolicy(object):
+    """
+    Policy that sets which calls of a decorated function are validated.
+
+    Calls that are not sampled call decorated function directly without binding
+    or validating args.
+
+    Example:
+        .. code-block:: python
+
+            from kwhelp.decorator import SamplePolicy, set_sample_policy
+
+            # validate 1 in 100 calls of all decorated functions
+            set_sample_policy(SamplePolicy(every=100))
+            # validate 5% of calls for functions in module my_pkg.speed
+            set_sample_policy(SamplePolicy(rate=0.05), "my_pkg.speed")
+            # validate all calls of speed_msg
+            set_sample_policy(SamplePolicy(every=1), speed_msg)
+    """
+
+    def __init__(self, every: Optional[int] = None, rate: Optional[float] = None):
+        """
+        Constructor
+
+        Args:
+            every (int, optional): Validate one in ``every`` calls, starting with first call.
+                ``1`` validates all calls.
+            rate (float, optional): Probability that a call is validated. From ``0.0`` to ``1.0``.
+
+        Raises:
+            ValueError: If neither or both of ``every`` and ``rate`` are set.
+            TypeError: If ``every`` is not an ``int`` or ``rate`` is not a ``float``.
+            ValueError: If ``every`` is less than ``1`` or ``rate`` is not between ``0.0`` and ``1.0``.
+        """
+        if (every is None) == (rate is None):
+            raise ValueError(
+                f"{self.__class__.__name__} requires exactly one of args 'every' or 'rate'.")
+        if every is not None:
+            if isinstance(every, bool) or not isinstance(every, int):
+                raise TypeError(f"{self.__class__.__name__} arg 'every' must be an int.")
+            if every < 1:
+                raise ValueError(f"{self.__class__.__name__} arg 'every' must be 1 or more.")
+        if rate is not None:
+            if isinstance(rate, bool) or not isinstance(rate, (int, float)):
+                raise TypeError(f"{self.__class__.__name__} arg 'rate' must be a float.")
+            rate = float(rate)
+            if rate < 0.0 or rate > 1.0:
+                raise ValueError(
+                    f"{self.__class__.__name__} arg 'rate' must be from 0.0 to 1.0.")
+        self._every = every
+        self._rate = rate
+
+    def _get_sampler(self) -> Optional[callable]:
+        """
+        Gets a new sampler for a decorated function.
+
+        Returns:
+            Optional[callable]: Function that returns ``True`` when a call is sampled
+            or ``None`` if all calls are sampled.
+        """
+        if self._every is not None:
+            if self._every == 1:
+                return None
+            counter = itertools.count()
+            every = self._every
+            return lambda: next(counter) % every == 0
+        rate = self._rate
+        if rate >= 1.0:
+            return None
+        rnd = random.random
+        return lambda: rnd() < rate
+
+    def __repr__(self) -> str:
+        if self._every is not None:
+            return f"{self.__class__.__name__}(every={self._every})"
+        return f"{self.__class__.__name__}(rate={self._rate})"
+
+    @property
+    def every(self) -> Optional[int]:
+        """Gets one in ``every`` calls that are validated."""
+        return self._every
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Gets probability that a call is validated."""
+        return self._rate
+
+
+class _SampleRegistry(object):
+    """Registry of sample policies. Version changes each time a policy is set."""
+
+    def __init__(self):
+        self._policies: Dict[Optional[str], SamplePolicy] = {}
+        self._lock = threading.Lock()
+        # True when any policy is set. Read by wrappers on each call.
+        self.active = False
+        self.version = 0
+
+    def set(self, key: Optional[str], policy: Optional[SamplePolicy]) -> None:
+        with self._lock:
+            if policy is None:
+                self._policies.pop(key, None)
+            else:
+                self._policies[key] = policy
+            self.version += 1
+            self.active = len(self._policies) > 0
+
+    def get(self, key: Optional[str]) -> Optional[SamplePolicy]:
+        return self._policies.get(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._policies.clear()
+            self.version += 1
+            self.active = False
+
+    def resolve(self, module: str, qualname: str) -> Optional[SamplePolicy]:
+        """Gets policy of function, else policy of module or a parent package, else global policy."""
+        policies = self._policies
+        policy = policies.get(f"{module}:{qualname}", None)
+        if policy is not None:
+            return policy
+        name = module
+        while name:
+            policy = policies.get(name, None)
+            if policy is not None:
+                return policy
+            name = name.rpartition('.')[0]
+        return policies.get(None, None)
+
+
+_sample_registry = _SampleRegistry()
+
+
+class _SampleSlot(object):
+    """Sample state of a decorated function. Policy is resolved again when registry changes."""
+    __slots__ = ('_module', '_qualname', '_version', '_sampler')
+
+    def __init__(self, func: Optional[callable] = None):
+        """
+        Constructor
+
+        Args:
+            func (callable, optional): Decorated function. If omitted calls are never skipped.
+        """
+        if func is None:
+            self._module = None
+            self._qualname = None
+        else:
+            self._module = str(getattr(func, '__module__', None) or '')
+            self._qualname = str(getattr(func, '__qualname__', None) or getattr(func, '__name__', ''))
+        self._version = -1
+        self._sampler = None
+
+    def is_skipped(self) -> bool:
+        """Gets if checks of current call are skipped"""
+        if self._version != _sample_registry.version:
+            self._update()
+        sampler = self._sampler
+        return sampler is not None and not sampler()
+
+    def _update(self) -> None:
+        version = _sample_registry.version
+        policy = None
+        if self._qualname is not None:
+            policy = _sample_registry.resolve(module=self._module, qualname=self._qualname)
+        self._sampler = None if policy is None else policy._get_sampler()
+        self._version = version
+
+
+def _get_sample_key(target: Union[None, str, callable]) -> Optional[str]:
+    if target is None:
+        return None
+    if isinstance(target, str):
+        if len(target.strip()) == 0:
+            raise ValueError("Sample policy target must not be an empty str.")
+        return target.strip()
+    if callable(target) and hasattr(target, '__qualname__'):
+        return f"{getattr(target, '__module__', None) or ''}:{target.__qualname__}"
+    raise TypeError(
+        f"Sample policy target must be None, a module name or a function. Got '{type(target).__name__}'.")
+
+
+def set_sample_policy(policy: Optional[SamplePolicy], target: Union[None, str, callable] = None) -> None:
+    """
+    Sets policy that sets which calls of validation decorators are checked.
+
+    Policy can be set or changed at any time and applies to functions that are already decorated.
+    Policy of a function is used first, then policy of its module or closest parent package and
+    then global policy. When there is no policy all calls are validated.
+
+    Sampling is per decorator. When decorators are stacked each decorator samples calls on its own.
+    Use :py:class:`~.decorator.Validate` to sample all checks of a call together.
+
+    Attributes such as ``is_types_valid`` keep the value of last sampled call.
+
+    Args:
+        policy (SamplePolicy, None): Policy to set. ``None`` removes policy of ``target``.
+        target (None, str, callable, optional): ``None`` for global policy. Module or package name
+            such as ``my_pkg.speed`` or function name such as ``my_pkg.speed:Speed.get_msg``.
+            Decorated function can also be passed. Default ``None``.
+
+    Raises:
+        TypeError: If ``policy`` is not a ``SamplePolicy`` or ``None``.
+        TypeError: If ``target`` is not ``None``, ``str`` or a function.
+    """
+    if not policy is None and not isinstance(policy, SamplePolicy):
+        raise TypeError(
+            f"Sample policy must be a 'SamplePolicy' or None. Got '{type(policy).__name__}'.")
+    _sample_registry.set(key=_get_sample_key(target), policy=policy)
+
+
+def get_sample_policy(target: Union[None, str, callable] = None) -> Optional[SamplePolicy]:
+    """
+    Gets policy that is set for ``target``.
+
+    Args:
+        target (None, str, callable, optional): ``None`` for global policy,
+            module name, function name or function. Default ``None``.
+
+    Returns:
+        Optional[SamplePolicy]: Policy set for ``target`` if any; Otherwise, ``None``.
+    """
+    return _sample_registry.get(_get_sample_key(target))
+
+
+def clear_sample_policies() -> None:
+    """Removes all sample policies. All calls of validation decorators are validated."""
+    _sample_registry.clear()
+# endregion Sampling
+
+
 class _FuncInfo(object):
     # foo(*args)
     #   assert info.index_args == 0
@@ -101,8 +421,10 @@ class _FuncInfo(object):
         self._name = func.__name__
         self.ftype = ftype
         self._defaults = {}
-
+        # defaults objects of function that info is registered for, see _get_func_info()
+        self._src: Optional[tuple] = None
         self._set_info()
+        self._bind_plan = _ArgBindPlan(self)
 
     def _drop_arg_first(self) -> bool:
         return self.ftype.value > DecFuncEnum.METHOD_STATIC.value
@@ -252,104 +574,356 @@ class _FuncInfo(object):
     def name(self) -> str:
         """Gets the name of the function"""
         return self._name
+
+    @property
+    def bind_plan(self) -> "_ArgBindPlan":
+        """Gets the precompiled plan used to bind args of function calls"""
+        return self._bind_plan
     # endregion Property
 
 
-class _FnInstInfo(object):
-    # region init
-    def __init__(self, fninfo: _FuncInfo, fn_args: tuple, fn_kwargs: "OrderedDict[str, Any]"):
+# region Function Info Registry
+# _FuncInfo of a function is shared by all decorators of function. Entries are removed
+# when no decorator holds the _FuncInfo.
+_fn_info_registry: "weakref.WeakValueDictionary[tuple, _FuncInfo]" = weakref.WeakValueDictionary()
+_fn_info_lock = threading.Lock()
+
+
+def _get_func_info(func: callable, ftype: DecFuncEnum) -> _FuncInfo:
+    """
+    Gets function info of ``func`` from registry or creates it.
+
+    Function info is keyed by ``__code__`` of the function that ``func`` wraps and ``ftype``.
+    Stacked decorators and functions that share a code object share the same function info
+    when the defaults and name are the same.
+
+    Args:
+        func (callable): Function that is being wrapped.
+        ftype (DecFuncEnum): Type of function.
+
+    Returns:
+        _FuncInfo: Function Info
+    """
+    # same function that inspect.signature() reads
+    fn = unwrap(func, stop=(lambda f: hasattr(f, "__signature__")))
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return _FuncInfo(func=func, ftype=ftype)
+    key = (code, ftype, func.__name__)
+    src = (getattr(fn, "__defaults__", None), getattr(fn, "__kwdefaults__", None))
+    with _fn_info_lock:
+        info = _fn_info_registry.get(key, None)
+        if info is not None and info._src[0] is src[0] and info._src[1] is src[1]:
+            return info
+    info = _FuncInfo(func=func, ftype=ftype)
+    info._src = src
+    with _fn_info_lock:
+        if not key in _fn_info_registry:
+            _fn_info_registry[key] = info
+    return info
+
+# endregion Function Info Registry
+
+
+class _ArgBindPlan(object):
+    """
+    Binding plan for the arguments of a function.
+
+    The plan is compiled once from :py:class:`_FuncInfo` and holds the name to position
+    mapping, defaults, ``*args`` offset and drop first option so that binding the
+    ``args`` and ``kwargs`` of a call is done in a single flat pass.
+    """
+
+    def __init__(self, fninfo: "_FuncInfo"):
         """
-        [summary]
+        Constructor
 
         Args:
-            fninfo (_FuncInfo): [description]
-            fn_args (tuple): [description]
-            fn_kwargs (Dict[str, Any]): [description]
+            fninfo (_FuncInfo): Function info to compile plan from.
+        """
+        self.name = fninfo.name
+        # when drop first the first arg such as self or cls is skipped
+        self.offset = 1 if fninfo.is_drop_first else 0
+        # names that can be assigned by postion, in signature order.
+        self.pos_names: Tuple[str] = tuple(
+            fninfo.lst_pos_only) + tuple(fninfo.lst_pos_or_kw)
+        self.len_pos = len(self.pos_names)
+        # all named args in signature order.
+        self.names: Tuple[str] = self.pos_names + tuple(fninfo.lst_kw_only)
+        self.names_set = frozenset(self.names)
+        self.defaults: Dict[str, Any] = fninfo.defauts
+        self.is_args = fninfo.is_args
+        # names of args that are before *args. Used to preserve order of all args.
+        if self.is_args:
+            self.pre_star_names: Tuple[str] = self.pos_names
+        else:
+            self.pre_star_names: Tuple[str] = tuple()
+        # offset into args where *args values start
+        self.args_start = self.offset + self.len_pos
+
+    def bind(self, args: tuple, kwargs: Dict[str, Any]) -> Tuple["OrderedDict[str, Any]", list, "OrderedDict[str, Any]", Optional[List[str]]]:
         """
-        self._fn_info = fninfo
-        self._fn_name = self._fn_info.name
-        self._kw = OrderedDict()
-        self._real_kw = OrderedDict()
-        self._real_args = []
-        self._cache = {}
-        self._process_kwargs(args=fn_args, kwargs=fn_kwargs)
-        self._process_args(args=fn_args)
+        Binds ``args`` and ``kwargs`` of a function call.
 
-    def _process_kwargs(self, args: tuple, kwargs: Dict[str, Any]):
-        if self._fn_info.is_args_only:
-            return
-        if self._fn_info.is_drop_first:
-            tmp_args = [*args[1:]]
+        Args:
+            args (tuple): args of call
+            kwargs (Dict[str, Any]): kwargs of call
+
+        Returns:
+            Tuple[OrderedDict[str, Any], list, OrderedDict[str, Any], Optional[List[str]]]:
+            Named args, ``*args`` values, ``**kwargs`` values and names of missing args
+            or ``None`` if no args are missing.
+        """
+        names = self.names
+        defaults = self.defaults
+        offset = self.offset
+        kw = OrderedDict()
+        num_pos = len(args) - offset
+        if num_pos > self.len_pos:
+            num_pos = self.len_pos
+        i = 0
+        while i < num_pos:
+            kw[names[i]] = args[offset + i]
+            i += 1
+        missing = None
+        len_names = len(names)
+        while i < len_names:
+            name = names[i]
+            if name in kwargs:
+                kw[name] = kwargs[name]
+            elif name in defaults:
+                kw[name] = defaults[name]
+            else:
+                if missing is None:
+                    missing = []
+                missing.append(name)
+            i += 1
+        real_kw = OrderedDict()
+        if kwargs:
+            if len_names == 0:
+                real_kw.update(kwargs)
+            else:
+                names_set = self.names_set
+                for k, v in kwargs.items():
+                    if not k in names_set:
+                        real_kw[k] = v
+        if self.is_args:
+            real_args = list(args[self.args_start:])
         else:
-            tmp_args = [*args]
+            real_args = []
+        return kw, real_args, real_kw, missing
 
-        def process_kw(keys: Iterable[str]):
-            missing_args = []
-            ignore_keys = set()
-            for key in keys:
-                if key in self._kw and not key in kwargs:
-                    continue
-                try:
-                    self._kw[key] = kwargs[key]
-                except KeyError:
-                    pass
-                    # will be a default
-                    if key in self._fn_info.defauts:
-                        self._kw[key] = self._fn_info.defauts[key]
-                    else:
-                        missing_args.append(key)
-                ignore_keys.add(key)
-            if len(missing_args) > 0:
-                self._missing_args_error(missing_names=missing_args)
-            for k, v in kwargs.items():
-                if not k in ignore_keys:
-                    self._real_kw[k] = v
-            return
 
-        if self._fn_info.is_kwargs_only is True:
-            self._real_kw.update(**kwargs)
-            return
-        if self._fn_info.is_named_args_only is True:
-            if len(tmp_args) > 0:
-                self._kw.update(zip(self._fn_info.lst_pos_or_kw, tmp_args))
-            process_kw(keys=self._fn_info.lst_pos_or_kw)
-            return
-        # at this point the are kwargs but not all are assigned to real key names.
-        # is it posible at this point that some of the values are contained within args.
-        if self._fn_info.is_args is False:
-            if len(tmp_args) > 0:
-                self._kw.update(zip(self._fn_info.lst_pos_or_kw, tmp_args))
-            keys = self._fn_info.lst_pos_or_kw
-            process_kw(keys=keys)
-            return
-        # at this point there are definatly args
-        # check to see if there are any pre *args names.
-        if self._fn_info.index_args > 0:
-            if len(tmp_args) > 0 and self._fn_info.len_pos_or_kw > 0:
-                self._kw.update(zip(self._fn_info.lst_pos_or_kw, tmp_args))
-            process_kw(keys=self._fn_info.lst_kw_only)
-            return
-        # at this point there are *args but they do not contain any keyword arg values.
-        process_kw(keys=self._fn_info.all_keys)
+class _ArgSelectPlan(object):
+    """
+    Plan that gets the values of only the args that a decorator checks.
 
-    def _process_args(self, args: tuple):
-        if self._fn_info.is_args is False:
-            return
-        if self._fn_info.is_drop_first:
-            tmp_args = [*args[1:]]
+    The plan is compiled once from :py:class:`_ArgBindPlan` for the keys of a decorator.
+    Values are read from positional ``args``, ``kwargs`` or defaults of a call without
+    binding all args of the function.
+    """
+
+    def __init__(self, bind_plan: _ArgBindPlan, keys: Iterable[str]):
+        """
+        Constructor
+
+        Args:
+            bind_plan (_ArgBindPlan): Binding plan of function.
+            keys (Iterable[str]): Names of args to get.
+        """
+        offset = bind_plan.offset
+        no_pos = -1
+        # key, position in args or -1 for keyword only and default
+        named: List[Tuple[str, int, Any]] = []
+        dynamic: List[str] = []
+        for key in keys:
+            if key in bind_plan.names_set:
+                i = bind_plan.names.index(key)
+                pos = offset + i if i < bind_plan.len_pos else no_pos
+                named.append((key, pos, bind_plan.defaults.get(key, None)))
+            else:
+                dynamic.append(key)
+        self.named: Tuple[Tuple[str, int, Any]] = tuple(named)
+        # keys that are named args of function are always present on a valid call.
+        self.static_keys: Tuple[str] = tuple(key for key, _, _ in named)
+        # keys that can only be passed in as **kwargs
+        self.dynamic_keys: Tuple[str] = tuple(dynamic)
+        self._req_pos: Tuple[Tuple[int, str]] = tuple(
+            (offset + i, name) for i, name in enumerate(bind_plan.pos_names)
+            if not name in bind_plan.defaults)
+        self._req_kw: Tuple[str] = tuple(
+            name for name in bind_plan.names[bind_plan.len_pos:] if not name in bind_plan.defaults)
+
+    def is_bound(self, args: tuple, kwargs: Dict[str, Any]) -> bool:
+        """
+        Gets if all args of function without defaults are in ``args`` or ``kwargs``.
+
+        Args:
+            args (tuple): args of call
+            kwargs (Dict[str, Any]): kwargs of call
+
+        Returns:
+            bool: ``True`` if no args are missing; Otherwise, ``False``.
+        """
+        len_args = len(args)
+        for pos, name in self._req_pos:
+            if pos >= len_args and not name in kwargs:
+                return False
+        for name in self._req_kw:
+            if not name in kwargs:
+                return False
+        return True
+
+    def select(self, args: tuple, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Gets values of plan keys.
+
+        Args:
+            args (tuple): args of call
+            kwargs (Dict[str, Any]): kwargs of call
+
+        Returns:
+            Optional[Dict[str, Any]]: Key, values of plan keys that are present in call or
+            ``None`` if any args of function are missing.
+        """
+        if not self.is_bound(args, kwargs):
+            return None
+        result = {}
+        len_args = len(args)
+        for key, pos, default in self.named:
+            if 0 <= pos < len_args:
+                result[key] = args[pos]
+            elif key in kwargs:
+                result[key] = kwargs[key]
+            else:
+                result[key] = default
+        for key in self.dynamic_keys:
+            if key in kwargs:
+                result[key] = kwargs[key]
+        return result
+
+
+class _ArgsView(Mapping):
+    """
+    Read-only ordered view over the bound args of a single call.
+
+    No dictionary is copied, values are read from bound args when view is accessed.
+    Keys are in order of named args before ``*args``, ``*args``, remaining named args
+    and ``**kwargs``. When ``kwargs_first`` is ``True`` then ``**kwargs`` are before
+    remaining named args. All ``*args`` keys are in the format of ``*#``.
+    """
+    __slots__ = ('_kw', '_split', '_args', '_offset', '_kwargs', '_kwargs_first')
+
+    def __init__(self, kw: Optional[Dict[str, Any]] = None, split: int = 0, args: Iterable[object] = (),
+                 offset: int = 0, kwargs: Optional[Dict[str, Any]] = None, kwargs_first: bool = False):
+        """
+        Constructor
+
+        Args:
+            kw (Dict[str, Any], optional): Named args. Default ``None``.
+            split (int, optional): Number of named args that are before ``*args``. Default ``0``.
+            args (Iterable[object], optional): ``*args`` values. Default ``()``.
+            offset (int, optional): Position of first ``*args`` key. Default ``0``.
+            kwargs (Dict[str, Any], optional): ``**kwargs`` values. Default ``None``.
+            kwargs_first (bool, optional): ``**kwargs`` are before remaining named args.
+                Default ``False``.
+        """
+        self._kw = kw or {}
+        self._split = split
+        self._args = args
+        self._offset = offset
+        self._kwargs = kwargs or {}
+        self._kwargs_first = kwargs_first
+
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterates key, value pairs in order without looking up each key"""
+        kw = self._kw
+        split = self._split if self._args else 0
+        if split:
+            it = iter(kw.items())
+            for item in itertools.islice(it, split):
+                yield item
         else:
-            tmp_args = [*args]
-        if self._fn_info.is_args_only:
-            self._real_args = tmp_args
-            return
-        if self._fn_info.index_args > 0:
-            # lst_pos_or_kw contains pre *arg keys
-            # if there are key, values after *args then they will be in lst_kw_only
-            tmp_args = tmp_args[self._fn_info.index_args:]
-            self._real_args = tmp_args
-            return
-        self._real_args = tmp_args
-        return
+            it = kw.items()
+        offset = self._offset
+        for i, arg in enumerate(self._args):
+            yield Formatter.get_star_num(i + offset), arg
+        if self._kwargs_first:
+            yield from self._kwargs.items()
+            yield from it
+        else:
+            yield from it
+            yield from self._kwargs.items()
+
+    def __getitem__(self, key: str) -> Any:
+        if self._args and isinstance(key, str) and key[:1] == "*":
+            index = None
+            if type(key) is _StarKey:
+                index = key.index
+            elif Formatter.is_star_num(name=key):
+                index = int(key[1:])
+            if index is not None:
+                index -= self._offset
+                if 0 <= index < len(self._args):
+                    return self._args[index]
+        if key in self._kw:
+            return self._kw[key]
+        return self._kwargs[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._kw or key in self._kwargs:
+            return True
+        if self._args and isinstance(key, str) and key[:1] == "*":
+            try:
+                self[key]
+            except KeyError:
+                return False
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._iter_items():
+            yield key
+
+    def items(self) -> ItemsView:
+        return _ArgsItemsView(self)
+
+    def __len__(self) -> int:
+        return len(self._kw) + len(self._args) + len(self._kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._iter_items())!r})"
+
+
+class _ArgsItemsView(ItemsView):
+    """Items of :py:class:`_ArgsView` that are iterated without looking up each key"""
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._mapping._iter_items()
+
+
+class _FnInstInfo(object):
+    # region init
+    def __init__(self, fninfo: _FuncInfo, fn_args: tuple, fn_kwargs: "OrderedDict[str, Any]"):
+        """
+        Constructor
+
+        Args:
+            fninfo (_FuncInfo): Function info of function that is being called.
+            fn_args (tuple): args of the call.
+            fn_kwargs (Dict[str, Any]): kwargs of the call.
+
+        Raises:
+            TypeError: If any args without defaults are missing.
+        """
+        self._fn_info = fninfo
+        self._fn_name = self._fn_info.name
+        self._cache = {}
+        self._kw, self._real_args, self._real_kw, missing = fninfo.bind_plan.bind(
+            fn_args, fn_kwargs)
+        if missing:
+            self._missing_args_error(missing_names=missing)
     # endregion init
 
     # region Private Methods
@@ -358,10 +932,7 @@ class _FnInstInfo(object):
         key = 'all_kw'
         if key in self._cache:
             return self._cache[key]
-
-        kw = OrderedDict(**self.key_word_args)
-        kw.update(self.kwargs)
-        self._cache[key] = kw
+        self._cache[key] = OrderedDict(self.get_view_noargs()._iter_items())
         return self._cache[key]
 
     def _missing_args_error(self, missing_names: List[str]):
@@ -372,6 +943,50 @@ class _FnInstInfo(object):
 
     # endregion Private Methods
 
+    # region Views
+    def get_view_all(self) -> _ArgsView:
+        """
+        Gets a read-only view of all keyword, kwarg and args.
+
+        Same keys and order as :py:meth:`~._FnInstInfo.get_all_args` without creating a dictionary.
+
+        Returns:
+            _ArgsView: view of all args.
+        """
+        plan = self._fn_info.bind_plan
+        return _ArgsView(kw=self._kw, split=plan.len_pos, args=self._real_args,
+                         offset=plan.len_pos, kwargs=self._real_kw)
+
+    def get_view_noargs(self) -> _ArgsView:
+        """
+        Gets a read-only view of all keyword args that has all plain args omitted.
+
+        Returns:
+            _ArgsView: view of keyword args and kwargs.
+        """
+        return _ArgsView(kw=self._kw, kwargs=self._real_kw)
+
+    def get_view_filter(self, args: bool = False, kwargs: bool = False, named: bool = False) -> _ArgsView:
+        """
+        Gets a read-only view of args in order of args, kwargs and named args.
+
+        Args:
+            args (bool, optional): Include ``*args``. Default ``False``.
+            kwargs (bool, optional): Include ``**kwargs``. Default ``False``.
+            named (bool, optional): Include named args. Default ``False``.
+
+        Returns:
+            _ArgsView: view of filtered args.
+        """
+        info = self._fn_info
+        return _ArgsView(
+            kw=self._kw if named else None,
+            args=self._real_args if args and info.is_args else (),
+            offset=info.index_args,
+            kwargs=self._real_kw if kwargs and info.is_kwargs else None,
+            kwargs_first=True)
+    # endregion Views
+
     # region Public Methods
 
     def get_filter_arg(self) -> "OrderedDict[str, Any]":
@@ -386,13 +1001,7 @@ class _FnInstInfo(object):
         cache_key = 'filter_arg'
         if cache_key in self._cache:
             return self._cache[cache_key]
-        result = OrderedDict()
-        if self.info.is_args is False:
-            return result
-        offset = self.info.index_args
-        for i, arg in enumerate(self.args):
-            key = '*' + str(i + offset)
-            result[key] = arg
+        result = OrderedDict(self.get_view_filter(args=True)._iter_items())
         self._cache[cache_key] = result
         return self._cache[cache_key]
 
@@ -441,32 +1050,9 @@ class _FnInstInfo(object):
         key = 'filtered_all_args'
         if key in self._cache:
             return self._cache[key]
-
-        def get_pre_star_keys() -> Tuple[str]:
-            pre_keys = tuple()
-            if self.info.index_args > 0:
-                # there are keys before *args
-                # when there are pre keys they are held in lst_pos_or_kw
-                pre_keys = tuple(self.info.lst_pos_or_kw)
-            return pre_keys
-        result = OrderedDict()
-        # pre list is needed to preserve order of keys
-        pre = get_pre_star_keys()
-        i = 0
-        for key in pre:
-            result[key] = self.key_word_args[key]
-            i += 1
-        for arg in self.args:
-            key = '*' + str(i)
-            result[key] = arg
-            i += 1
-        for key, value in self.key_word_args.items():
-            if not key in pre:
-                result[key] = value
-
-        result.update(self.kwargs)
+        result = OrderedDict(self.get_view_all()._iter_items())
         self._cache[key] = result
-        return self._cache[key]
+        return result
     # endregion Public Methods
 
     # region Properties
@@ -492,6 +1078,359 @@ class _FnInstInfo(object):
     # endregion Properties
 
 
+_args_filters: Dict[DecArgEnum, callable] = {}
+
+
+def _get_args_filter(opt_filter: DecArgEnum) -> callable:
+    """
+    Gets a function that returns a view of filtered args of a call.
+
+    Filter is resolved once for each ``opt_filter`` and not on each call.
+
+    Args:
+        opt_filter (DecArgEnum): Filter option
+
+    Returns:
+        callable: function that takes a :py:class:`_FnInstInfo` and returns a view of args.
+    """
+    result = _args_filters.get(opt_filter, None)
+    if result is not None:
+        return result
+    if opt_filter & DecArgEnum.All_ARGS == DecArgEnum.All_ARGS:
+        result = _FnInstInfo.get_view_all
+    elif opt_filter & DecArgEnum.NO_ARGS == DecArgEnum.NO_ARGS:
+        result = _FnInstInfo.get_view_noargs
+    else:
+        result = functools.partial(_FnInstInfo.get_view_filter,
+                                   args=DecArgEnum.ARGS in opt_filter,
+                                   kwargs=DecArgEnum.KWARGS in opt_filter,
+                                   named=DecArgEnum.NAMED_ARGS in opt_filter)
+    _args_filters[opt_filter] = result
+    return result
+
+
+class _CallContext(object):
+    """
+    State of a single call of a decorated function.
+
+    A new instance is created for each call so decorators do not keep call state on
+    decorator instance. This allows recursive calls and calls from many threads.
+    """
+    __slots__ = ('args', 'kwargs', 'cache')
+
+    def __init__(self, args: Iterable[object] = (), kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Constructor
+
+        Args:
+            args (Iterable[object], optional): Wrapped function ``args``. Default ``()``.
+            kwargs (Dict[str, Any], optional): Wrapped function ``kwargs``. Default ``None``.
+        """
+        # tuple() of a tuple is the same tuple, no copy is made for wrapped function args.
+        self.args = tuple(args)
+        if kwargs is None:
+            kwargs = OrderedDict()
+        elif not isinstance(kwargs, dict):
+            kwargs = OrderedDict(kwargs)
+        # wrapped function kwargs are a new dict for each call, no need to copy.
+        self.kwargs: Dict[str, Any] = kwargs
+        self.cache: Dict[str, object] = {}
+
+
+class _WrapperCodeGen(object):
+    """
+    Generates source code of a wrapper that validates args of a function.
+
+    Generated check function has the same signature as wrapped function so args are bound by python
+    and tested without building any dictionaries. Check only test if args are valid. If args are not
+    valid or can not be bound then generated wrapper calls ``fallback`` wrapper that validates
+    as usual and raises errors.
+    """
+    _PREFIX = '__kw_'
+
+    def __init__(self, fninfo: _FuncInfo):
+        """
+        Constructor
+
+        Args:
+            fninfo (_FuncInfo): Function info of function being wrapped.
+        """
+        self._info = fninfo
+        self._all_params: List[Parameter] = list(fninfo.signature.parameters.values())
+        params = self._all_params[:]
+        self.first: Optional[Parameter] = None
+        if fninfo.is_drop_first and len(params) > 0:
+            self.first = params.pop(0)
+        self.pos: List[Parameter] = [p for p in params if p.kind in (
+            Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)]
+        self.kw_only: List[Parameter] = [p for p in params if p.kind == Parameter.KEYWORD_ONLY]
+        self.star: Optional[Parameter] = None
+        self.star_kw: Optional[Parameter] = None
+        for p in params:
+            if p.kind == Parameter.VAR_POSITIONAL:
+                self.star = p
+            elif p.kind == Parameter.VAR_KEYWORD:
+                self.star_kw = p
+        self._ns = {
+            '__kw_type': type,
+            '__kw_isinstance': isinstance,
+            '__kw_len': len,
+            '__kw_ns': object()
+        }
+        self._lines: List[str] = []
+        self._count = 0
+        self._type_names: Dict[Tuple[type], str] = {}
+
+    # region Static Methods
+    @staticmethod
+    def _get_subclass_verdict(cache: Dict[type, bool], types: Tuple[type]) -> callable:
+        def verdict(tp: type) -> bool:
+            result = _is_plain_type(tp) and issubclass(tp, types)
+            # only True is cached. False may change when a class is registered on abc.
+            if result and len(cache) < 256:
+                cache[tp] = True
+            return result
+        return verdict
+    # endregion Static Methods
+
+    def is_supported(self) -> bool:
+        """Gets if a wrapper can be generated for function"""
+        if self._info.is_drop_first:
+            if self.first is None or not self.first.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                return False
+        for p in self._all_params:
+            if p.name.startswith(self._PREFIX):
+                return False
+        return True
+
+    def add_global(self, value: object) -> str:
+        """
+        Adds a value to namespace of generated code.
+
+        Args:
+            value (object): value to add
+
+        Returns:
+            str: Name of value in generated code.
+        """
+        name = self._PREFIX + 'g' + str(self._count)
+        self._count += 1
+        self._ns[name] = value
+        return name
+
+    def add_line(self, line: str, indent: int = 1) -> None:
+        """Adds a line to body of check function"""
+        self._lines.append('    ' * indent + line)
+
+    def get_type_cond(self, var: str, types: Tuple[type], instance_check: bool) -> str:
+        """
+        Gets a condition that is ``True`` when ``var`` is valid for ``TypeChecker``.
+
+        Args:
+            var (str): Variable name in generated code.
+            types (Tuple[type]): Types of ``TypeChecker``
+            instance_check (bool): ``type_instance_check`` of ``TypeChecker``
+
+        Returns:
+            str: condition
+        """
+        if len(types) == 0:
+            return 'True'
+        key = tuple(types)
+        t = self._type_names.get(key, None)
+        if t is None:
+            t = self.add_global(key[0] if len(key) == 1 else key)
+            self._type_names[key] = t
+        if len(types) == 1:
+            result = f"__kw_type({var}) is {t}"
+        else:
+            result = f"__kw_type({var}) in {t}"
+        if instance_check:
+            result = result + f" or __kw_isinstance({var}, {t})"
+        return result
+
+    def get_subclass_cond(self, var: str, types: Tuple[type]) -> str:
+        """
+        Gets a condition that is ``True`` when ``var`` is a valid instance for ``SubClassChecker``.
+
+        Args:
+            var (str): Variable name in generated code.
+            types (Tuple[type]): Types of ``SubClassChecker``
+
+        Returns:
+            str: condition
+        """
+        if len(types) == 0:
+            return 'True'
+        cache = {}
+        c = self.add_global(cache)
+        v = self.add_global(self._get_subclass_verdict(cache=cache, types=tuple(types)))
+        return f"{c}.get(__kw_type({var})) or {v}(__kw_type({var}))"
+
+    def add_named_check(self, param: Parameter, cond: str, default_valid: bool = True) -> None:
+        """
+        Adds check of a named arg.
+
+        Args:
+            param (Parameter): named parameter of function.
+            cond (str): condition from ``get_type_cond()`` or ``get_subclass_cond()``.
+            default_valid (bool, optional): If default value of param is valid. Default ``True``.
+        """
+        name = param.name
+        if param.default is Parameter.empty:
+            self.add_line(f"if not ({cond}):")
+        elif default_valid:
+            self.add_line(f"if {name} is not __kw_ns and not ({cond}):")
+        else:
+            self.add_line(f"if {name} is __kw_ns or not ({cond}):")
+        self.add_line("return False", 2)
+
+    def add_loop_check(self, iterable: str, cond: str) -> None:
+        """
+        Adds check of all values of a iterable.
+
+        Args:
+            iterable (str): iterable in generated code such as ``args`` or ``kwargs.values()``.
+            cond (str): condition for variable ``__kw_v``.
+        """
+        self.add_line(f"for __kw_v in {iterable}:")
+        self.add_line(f"if not ({cond}):", 2)
+        self.add_line("return False", 3)
+
+    def add_position_checks(self, type_count: int, all_args: bool, get_cond: callable, is_default_valid: callable) -> bool:
+        """
+        Adds checks of args where each arg position has its own types such as ``AcceptedTypes``.
+
+        Only calls that have no ``**kwargs`` values are checked, other calls are passed to fallback.
+
+        Args:
+            type_count (int): Number of type positions.
+            all_args (bool): If ``True`` last types are used for all remaining args.
+            get_cond (callable): ``get_cond(var: str, index: int) -> str`` that gets condition of a type position.
+            is_default_valid (callable): ``is_default_valid(index: int, value: object) -> bool``.
+
+        Returns:
+            bool: ``False`` if checks can not be generated for function; Otherwise ``True``.
+        """
+        if type_count == 0:
+            return False
+        last = type_count - 1
+
+        def get_index(i: int) -> int:
+            return min(i, last) if all_args else i
+        named = self.pos[:]
+        if self.star is None:
+            named.extend(self.kw_only)
+            if not all_args and len(named) != type_count:
+                return False
+        elif len(self.kw_only) > 0 or (not all_args and len(named) > type_count):
+            return False
+        for i, p in enumerate(named):
+            index = get_index(i)
+            valid = p.default is Parameter.empty or is_default_valid(index, p.default)
+            self.add_named_check(param=p, cond=get_cond(p.name, index), default_valid=valid)
+        if self.star is not None:
+            star = self.star.name
+            n_pos = len(named)
+            if all_args:
+                # star args before last type position have own types.
+                for j in range(max(0, last - n_pos)):
+                    var = f"{star}[{j}]"
+                    self.add_line(f"if __kw_len({star}) > {j} and not ({get_cond(var, n_pos + j)}):")
+                    self.add_line("return False", 2)
+                start = max(0, last - n_pos)
+                iterable = star if start == 0 else f"{star}[{start}:]"
+                self.add_loop_check(iterable=iterable, cond=get_cond('__kw_v', last))
+            else:
+                count = type_count - n_pos
+                self.add_line(f"if __kw_len({star}) != {count}:")
+                self.add_line("return False", 2)
+                for j in range(count):
+                    cond = get_cond(f"{star}[{j}]", n_pos + j)
+                    self.add_line(f"if not ({cond}):")
+                    self.add_line("return False", 2)
+        if self.star_kw is not None:
+            self.add_line(f"if {self.star_kw.name}:")
+            self.add_line("return False", 2)
+        return True
+
+    def _get_params_src(self) -> str:
+        parts = []
+        has_star = False
+        for i, p in enumerate(self._all_params):
+            if p.kind == Parameter.VAR_POSITIONAL:
+                has_star = True
+                parts.append('*' + p.name)
+                continue
+            if p.kind == Parameter.VAR_KEYWORD:
+                parts.append('**' + p.name)
+                continue
+            if p.kind == Parameter.KEYWORD_ONLY and not has_star:
+                has_star = True
+                parts.append('*')
+            if p.default is Parameter.empty:
+                parts.append(p.name)
+            else:
+                parts.append(p.name + '=__kw_ns')
+            if p.kind == Parameter.POSITIONAL_ONLY:
+                nxt = self._all_params[i + 1] if i + 1 < len(self._all_params) else None
+                if nxt is None or nxt.kind != Parameter.POSITIONAL_ONLY:
+                    parts.append('/')
+        return ', '.join(parts)
+
+    def get_source(self, sampled: bool = False) -> str:
+        """
+        Gets source code of generated check and wrapper
+
+        Args:
+            sampled (bool, optional): If ``True`` wrapper skips checks of calls that are not sampled
+                by ``__kw_slot``. Default ``False``.
+        """
+        lines = [f"def __kw_check({self._get_params_src()}):"]
+        lines.extend(self._lines)
+        lines.append("    return True")
+        lines.append("")
+        lines.append("def wrapper(*args, **kwargs):")
+        if sampled:
+            lines.append("    if __kw_samples.active and __kw_slot.is_skipped():")
+            lines.append("        return __kw_func(*args, **kwargs)")
+        lines.append("    try:")
+        lines.append("        __kw_valid = __kw_check(*args, **kwargs)")
+        lines.append("    except TypeError:")
+        lines.append("        __kw_valid = False")
+        lines.append("    if __kw_valid:")
+        lines.append("        return __kw_func(*args, **kwargs)")
+        lines.append("    return __kw_fallback(*args, **kwargs)")
+        lines.append("")
+        return '\n'.join(lines)
+
+    def build(self, func: callable, fallback: callable, dec_name: str, slot: Optional["_SampleSlot"] = None) -> callable:
+        """
+        Builds wrapper from generated source.
+
+        Args:
+            func (callable): function being wrapped.
+            fallback (callable): wrapper that is called when args are not valid.
+            dec_name (str): Name of decorator, used for file name of generated code.
+            slot (_SampleSlot, optional): Sample slot of ``func``. If omitted all calls are checked.
+
+        Returns:
+            callable: generated wrapper. Source of wrapper is set as ``__kwhelp_source__`` attribute.
+        """
+        src = self.get_source(sampled=slot is not None)
+        ns = self._ns
+        ns['__kw_func'] = func
+        ns['__kw_fallback'] = fallback
+        if slot is not None:
+            ns['__kw_samples'] = _sample_registry
+            ns['__kw_slot'] = slot
+        filename = f"<kwhelp {dec_name} {getattr(func, '__qualname__', self._info.name)}>"
+        exec(compile(src, filename, 'exec'), ns)
+        wrapper = functools.wraps(func)(ns['wrapper'])
+        wrapper.__kwhelp_source__ = src
+        return wrapper
+
+
 class _CommonBase(object):
     def __init__(self, **kwargs):
         """
@@ -552,6 +1491,8 @@ class _CommonBase(object):
                 "fn has not been set. Check if _call_init is called.")
         return self._fn
     # endregion Properties
+
+
 class _DecBase(_CommonBase):
 
     # region Init
@@ -567,11 +1508,13 @@ class _DecBase(_CommonBase):
                         f"{self.__class__.__name__} requires arg 'ftype' to be a 'DecFuncType")
         else:
             self._ftype = DecFuncEnum.FUNCTION
-        self._cache = {
-            'args': [],
-            'kwargs': OrderedDict()
-        }
-        self._w_cache = None
+        # decorator level cache. Must not hold any wrapped function call values.
+        self._cache = {}
+        # opt_args_filter and its resolved view function, see _call_init()
+        self._args_filter: Optional[Tuple[DecArgEnum, callable]] = None
+        # holds the current call context for each thread when state is set through
+        # _wrapper_init() or args and kwargs properties.
+        self._local = threading.local()
 
     def _call_init(self, **kwargs):
         """
@@ -581,86 +1524,272 @@ class _DecBase(_CommonBase):
             func (callable): Function that is being wrapped
         """
         super()._call_init(**kwargs)
+        opt_filter = getattr(self, '_opt_args_filter', None)
+        if opt_filter is not None:
+            self._args_filter = (opt_filter, _get_args_filter(opt_filter))
+
+    def _get_call_context(self, args: Iterable[object], kwargs: Dict[str, Any]) -> _CallContext:
+        """
+        Gets a new call context for a single call of wrapped function.
+
+        Decorator instance is not modified. Context is to be passed to methods such as
+        ``_get_args_dict()`` and ``_get_filtered_args_dict()`` which makes wrappers that use
+        it safe for recursive calls and calls from multiple threads.
+
+        Args:
+            args (Iterable[object]): Wrapped function ``args``
+            kwargs (Dict[str, Any]): Wrapped function ``kwargs``
 
-    def _wrapper_init(self, **kwargs):
+        Returns:
+            _CallContext: New call context.
+        """
+        return _CallContext(args=args, kwargs=kwargs)
+
+    def _wrapper_init(self, **kwargs) -> _CallContext:
         """
         Wrapper Init. Provides args for base methods.
         This method usually called right after Wrapper method
 
+        Call state is stored per thread. Built in decorators use ``_get_call_context()`` instead.
+
         Keyword Arguments:
             args (Iterable[object]): Wrapped function ``args``
             kwargs (Dict[str, Any]): Wrapped function ``kwargs``
+            clear_cache (bool, optional): If ``True`` function level cache is cleared.
+                Default ``True``
+
+        Returns:
+            _CallContext: Current call context for this thread.
         """
         clear_cache = kwargs.get("clear_cache", True)
-        if clear_cache:
-            self._w_cache = {}
+        ctx = getattr(self._local, 'ctx', None)
+        if clear_cache or ctx is None:
+            ctx = _CallContext()
+            self._local.ctx = ctx
         key = 'args'
         if key in kwargs:
             self.args = kwargs[key]
         key = 'kwargs'
         if key in kwargs:
             self.kwargs = kwargs[key]
+        return ctx
+
+    def _wrapper_end(self) -> None:
+        """
+        Releases call state of current thread that was set by ``_wrapper_init()``.
+
+        Decorators that call ``_wrapper_init()`` should call this method before wrapper returns
+        so that no references to wrapped function ``args`` and ``kwargs`` are kept after call.
+        """
+        self._local.ctx = None
     # endregion Init
 
+    # region Wrapper
+    def __call__(self, func: callable) -> callable:
+        if _strip_mode:
+            return _get_strip_wrapper(func=func, setup_fns=(self._wrapper_setup,))
+        self._call_init(func=func)
+        wrapper = self._get_wrapper(func=func, slot=_SampleSlot(func=func))
+        self._wrapper_setup(wrapper=wrapper)
+        return wrapper
+
+    def _get_wrapper(self, func: callable, slot: Optional["_SampleSlot"] = None) -> callable:
+        """
+        Gets wrapper for ``func`` that calls ``_pre_check()`` and ``_post_check()``.
+
+        Only the checks implemented by decorator are called by wrapper.
+
+        Args:
+            func (callable): Function that is being wrapped
+            slot (_SampleSlot, optional): Sample slot of ``func``. Calls that are not sampled
+                call ``func`` without any checks. If omitted all calls are checked.
+
+        Returns:
+            callable: wrapper function
+        """
+        if slot is None:
+            slot = _SampleSlot()
+        has_pre = self._has_pre_check()
+        has_post = self._has_post_check()
+        if has_pre and has_post:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if _sample_registry.active and slot.is_skipped():
+                    return func(*args, **kwargs)
+                ctx = self._get_call_context(args=args, kwargs=kwargs)
+                result = self._pre_check(ctx=ctx, wrapper=wrapper)
+                if not result is NO_THING:
+                    return result
+                return self._post_check(return_value=func(*args, **kwargs), wrapper=wrapper)
+        elif has_pre:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if _sample_registry.active and slot.is_skipped():
+                    return func(*args, **kwargs)
+                ctx = self._get_call_context(args=args, kwargs=kwargs)
+                result = self._pre_check(ctx=ctx, wrapper=wrapper)
+                if not result is NO_THING:
+                    return result
+                return func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if _sample_registry.active and slot.is_skipped():
+                    return func(*args, **kwargs)
+                return self._post_check(return_value=func(*args, **kwargs), wrapper=wrapper)
+        return wrapper
+
+    def _has_pre_check(self) -> bool:
+        return type(self)._pre_check is not _DecBase._pre_check
+
+    def _has_post_check(self) -> bool:
+        return type(self)._post_check is not _DecBase._post_check
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        """
+        Validates call before wrapped function is called.
+
+        Args:
+            ctx (_CallContext): Call context
+            wrapper (callable): Wrapper function. Validation attributes are set on wrapper.
+
+        Returns:
+            object: ``NO_THING`` if wrapped function is to be called; Otherwise value to return from call.
+        """
+        return NO_THING
+
+    def _post_check(self, return_value: object, wrapper: callable) -> object:
+        """
+        Validates call after wrapped function is called.
+
+        Args:
+            return_value (object): Value returned by wrapped function
+            wrapper (callable): Wrapper function. Validation attributes are set on wrapper.
+
+        Returns:
+            object: Value to return from call.
+        """
+        return return_value
+
+    def _wrapper_setup(self, wrapper: callable) -> None:
+        """
+        Sets up wrapper when function is decorated, such as setting validation attributes.
+
+        Args:
+            wrapper (callable): Wrapper function.
+        """
+        pass
+    # endregion Wrapper
+
     # region Property
     
     # region Function cache Properties
 
+    @property
+    def _current_context(self) -> _CallContext:
+        """Gets call context of current thread"""
+        ctx = getattr(self._local, 'ctx', None)
+        if ctx is None:
+            ctx = _CallContext()
+            self._local.ctx = ctx
+        return ctx
+
     @property
     def fn_cache(self) -> Dict[str, object]:
         """Gets function level cache"""
-        if not self._w_cache:
-            self._w_cache = {}
-        return self._w_cache
+        return self._current_context.cache
 
     @property
     def args(self) -> Iterable[object]:
         """Gets/sets wrapped function args"""
-        return self.fn_cache['args']
+        return self._current_context.args
 
     @args.setter
     def args(self, value: Iterable[object]):
-        self.fn_cache['args'] = [*value]
+        self._current_context.args = tuple(value)
 
     @property
     def kwargs(self) -> Dict[str, Any]:
         """Gets/sets wrapped function kwargs"""
-        return self.fn_cache['kwargs']
+        return self._current_context.kwargs
 
     @kwargs.setter
     def kwargs(self, value: Dict[str, Any]):
-        od = OrderedDict()
-        for k, v in value.items():
-            od[k] = v
-        self.fn_cache['kwargs'] = od
+        # wrapped function kwargs are a new dict for each call, no need to copy.
+        if isinstance(value, dict):
+            self._current_context.kwargs = value
+        else:
+            self._current_context.kwargs = OrderedDict(value)
 
     @property
     def fn_inst_info(self) -> _FnInstInfo:
-        cache = self.fn_cache
-        key = '_fn_instance_info'
+        return self._get_ctx_inst_info(self._current_context)
+    # endregion Function cache Properties
+    # endregion Property
+
+    def _get_select_plan(self, keys: Iterable[str]) -> Optional[_ArgSelectPlan]:
+        """
+        Gets a plan that gets the values of only ``keys`` from a call.
+
+        Args:
+            keys (Iterable[str]): Names of args that decorator checks.
+
+        Returns:
+            Optional[_ArgSelectPlan]: Plan or ``None`` if any key is a ``*#`` positional key.
+        """
+        keys = tuple(keys)
+        for key in keys:
+            if Formatter.is_star_num(name=key):
+                return None
+        return _ArgSelectPlan(bind_plan=self._get_fn_info().bind_plan, keys=keys)
+
+    def _get_selected_args(self, ctx: _CallContext, plan: Optional[_ArgSelectPlan]) -> Mapping:
+        """
+        Gets values of the args in ``plan`` without binding all args of call.
+
+        Args:
+            ctx (_CallContext): Call context.
+            plan (_ArgSelectPlan, optional): Plan of args to get.
+
+        Returns:
+            Mapping[str, Any]: Args in ``plan`` that are present in call. All args when ``plan``
+            is ``None``.
+
+        Raises:
+            TypeError: If any args without defaults are missing.
+        """
+        if plan is not None:
+            result = plan.select(ctx.args, ctx.kwargs)
+            if result is not None:
+                return result
+        # binding all args raises error for missing args.
+        return self._get_ctx_inst_info(ctx).get_view_all()
+
+    def _get_ctx_inst_info(self, ctx: _CallContext) -> _FnInstInfo:
+        cache = ctx.cache
+        # a context may be shared by decorators, see Validate.
+        key = ('_fn_instance_info', self._ftype)
         if key in cache:
             return cache[key]
-        cache[key] = self._get_inst_info()
+        cache[key] = self._get_inst_info(ctx=ctx)
         return cache[key]
-    # endregion Function cache Properties
-    # endregion Property
 
     def _drop_arg_first(self) -> bool:
         return self._ftype.value > DecFuncEnum.METHOD_STATIC.value
 
-    def _get_args(self):
-        # return self.fn_inst_info.args
+    def _get_args(self, ctx: Optional[_CallContext] = None):
+        if ctx is None:
+            ctx = self._current_context
         if self._drop_arg_first():
-            return self.args[1:]
-        return self.args
+            return ctx.args[1:]
+        return ctx.args
 
-    def _get_args_star(self) -> Iterable[object]:
+    def _get_args_star(self, ctx: Optional[_CallContext] = None) -> Iterable[object]:
         """
         Get args accounting for ``*args`` postions in function and if function class method.
 
         Args:
-            func (callable): function with args
-            args (Iterable[object]): function current args
+            ctx (_CallContext, optional): Call context. Default current thread context.
 
         Returns:
             Iterable[object]: New args that may be a subset of all of orignial ``args``.
@@ -672,21 +1801,26 @@ class _DecBase(_CommonBase):
             i += pos
         if drop_first:
             i += 1
+        if ctx is None:
+            ctx = self._current_context
         if i > 0:
-            return self.args[i:]
-        return self.args
+            return ctx.args[i:]
+        return ctx.args
 
     def _get_fn_info(self) -> _FuncInfo:
         info = self._cache.get("_fn_info", False)
         if info:
             return info
-        self._cache['_fn_info'] = _FuncInfo(func=self.fn, ftype=self._ftype)
+        self._cache['_fn_info'] = _get_func_info(func=self.fn, ftype=self._ftype)
         return self._cache['_fn_info']
 
-    def _get_inst_info(self, **kwargs) -> _FnInstInfo:
+    def _get_inst_info(self, ctx: Optional[_CallContext] = None, **kwargs) -> _FnInstInfo:
         """
         Gets Function Info
 
+        Args:
+            ctx (_CallContext, optional): Call context. Default current thread context.
+
         Keyword Arguments:
             error_check (bool, optional): Determinse if errors are raise if there are missing
                 keywords. This is the case when function has keywords without defaults assigned
@@ -696,9 +1830,11 @@ class _DecBase(_CommonBase):
             _FnInstInfo: Function Instance Info
         """
         err_chk = bool(kwargs.get("error_check", True))
+        if ctx is None:
+            ctx = self._current_context
         try:
             info = _FnInstInfo(fninfo=self._get_fn_info(),
-                               fn_args=self.args, fn_kwargs=self.kwargs)
+                               fn_args=ctx.args, fn_kwargs=ctx.kwargs)
         except TypeError as e:
             if err_chk:
                 msg = str(e)
@@ -706,12 +1842,15 @@ class _DecBase(_CommonBase):
                 raise TypeError(msg)
         return info
 
-    def _get_args_dict(self, **kwargs) -> "OrderedDict[str, Any]":
+    def _get_args_dict(self, ctx: Optional[_CallContext] = None, **kwargs) -> "OrderedDict[str, Any]":
         """
         Gets OrderedDict of all Args, and Keyword args.
 
         All ``*arg`` values will have a key of ``*#`` Eg: ``'*0', 12``, ``'*1': 45.77``, ``'*3': 'flat'``
 
+        Args:
+            ctx (_CallContext, optional): Call context. Default current thread context.
+
         Keyword Arguments:
             error_check (bool, optional): Determinse if errors are raise if there are missing
                 keywords. This is the case when function has keywords without defaults assigned
@@ -720,33 +1859,29 @@ class _DecBase(_CommonBase):
         Returns:
             OrderedDict[str, Any]: Dictionary of keys and values representing ``func`` keywords and values.
         """
-        info = self._get_inst_info(kwargs=kwargs)
+        if ctx is None:
+            info = self._get_inst_info(kwargs=kwargs)
+        else:
+            info = self._get_ctx_inst_info(ctx)
         return info.get_all_args()
 
-    def _get_filtered_args_dict(self, opt_filter: DecArgEnum = DecArgEnum.All_ARGS) -> "OrderedDict[str, Any]":
+    def _get_filtered_args_dict(self, opt_filter: DecArgEnum = DecArgEnum.All_ARGS, ctx: Optional[_CallContext] = None) -> Mapping:
         """
         Gets filtered dictionary
 
         Args:
             filter (DecArgEnum): Filter option
+            ctx (_CallContext, optional): Call context. Default current thread context.
         Returns:
-            OrderedDict[str, Any]: of based on filter
+            Mapping[str, Any]: Read-only ordered view of args based on filter.
         """
-        fn_info = self.fn_inst_info
-        if opt_filter & DecArgEnum.All_ARGS == DecArgEnum.All_ARGS:
-            return fn_info.get_all_args()
-        if opt_filter & DecArgEnum.NO_ARGS == DecArgEnum.NO_ARGS:
-            return fn_info.get_filter_noargs()
-        result = OrderedDict()
-        if DecArgEnum.ARGS in opt_filter:
-            if fn_info.info.is_args:
-                result.update(fn_info.get_filter_arg())
-        if DecArgEnum.KWARGS in opt_filter:
-            if fn_info.info.is_kwargs:
-                result.update(fn_info.get_filtered_kwargs())
-        if DecArgEnum.NAMED_ARGS in opt_filter:
-            result.update(fn_info.get_filtered_key_word_args())
-        return result
+        if ctx is None:
+            ctx = self._current_context
+        fn_info = self._get_ctx_inst_info(ctx)
+        args_filter = self._args_filter
+        if args_filter is not None and args_filter[0] is opt_filter:
+            return args_filter[1](fn_info)
+        return _get_args_filter(opt_filter)(fn_info)
 
     def _get_formated_types(self, types: Iterator[type], **kwargs) -> str:
         """
@@ -850,37 +1985,68 @@ class TypeCheck(_DecBase):
         self._opt_args_filter = DecArgEnum(
             kwargs.get("opt_args_filter", DecArgEnum.All_ARGS))
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_filtered_args_dict(
+            self._opt_args_filter, ctx=ctx)
+        try:
+            is_valid = self._typechecker._validate_items(arg_name_values._iter_items())
+            if self._typechecker.raise_error is False:
+                wrapper.is_types_valid = is_valid
+            if is_valid is False and self._is_opt_return() is True:
+                return self._opt_return
+        except TypeError as e:
+            if self._is_opt_return():
+                return self._opt_return
+            msg = str(e)
+            msg = msg + self._get_class_dec_err()
+            ex = TypeError(msg)
+            self._log_err(ex)
+            raise ex
+        return NO_THING
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_filtered_args_dict(
-                self._opt_args_filter)
-            try:
-                is_valid = self._typechecker.validate(**arg_name_values)
-                if self._typechecker.raise_error is False:
-                    wrapper.is_types_valid = is_valid
-                if is_valid is False and self._is_opt_return() is True:
-                    return self._opt_return
-            except TypeError as e:
-                if self._is_opt_return():
-                    return self._opt_return
-                msg = str(e)
-                msg = msg + self._get_class_dec_err()
-                ex = TypeError(msg)
-                self._log_err(ex)
-                raise ex
-            return func(*args, **kwargs)
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._typechecker.raise_error is False:
             wrapper.is_types_valid = True
-        return wrapper
+
+    def _get_wrapper(self, func: callable, slot: Optional["_SampleSlot"] = None) -> callable:
+        # fallback is only built when wrapper is generated and only called by it after call is sampled.
+        gen_wrapper = self._get_gen_wrapper(func=func, get_fallback=functools.partial(super()._get_wrapper, func=func), slot=slot)
+        if gen_wrapper is None:
+            return super()._get_wrapper(func=func, slot=slot)
+        return gen_wrapper
+
+    def _get_gen_wrapper(self, func: callable, get_fallback: callable, slot: Optional["_SampleSlot"] = None) -> Optional[callable]:
+        tc = self._typechecker
+        if tc.raise_error is False:
+            return None
+        gen = _WrapperCodeGen(fninfo=self._get_fn_info())
+        if not gen.is_supported():
+            return None
+        types = tc.types
+        tic = tc.type_instance_check
+        # default values are checked once here and not on each call.
+        default_tc = TypeChecker(*types, type_instance_check=tic, raise_error=False)
+        opt_filter = self._opt_args_filter
+        if opt_filter & DecArgEnum.All_ARGS == DecArgEnum.All_ARGS:
+            opt_filter = DecArgEnum.All_ARGS
+        elif opt_filter & DecArgEnum.NO_ARGS == DecArgEnum.NO_ARGS:
+            opt_filter = DecArgEnum.NO_ARGS
+        if DecArgEnum.NAMED_ARGS in opt_filter:
+            for p in gen.pos + gen.kw_only:
+                valid = p.default is Parameter.empty or default_tc.validate(p.default)
+                gen.add_named_check(param=p, cond=gen.get_type_cond(
+                    var=p.name, types=types, instance_check=tic), default_valid=valid)
+        cond = gen.get_type_cond(var='__kw_v', types=types, instance_check=tic)
+        if DecArgEnum.ARGS in opt_filter and gen.star is not None:
+            gen.add_loop_check(iterable=gen.star.name, cond=cond)
+        if DecArgEnum.KWARGS in opt_filter and gen.star_kw is not None:
+            gen.add_loop_check(iterable=gen.star_kw.name + '.values()', cond=cond)
+        return gen.build(func=func, fallback=get_fallback(), dec_name=self.__class__.__name__, slot=slot)
 
     @property
     def _typechecker(self) -> TypeChecker:
         if self._tc is None:
-            self._tc = TypeChecker(*self._types, **self._kwargs)
+            self._tc = TypeChecker._get_shared(*self._types, **self._kwargs)
         return self._tc
 
 
@@ -949,84 +2115,92 @@ class AcceptedTypes(_DecBase):
         return result
 
     def _get_inst(self, types: Iterable[type]):
-        return TypeChecker(*types, **self._kwargs)
+        return TypeChecker._get_shared(*types, **self._kwargs)
+
+    def _get_wrapper(self, func: callable, slot: Optional["_SampleSlot"] = None) -> callable:
+        # fallback is only built when wrapper is generated and only called by it after call is sampled.
+        gen_wrapper = self._get_gen_wrapper(func=func, get_fallback=functools.partial(super()._get_wrapper, func=func), slot=slot)
+        if gen_wrapper is None:
+            return super()._get_wrapper(func=func, slot=slot)
+        return gen_wrapper
+
+    def _get_gen_wrapper(self, func: callable, get_fallback: callable, slot: Optional["_SampleSlot"] = None) -> Optional[callable]:
+        if self._opt_args_filter & DecArgEnum.All_ARGS != DecArgEnum.All_ARGS:
+            return None
+        if bool(self._kwargs.get('raise_error', True)) is False:
+            return None
+        gen = _WrapperCodeGen(fninfo=self._get_fn_info())
+        if not gen.is_supported():
+            return None
+        checkers = [checker for _, checker in self._checkers]
+
+        def get_cond(var: str, index: int) -> str:
+            tc = checkers[index]
+            return gen.get_type_cond(var=var, types=tc.types, instance_check=tc.type_instance_check)
+
+        def is_default_valid(index: int, value: object) -> bool:
+            tc = checkers[index]
+            return TypeChecker(*tc.types, type_instance_check=tc.type_instance_check,
+                               raise_error=False).validate(value)
+        if not gen.add_position_checks(type_count=len(self._types), all_args=self._all_args,
+                                       get_cond=get_cond, is_default_valid=is_default_valid):
+            return None
+        return gen.build(func=func, fallback=get_fallback(), dec_name=self.__class__.__name__, slot=slot)
+
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # one checker for each position, last checker is also used for remaining args
+        # when opt_all_args is True. Checkers are created once and reused on each call.
+        self._checkers: Tuple[Tuple[Union[Tuple[type], Set[type]], TypeChecker]] = tuple(
+            (types, self._get_inst(types=types)) for types in self._types)
 
     def _validate(self, func: callable, key: str, value: object, types: Iterable[type], arg_index: int, inst: SubClassChecker = None):
         if inst is None:
             tc = self._get_inst(types=types)
         else:
             tc = inst
-        if Formatter.is_star_num(name=key):
-            try:
-                tc.validate(value)
-            except TypeError:
-                if self._is_opt_return():
-                    return self._opt_return
-                ex = TypeError(self._get_err_msg(name=None, value=value,
-                                                  types=types, arg_index=arg_index,
-                                                  fn=func))
-                self._log_err(err=ex)
-                raise ex
-        else:
-            try:
-                tc.validate(**{key: value})
-            except TypeError:
-                if self._is_opt_return():
-                    return self._opt_return
-                ex = TypeError(self._get_err_msg(name=key, value=value,
-                                                  types=types, arg_index=arg_index,
-                                                  fn=func))
-                self._log_err(err=ex)
-                raise ex
+        try:
+            tc.validate(value)
+        except TypeError:
+            if self._is_opt_return():
+                return self._opt_return
+            name = None if Formatter.is_star_num(name=key) else key
+            ex = TypeError(self._get_err_msg(name=name, value=value,
+                                              types=types, arg_index=arg_index,
+                                              fn=func))
+            self._log_err(err=ex)
+            raise ex
         return NO_THING
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_filtered_args_dict(
-                self._opt_args_filter)
-            arg_keys = list(arg_name_values.keys())
-            arg_keys_len = arg_keys.__len__()
-            i = 0
-            if arg_keys_len is not len(self._types):
-                if self._all_args is False:
-                    if self._is_opt_return():
-                        return self._opt_return
-                    msg = 'Invalid number of arguments for {0}()'.format(
-                        func.__name__)
-                    msg = msg + self._get_class_dec_err()
-                    ex = ValueError(msg)
-                    self._log_err(err=ex)
-                    raise ex
-            arg_type = zip(arg_keys, self._types)
-
-            for arg_info in arg_type:
-                key = arg_info[0]
-                result = self._validate(func=func, key=key,
-                                        value=arg_name_values[key],
-                                        types=arg_info[1], arg_index=i)
-                if not result is NO_THING:
-                    return result
-                i += 1
-            if arg_keys_len > i:
-                # this only happens when _all_args is True
-                # at this point remain args should match last last type in self._types
-                r_args = arg_keys[i:]
-                types = self._types[len(self._types) - 1]  # tuple or set
-                sc = self._get_inst(types=types)
-                for r_arg in r_args:
-                    result = self._validate(func=func, key=r_arg,
-                                            value=arg_name_values[r_arg],
-                                            types=types, arg_index=i,
-                                            inst=sc)
-                    if not result is NO_THING:
-                        return result
-                    i += 1
-            return func(*args, **kwargs)
-        return wrapper
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_filtered_args_dict(
+            self._opt_args_filter, ctx=ctx)
+        checkers = self._checkers
+        if len(arg_name_values) != len(checkers):
+            if self._all_args is False:
+                if self._is_opt_return():
+                    return self._opt_return
+                msg = 'Invalid number of arguments for {0}()'.format(
+                    self.fn.__name__)
+                msg = msg + self._get_class_dec_err()
+                ex = ValueError(msg)
+                self._log_err(err=ex)
+                raise ex
+        last = len(checkers) - 1
+        i = 0
+        for key, value in arg_name_values.items():
+            # remaining args only happen when _all_args is True
+            # remaining args should match last type in self._types
+            if i > last:
+                types, tc = checkers[last]
+            else:
+                types, tc = checkers[i]
+            result = self._validate(func=self.fn, key=key, value=value,
+                                    types=types, arg_index=i, inst=tc)
+            if not result is NO_THING:
+                return result
+            i += 1
+        return NO_THING
 
     def _get_err_msg(self, name: Union[str, None], value: object, types: Iterator[type], arg_index: int, fn: callable):
         str_types = self._get_formated_types(types=types)
@@ -1120,37 +2294,30 @@ class ArgsLen(_DecBase):
             result = result + str_rng + "."
         return result
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            _args = self._get_args_star()
-            _args_len = len(_args)
-            is_valid = False
-            if _args_len >= 0:
-                for i in self._lengths:
-                    if _args_len == i:
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        _args = self._get_args_star(ctx=ctx)
+        _args_len = len(_args)
+        is_valid = False
+        if _args_len >= 0:
+            for i in self._lengths:
+                if _args_len == i:
+                    is_valid = True
+                    break
+            if is_valid is False:
+                for range in self._ranges:
+                    if _args_len >= range[0] and _args_len <= range[1]:
                         is_valid = True
                         break
-                if is_valid is False:
-                    for range in self._ranges:
-                        if _args_len >= range[0] and _args_len <= range[1]:
-                            is_valid = True
-                            break
-            if is_valid is False:
-                if self._is_opt_return():
-                    return self._opt_return
-                msg = f"Invalid number of args pass into '{func.__name__}'.\n{self._get_valid_counts()}"
-                msg = msg + f" Got '{_args_len}' args."
-                msg = msg + self._get_class_dec_err()
-                ex = ValueError(msg)
-                self._log_err(err=ex)
-                raise ex
-            return func(*args, **kwargs)
-        # wrapper.is_types_valid = self.is_valid
-        return wrapper
+        if is_valid is False:
+            if self._is_opt_return():
+                return self._opt_return
+            msg = f"Invalid number of args pass into '{self.fn.__name__}'.\n{self._get_valid_counts()}"
+            msg = msg + f" Got '{_args_len}' args."
+            msg = msg + self._get_class_dec_err()
+            ex = ValueError(msg)
+            self._log_err(err=ex)
+            raise ex
+        return NO_THING
 
 
 class ArgsMinMax(_DecBase):
@@ -1208,33 +2375,26 @@ class ArgsMinMax(_DecBase):
         msg = msg + self._get_class_dec_err()
         return msg
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            _min, _max = self._get_min_max()
-            has_rules = _min > 0 or _max >= 0
-            if has_rules:
-                _args = self._get_args_star()
-                _args_len = len(_args)
-                is_valid = True
-                if _min > 0:
-                    if _args_len < _min:
-                        is_valid = False
-                if is_valid == True and _max >= 0:
-                    if _args_len > _max:
-                        is_valid = False
-                if is_valid is False:
-                    if self._is_opt_return():
-                        return self._opt_return
-                    ex = ValueError(self._get_error_msg(args_len=_args_len))
-                    self._log_err(err=ex)
-                    raise ex
-            return func(*args, **kwargs)
-        # wrapper.is_types_valid = self.is_valid
-        return wrapper
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        _min, _max = self._get_min_max()
+        has_rules = _min > 0 or _max >= 0
+        if has_rules:
+            _args = self._get_args_star(ctx=ctx)
+            _args_len = len(_args)
+            is_valid = True
+            if _min > 0:
+                if _args_len < _min:
+                    is_valid = False
+            if is_valid == True and _max >= 0:
+                if _args_len > _max:
+                    is_valid = False
+            if is_valid is False:
+                if self._is_opt_return():
+                    return self._opt_return
+                ex = ValueError(self._get_error_msg(args_len=_args_len))
+                self._log_err(err=ex)
+                raise ex
+        return NO_THING
 
 
 class ReturnRuleAll(_RuleBase):
@@ -1268,30 +2428,22 @@ class ReturnRuleAll(_RuleBase):
         else:
             self._kwargs = {}
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            return_value = func(*args, **kwargs)
-            rc = self._rulechecker
-            try:
-                rc.validate_all(**{"return": return_value})
-            except RuleError as e:
-                if self._is_opt_return():
-                    return self._opt_return
-                err = self._get_err(e=e)
-                self._log_err(err=err)
-                raise err
-            return return_value
-        return wrapper
+    def _post_check(self, return_value: object, wrapper: callable) -> object:
+        rc = self._rulechecker
+        try:
+            rc.validate_all(**{"return": return_value})
+        except RuleError as e:
+            if self._is_opt_return():
+                return self._opt_return
+            err = self._get_err(e=e)
+            self._log_err(err=err)
+            raise err
+        return return_value
 
     @property
     def _rulechecker(self) -> RuleChecker:
         if self._rc is None:
-            self._rc = RuleChecker(rules_all=self._rules, **self._kwargs)
-            self._rc.raise_error = True
+            self._rc = RuleChecker._get_shared(rules_all=self._rules, **{**self._kwargs, 'raise_error': True})
         return self._rc
 
 
@@ -1325,31 +2477,23 @@ class ReturnRuleAny(_RuleBase):
         else:
             self._kwargs = {}
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            return_value = func(*args, **kwargs)
-            rc = self._rulechecker
-            # rc.current_arg = "return"
-            try:
-                rc.validate_any(**{"return": return_value})
-            except RuleError as e:
-                if self._is_opt_return():
-                    return self._opt_return
-                err = self._get_err(e=e)
-                self._log_err(err=err)
-                raise err
-            return return_value
-        return wrapper
+    def _post_check(self, return_value: object, wrapper: callable) -> object:
+        rc = self._rulechecker
+        # rc.current_arg = "return"
+        try:
+            rc.validate_any(**{"return": return_value})
+        except RuleError as e:
+            if self._is_opt_return():
+                return self._opt_return
+            err = self._get_err(e=e)
+            self._log_err(err=err)
+            raise err
+        return return_value
 
     @property
     def _rulechecker(self) -> RuleChecker:
         if self._rc is None:
-            self._rc = RuleChecker(rules_any=self._rules, **self._kwargs)
-            self._rc.raise_error = True
+            self._rc = RuleChecker._get_shared(rules_any=self._rules, **{**self._kwargs, 'raise_error': True})
         return self._rc
 
 
@@ -1387,24 +2531,17 @@ class ReturnType(_DecBase):
         else:
             self._kwargs = {}
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            return_value = func(*args, **kwargs)
-            try:
-                self._typechecker.validate(return_value)
-            except TypeError:
-                if self._is_opt_return():
-                    return self._opt_return
-                # catch type error and raise a new one so a more fitting message is raised.
-                ex = TypeError(self._get_err_msg(return_value))
-                self._log_err(err=ex)
-                raise ex
-            return return_value
-        return wrapper
+    def _post_check(self, return_value: object, wrapper: callable) -> object:
+        try:
+            self._typechecker.validate(return_value)
+        except TypeError:
+            if self._is_opt_return():
+                return self._opt_return
+            # catch type error and raise a new one so a more fitting message is raised.
+            ex = TypeError(self._get_err_msg(return_value))
+            self._log_err(err=ex)
+            raise ex
+        return return_value
 
     def _get_err_msg(self, value: object):
         str_types = self._get_formated_types(self._types, conj='or')
@@ -1415,9 +2552,8 @@ class ReturnType(_DecBase):
     @property
     def _typechecker(self) -> TypeChecker:
         if self._tc is None:
-            self._tc = TypeChecker(*self._types, **self._kwargs)
             # ensure errors are raised if not valid
-            self._tc.raise_error = True
+            self._tc = TypeChecker._get_shared(*self._types, **{**self._kwargs, 'raise_error': True})
         return self._tc
 
 
@@ -1480,44 +2616,52 @@ class TypeCheckKw(_DecBase):
             # make iterable
             return (value,)
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # arg_info is resolved once into a checker for each key.
+        # checker is None when key has no types.
+        checkers = []
+        for key in self._arg_index.keys():
+            types = self._get_types(key=key)
+            if len(types) == 0:
+                checkers.append((key, None))
+            else:
+                checkers.append((key, TypeChecker._get_shared(*types, **self._kwargs)))
+        self._checkers: Tuple[Tuple[str, Optional[TypeChecker]]] = tuple(checkers)
+        self._select_plan = self._get_select_plan(keys=self._arg_index.keys())
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        is_valid = True
+        arg_name_values = self._get_selected_args(ctx=ctx, plan=self._select_plan)
+        tc = False
+        for key, checker in self._checkers:
+            if key in arg_name_values:
+                is_valid = False
+                if checker is None:
+                    continue
+                value = arg_name_values[key]
+                tc = checker
+                try:
+                    is_valid = tc._validate_type(value=value, key=key)
+                    if is_valid is False:
+                        break
+                except TypeError as e:
+                    if self._is_opt_return():
+                        return self._opt_return
+                    msg = str(e)
+                    msg = msg + self._get_class_dec_err()
+                    ex = TypeError(msg)
+                    self._log_err(err=ex)
+                    raise ex
+        if tc and tc.raise_error is False:
+            wrapper.is_types_kw_valid = is_valid
+            if is_valid == False and self._is_opt_return() == True:
+                return self._opt_return
+        return NO_THING
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            is_valid = True
-            arg_name_values = self._get_args_dict()
-            arg_keys = arg_name_values.keys()
-            tc = False
-            for key in self._arg_index.keys():
-                if key in arg_keys:
-                    is_valid = False
-                    types = self._get_types(key=key)
-                    if len(types) == 0:
-                        continue
-                    value = arg_name_values[key]
-                    tc = TypeChecker(*types, **self._kwargs)
-                    try:
-                        is_valid = tc.validate(**{key: value})
-                        if is_valid is False:
-                            break
-                    except TypeError as e:
-                        if self._is_opt_return():
-                            return self._opt_return
-                        msg = str(e)
-                        msg = msg + self._get_class_dec_err()
-                        ex = TypeError(msg)
-                        self._log_err(err=ex)
-                        raise ex
-            if tc and tc.raise_error is False:
-                wrapper.is_types_kw_valid = is_valid
-                if is_valid == False and self._is_opt_return() == True:
-                    return self._opt_return
-            return func(*args, **kwargs)
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._raise_error is False:
             wrapper.is_types_kw_valid = True
-        return wrapper
 
 
 class RuleCheckAny(_RuleBase):
@@ -1564,36 +2708,32 @@ class RuleCheckAny(_RuleBase):
         self._opt_args_filter = DecArgEnum(
             kwargs.get("opt_args_filter", DecArgEnum.All_ARGS))
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_filtered_args_dict(
+            self._opt_args_filter, ctx=ctx)
+        is_valid = False
+        try:
+            is_valid = self._rulechecker._validate_any_items(arg_name_values._iter_items())
+        except RuleError as err:
+            if self._is_opt_return():
+                return self._opt_return
+            err_rule = self._get_err(e=err)
+            self._log_err(err=err_rule)
+            raise err_rule
+        if self._raise_error is False:
+            wrapper.is_rules_any_valid = is_valid
+            if is_valid == False and self._is_opt_return() == True:
+                return self._opt_return
+        return NO_THING
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_filtered_args_dict(
-                self._opt_args_filter)
-            is_valid = False
-            try:
-                is_valid = self._rulechecker.validate_any(**arg_name_values)
-            except RuleError as err:
-                if self._is_opt_return():
-                    return self._opt_return
-                err_rule = self._get_err(e=err)
-                self._log_err(err=err_rule)
-                raise err_rule
-            if self._raise_error is False:
-                wrapper.is_rules_any_valid = is_valid
-                if is_valid == False and self._is_opt_return() == True:
-                    return self._opt_return
-            return func(*args, **kwargs)
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._raise_error is False:
             wrapper.is_rules_any_valid = True
-        return wrapper
 
     @property
     def _rulechecker(self) -> RuleChecker:
         if self._rc is None:
-            self._rc = RuleChecker(rules_any=self._rules, **self._kwargs)
+            self._rc = RuleChecker._get_shared(rules_any=self._rules, **self._kwargs)
         return self._rc
 
 
@@ -1641,36 +2781,32 @@ class RuleCheckAll(_RuleBase):
         self._opt_args_filter = DecArgEnum(
             kwargs.get("opt_args_filter", DecArgEnum.All_ARGS))
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_filtered_args_dict(
+            self._opt_args_filter, ctx=ctx)
+        is_valid = False
+        try:
+            is_valid = self._rulechecker._validate_all_items(arg_name_values._iter_items())
+        except RuleError as err:
+            if self._is_opt_return():
+                return self._opt_return
+            err_rule = self._get_err(e=err)
+            self._log_err(err=err_rule)
+            raise err_rule
+        if self._rulechecker.raise_error is False:
+            wrapper.is_rules_all_valid = is_valid
+            if is_valid == False and self._is_opt_return() == True:
+                return self._opt_return
+        return NO_THING
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_filtered_args_dict(
-                self._opt_args_filter)
-            is_valid = False
-            try:
-                is_valid = self._rulechecker.validate_all(**arg_name_values)
-            except RuleError as err:
-                if self._is_opt_return():
-                    return self._opt_return
-                err_rule = self._get_err(e=err)
-                self._log_err(err=err_rule)
-                raise err_rule
-            if self._rulechecker.raise_error is False:
-                wrapper.is_rules_all_valid = is_valid
-                if is_valid == False and self._is_opt_return() == True:
-                    return self._opt_return
-            return func(*args, **kwargs)
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._raise_error is False:
             wrapper.is_rules_all_valid = True
-        return wrapper
 
     @property
     def _rulechecker(self) -> RuleChecker:
         if self._rc is None:
-            self._rc = RuleChecker(rules_all=self._rules, **self._kwargs)
+            self._rc = RuleChecker._get_shared(rules_all=self._rules, **self._kwargs)
         return self._rc
 
 
@@ -1733,44 +2869,50 @@ class RuleCheckAllKw(_RuleBase):
             return (value,)
         return value
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _get_checker(self, rules: Iterable[IRule]) -> RuleChecker:
+        return RuleChecker._get_shared(rules_all=rules, **self._kwargs)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            is_valid = True
-            arg_name_values = self._get_args_dict()
-            arg_keys = arg_name_values.keys()
-            add_attrib = None
-            for key in self._arg_index.keys():
-                if key in arg_keys:
-                    rules = self._get_rules(key=key)
-                    if len(rules) == 0:
-                        continue
-                    value = arg_name_values[key]
-                    rc = RuleChecker(rules_all=rules, **self._kwargs)
-                    if add_attrib is None:
-                        add_attrib = not rc.raise_error
-                    is_valid = False
-                    try:
-                        is_valid = rc.validate_all(**{key: value})
-                    except RuleError as err:
-                        if self._is_opt_return():
-                            return self._opt_return
-                        err_rule = self._get_err(e=err)
-                        self._log_err(err=err_rule)
-                        raise err_rule
-                    if is_valid is False:
-                        break
-            if add_attrib:
-                wrapper.is_rules_kw_all_valid = is_valid
-                if is_valid == False and self._is_opt_return() == True:
-                    return self._opt_return
-            return func(*args, **kwargs)
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # arg_info is resolved once into a checker for each key that has rules.
+        checkers = []
+        for key in self._arg_index.keys():
+            rules = self._get_rules(key=key)
+            if len(rules) == 0:
+                continue
+            checkers.append((key, self._get_checker(rules=rules)))
+        self._checkers: Tuple[Tuple[str, RuleChecker]] = tuple(checkers)
+        self._select_plan = self._get_select_plan(keys=self._arg_index.keys())
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        is_valid = True
+        arg_name_values = self._get_selected_args(ctx=ctx, plan=self._select_plan)
+        add_attrib = None
+        for key, rc in self._checkers:
+            if key in arg_name_values:
+                value = arg_name_values[key]
+                if add_attrib is None:
+                    add_attrib = not rc.raise_error
+                is_valid = False
+                try:
+                    is_valid = rc._validate_rules_all(key=key, field=key, value=value)
+                except RuleError as err:
+                    if self._is_opt_return():
+                        return self._opt_return
+                    err_rule = self._get_err(e=err)
+                    self._log_err(err=err_rule)
+                    raise err_rule
+                if is_valid is False:
+                    break
+        if add_attrib:
+            wrapper.is_rules_kw_all_valid = is_valid
+            if is_valid == False and self._is_opt_return() == True:
+                return self._opt_return
+        return NO_THING
+
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._raise_error is False:
             wrapper.is_rules_kw_all_valid = True
-        return wrapper
 
 
 class RuleCheckAnyKw(RuleCheckAllKw):
@@ -1783,44 +2925,38 @@ class RuleCheckAnyKw(RuleCheckAllKw):
         :doc:`../../usage/Decorator/RuleCheckAnyKw`
     """
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _get_checker(self, rules: Iterable[IRule]) -> RuleChecker:
+        return RuleChecker._get_shared(rules_any=rules, **self._kwargs)
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        is_valid = True
+        arg_name_values = self._get_selected_args(ctx=ctx, plan=self._select_plan)
+        add_attrib = None
+        for key, rc in self._checkers:
+            if key in arg_name_values:
+                value = arg_name_values[key]
+                if add_attrib is None:
+                    add_attrib = not self._raise_error
+                is_valid = False
+                try:
+                    is_valid = rc._validate_rules_any(key=key, field=key, value=value)
+                except RuleError as err:
+                    if self._is_opt_return():
+                        return self._opt_return
+                    err_rule = self._get_err(e=err)
+                    self._log_err(err=err_rule)
+                    raise err_rule
+                if is_valid is False:
+                    break
+        if add_attrib:
+            wrapper.is_rules_any_valid = is_valid
+            if is_valid == False and self._is_opt_return() == True:
+                return self._opt_return
+        return NO_THING
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            is_valid = True
-            arg_name_values = self._get_args_dict()
-            arg_keys = arg_name_values.keys()
-            add_attrib = None
-            for key in self._arg_index.keys():
-                if key in arg_keys:
-                    rules = self._get_rules(key=key)
-                    if len(rules) == 0:
-                        continue
-                    value = arg_name_values[key]
-                    rc = RuleChecker(rules_any=rules, **self._kwargs)
-                    if add_attrib is None:
-                        add_attrib = not self._raise_error
-                    is_valid = False
-                    try:
-                        is_valid = rc.validate_any(**{key: value})
-                    except RuleError as err:
-                        if self._is_opt_return():
-                            return self._opt_return
-                        err_rule = self._get_err(e=err)
-                        self._log_err(err=err_rule)
-                        raise err_rule
-                    if is_valid is False:
-                        break
-            if add_attrib:
-                wrapper.is_rules_any_valid = is_valid
-                if is_valid == False and self._is_opt_return() == True:
-                    return self._opt_return
-            return func(*args, **kwargs)
+    def _wrapper_setup(self, wrapper: callable) -> None:
         if self._raise_error is False:
             wrapper.is_rules_any_valid = True
-        return wrapper
 
 
 class RequireArgs(_DecBase):
@@ -1852,24 +2988,29 @@ class RequireArgs(_DecBase):
             if isinstance(arg, str):
                 self._args.append(arg)
 
-    def __call__(self, func):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_args_dict()
-            arg_keys = arg_name_values.keys()
-            for key in self._args:
-                if not key in arg_keys:
-                    if self._is_opt_return():
-                        return self._opt_return
-                    ex = ValueError(
-                        f"'{func.__name__}', '{key}' is a required arg.")
-                    self._log_err(err=ex)
-                    raise ex
-            return func(*args, **kwargs)
-        return wrapper
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # named args of function are always present, only keys of **kwargs are checked on each call.
+        self._select_plan = self._get_select_plan(keys=self._args)
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        plan = self._select_plan
+        if plan is not None and plan.is_bound(ctx.args, ctx.kwargs):
+            arg_keys = ctx.kwargs
+            keys = plan.dynamic_keys
+        else:
+            # binding all args raises error for missing args.
+            arg_keys = self._get_ctx_inst_info(ctx).get_view_all()
+            keys = self._args
+        for key in keys:
+            if not key in arg_keys:
+                if self._is_opt_return():
+                    return self._opt_return
+                ex = ValueError(
+                    f"'{self.fn.__name__}', '{key}' is a required arg.")
+                self._log_err(err=ex)
+                raise ex
+        return NO_THING
 
 
 class DefaultArgs(_CommonBase):
@@ -2154,85 +3295,91 @@ class SubClass(_DecBase):
         return result
 
     def _get_inst(self, types: Iterable[type]):
-        return SubClassChecker(*types, **self._kwargs)
+        # ensure errors are raised if not valid
+        return SubClassChecker._get_shared(*types, **{**self._kwargs, 'raise_error': True})
+
+    def _get_wrapper(self, func: callable, slot: Optional["_SampleSlot"] = None) -> callable:
+        # fallback is only built when wrapper is generated and only called by it after call is sampled.
+        gen_wrapper = self._get_gen_wrapper(func=func, get_fallback=functools.partial(super()._get_wrapper, func=func), slot=slot)
+        if gen_wrapper is None:
+            return super()._get_wrapper(func=func, slot=slot)
+        return gen_wrapper
+
+    def _get_gen_wrapper(self, func: callable, get_fallback: callable, slot: Optional["_SampleSlot"] = None) -> Optional[callable]:
+        if self._opt_args_filter & DecArgEnum.All_ARGS != DecArgEnum.All_ARGS:
+            return None
+        gen = _WrapperCodeGen(fninfo=self._get_fn_info())
+        if not gen.is_supported():
+            return None
+        checkers = [checker for _, checker in self._checkers]
+
+        def get_cond(var: str, index: int) -> str:
+            # class values are not plain instances and are always validated by fallback.
+            return gen.get_subclass_cond(var=var, types=checkers[index].types)
+
+        def is_default_valid(index: int, value: object) -> bool:
+            sc = checkers[index]
+            return SubClassChecker(*sc.types, opt_inst_only=sc.instance_only,
+                                   raise_error=False).validate(value)
+        if not gen.add_position_checks(type_count=len(self._types), all_args=self._all_args,
+                                       get_cond=get_cond, is_default_valid=is_default_valid):
+            return None
+        return gen.build(func=func, fallback=get_fallback(), dec_name=self.__class__.__name__, slot=slot)
+
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # one checker for each position, last checker is also used for remaining args
+        # when opt_all_args is True. Checkers are created once and reused on each call.
+        self._checkers: Tuple[Tuple[Union[Tuple[type], Set[type]], SubClassChecker]] = tuple(
+            (types, self._get_inst(types=types)) for types in self._types)
 
     def _validate(self, key: str, value: object, types: Iterable[type], arg_index: int, inst: SubClassChecker = None):
         if inst is None:
             sc = self._get_inst(types=types)
         else:
             sc = inst
-        # ensure errors are raised if not valid
-        sc.raise_error = True
-        if Formatter.is_star_num(name=key):
-            try:
-                sc.validate(value)
-            except TypeError:
-                if self._is_opt_return():
-                    return self._opt_return
-                ex = TypeError(self._get_err_msg(name=None, value=value,
-                                                  types=types, arg_index=arg_index))
-                self._log_err(err=ex)
-                raise ex
-        else:
-            try:
-                sc.validate(**{key: value})
-            except TypeError:
+        try:
+            sc.validate(value)
+        except TypeError:
+            if self._is_opt_return():
+                return self._opt_return
+            name = None if Formatter.is_star_num(name=key) else key
+            ex = TypeError(self._get_err_msg(name=name, value=value,
+                                              types=types, arg_index=arg_index))
+            self._log_err(err=ex)
+            raise ex
+        return NO_THING
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_filtered_args_dict(
+            self._opt_args_filter, ctx=ctx)
+        checkers = self._checkers
+        if self._all_args is False:
+            if len(arg_name_values) != len(checkers):
                 if self._is_opt_return():
                     return self._opt_return
-                ex = TypeError(self._get_err_msg(name=key, value=value,
-                                                  types=types, arg_index=arg_index))
+                msg = 'Invalid number of arguments for {0}()'.format(
+                    self.fn.__name__)
+                msg = msg + self._get_class_dec_err()
+                ex = ValueError(msg)
                 self._log_err(err=ex)
                 raise ex
+        last = len(checkers) - 1
+        i = 0
+        for key, value in arg_name_values.items():
+            # this only happens when _all_args is True
+            # at this point remain args should match last type in self._types
+            if i > last:
+                types, sc = checkers[last]
+            else:
+                types, sc = checkers[i]
+            result = self._validate(key=key, value=value,
+                                    types=types, arg_index=i, inst=sc)
+            if not result is NO_THING:
+                return result
+            i += 1
         return NO_THING
 
-    def __call__(self, func: callable):
-        super()._call_init(func=func)
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_filtered_args_dict(
-                self._opt_args_filter)
-            arg_keys = list(arg_name_values.keys())
-            arg_keys_len = arg_keys.__len__()
-            if self._all_args is False:
-                if arg_keys_len is not len(self._types):
-                    if self._is_opt_return():
-                        return self._opt_return
-                    msg = 'Invalid number of arguments for {0}()'.format(
-                        func.__name__)
-                    msg = msg + self._get_class_dec_err()
-                    ex = ValueError(msg)
-                    self._log_err(err=ex)
-                    raise ex
-            arg_type = zip(arg_keys, self._types)
-            i = 0
-            for arg_info in arg_type:
-                key = arg_info[0]
-                result = self._validate(key=key,
-                                        value=arg_name_values[key],
-                                        types=arg_info[1], arg_index=i)
-                if not result is NO_THING:
-                    return result
-                i += 1
-            if arg_keys_len > i:
-                # this only happens when _all_args is True
-                # at this point remain args should match last last type in self._types
-                r_args = arg_keys[i:]
-                types = self._types[len(self._types) - 1]  # tuple or set
-                sc = self._get_inst(types=types)
-                for r_arg in r_args:
-                    result = self._validate(key=r_arg,
-                                            value=arg_name_values[r_arg],
-                                            types=types, arg_index=i,
-                                            inst=sc)
-                    if not result is NO_THING:
-                        return result
-                    i += 1
-
-            return func(*args, **kwargs)
-        return wrapper
-
     def _get_err_msg(self, name: Union[str, None], value: object, types: Iterator[type], arg_index: int):
         str_types = self._get_formated_types(types=types)
         str_ord = Formatter.get_ordinal(arg_index + 1)
@@ -2303,33 +3450,116 @@ class SubClasskKw(_DecBase):
             # make iterable
             return (value,)
 
-    def __call__(self, func):
-        super()._call_init(func=func)
+    def _call_init(self, **kwargs):
+        super()._call_init(**kwargs)
+        # arg_info is resolved once into a checker for each key that has types.
+        checkers = []
+        for key in self._arg_index.keys():
+            types = self._get_types(key=key)
+            if len(types) == 0:
+                continue
+            checkers.append((key, SubClassChecker._get_shared(*types, **self._kwargs)))
+        self._checkers: Tuple[Tuple[str, SubClassChecker]] = tuple(checkers)
+        self._select_plan = self._get_select_plan(keys=self._arg_index.keys())
+
+    def _pre_check(self, ctx: _CallContext, wrapper: callable) -> object:
+        arg_name_values = self._get_selected_args(ctx=ctx, plan=self._select_plan)
+        for key, sc in self._checkers:
+            if key in arg_name_values:
+                value = arg_name_values[key]
+                try:
+                    # error_raise is always True for sc.
+                    # for this reason no need to capture results of validate.
+                    sc._validate_subclass(value=value, key=key)
+                except TypeError as e:
+                    if self._is_opt_return():
+                        return self._opt_return
+                    msg = str(e)
+                    msg = msg + self._get_class_dec_err()
+                    ex = TypeError(msg)
+                    self._log_err(err=ex)
+                    raise ex
+        return NO_THING
+
+
+class Validate(object):
+    """
+    Decorator that combines decorators into a single decorator.
+
+    Wrapped function arguments are bound once per call and shared by all decorators.
+    Decorators are applied in the same order as stacking them on the function would apply them.
+    Validation results and errors are the same as when decorators are stacked.
+
+    Example:
+        .. code-block:: python
+
+            @Validate(
+                RequireArgs("speed", "limit"),
+                TypeCheckKw(arg_info={"speed": 0, "limit": 0}, types=[(int, float)]),
+                ReturnType(str)
+            )
+            def speed_msg(**kwargs) -> str:
+                ...
+
+    See Also:
+        :doc:`../../usage/Decorator/Validate`
+    """
+
+    def __init__(self, *args: _DecBase):
+        """
+        Constructor
+
+        Other Parameters:
+            args (_DecBase): One or more decorators such as ``TypeCheck``, ``RuleCheckAll``, ``ReturnType``.
+                First decorator is the outer most decorator.
+
+        Raises:
+            TypeError: If any arg is not a decorator that can be combined.
+        """
+        for i, arg in enumerate(args):
+            if not isinstance(arg, _DecBase):
+                msg = f"{self.__class__.__name__} requires {Formatter.get_ordinal(i + 1)} arg to be a decorator such as 'TypeCheck' or 'RuleCheckAll'. Got '{type(arg).__name__}'."
+                raise TypeError(msg)
+        self._decorators: Tuple[_DecBase] = tuple(args)
+
+    def __call__(self, func: callable) -> callable:
+        decorators = self._decorators
+        if _strip_mode:
+            return _get_strip_wrapper(func=func, setup_fns=[dec._wrapper_setup for dec in reversed(decorators)])
+        for dec in decorators:
+            dec._call_init(func=func)
+        pre = tuple(dec for dec in decorators if dec._has_pre_check())
+        # when a pre check returns early only decorators before it run post check.
+        post = tuple((i, dec) for i, dec in reversed(tuple(enumerate(decorators)))
+                     if dec._has_post_check())
+        index = {id(dec): i for i, dec in enumerate(decorators)}
+        count = len(decorators)
+        slot = _SampleSlot(func=func)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            self._wrapper_init(args=args, kwargs=kwargs)
-            arg_name_values = self._get_args_dict()
-            arg_keys = arg_name_values.keys()
-            sc = False
-            for key in self._arg_index.keys():
-                if key in arg_keys:
-                    types = self._get_types(key=key)
-                    if len(types) == 0:
-                        continue
-                    value = arg_name_values[key]
-                    sc = SubClassChecker(*types, **self._kwargs)
-                    try:
-                        # error_raise is always True for sc.
-                        # for this reason no need to capture results of validate.
-                        sc.validate(**{key: value})
-                    except TypeError as e:
-                        if self._is_opt_return():
-                            return self._opt_return
-                        msg = str(e)
-                        msg = msg + self._get_class_dec_err()
-                        ex = TypeError(msg)
-                        self._log_err(err=ex)
-                        raise ex
-            return func(*args, **kwargs)
+            if _sample_registry.active and slot.is_skipped():
+                return func(*args, **kwargs)
+            stop = count
+            result = NO_THING
+            if pre:
+                ctx = _CallContext(args=args, kwargs=kwargs)
+                for dec in pre:
+                    result = dec._pre_check(ctx=ctx, wrapper=wrapper)
+                    if not result is NO_THING:
+                        stop = index[id(dec)]
+                        break
+            if result is NO_THING:
+                result = func(*args, **kwargs)
+            for i, dec in post:
+                if i < stop:
+                    result = dec._post_check(return_value=result, wrapper=wrapper)
+            return result
+        for dec in reversed(decorators):
+            dec._wrapper_setup(wrapper=wrapper)
         return wrapper
+
+    @property
+    def decorators(self) -> Tuple[_DecBase]:
+        """Gets decorators of this instance"""
+        return self._decorators
@@ -1,8 +1,8 @@
 # region Custom Errors
-from inspect import isclass
-from typing import Iterable, List, Type, Union
+from typing import Iterable, List, Type, Union, TYPE_CHECKING
 from ..helper import is_iterable
-from ..rules import IRule
+if TYPE_CHECKING:
+    from ..rules import IRule
 
 class CancelEventError(Exception):
     '''Cancel Event Error'''
@@ -33,14 +33,20 @@ class RuleError(Exception):
         """
         self._fn_name = kwargs.get('fn_name', None)
         self._err_rule = kwargs.get('err_rule', None)
-        _rules = kwargs.get('rules_all', False)
-        self._rules_all = self._get_rules(_rules)
-        _rules = kwargs.get('rules_any', False)
-        self._rules_any = self._get_rules(_rules)
-        _rules = None
+        # rules and message are only processed when they are read.
+        # errors are often caught and discarded such as when any rule of a list is to match.
+        self._raw_rules_all = kwargs.get('rules_all', False)
+        self._rules_all = None
+        self._raw_rules_any = kwargs.get('rules_any', False)
+        self._rules_any = None
         self._arg_name = kwargs.get('arg_name', None)
         self._errors = kwargs.get('errors', None)
         self._msg = kwargs.get('msg', None)
+        self._message = None
+        super().__init__()
+
+    # region Message
+    def _get_message(self) -> str:
         msg = "RuleError:"
         if self._fn_name:
             msg = msg + f" '{self._fn_name}' error."
@@ -48,32 +54,71 @@ class RuleError(Exception):
             msg = msg + f" Argument: '{self._arg_name}' failed validation."
         if self.err_rule and self._is_rule(self.err_rule):
             msg = msg + f"\nRule '{self.err_rule.__name__}' Failed validation."
-        if len(self._rules_all) > 0:
-            if len(self._rules_all) == 1:
+        rules_all = self.rules_all
+        if len(rules_all) > 0:
+            if len(rules_all) == 1:
                 msg = msg + "\nExpected the following rule to match: "
             else:
                 msg = msg + "\nExpected all of the following rules to match: "
-            msg = msg + self._get_rules_str(self._rules_all) + "."
-        if len(self._rules_any) > 0:
-            if len(self._rules_any) == 1:
+            msg = msg + self._get_rules_str(rules_all) + "."
+        rules_any = self.rules_any
+        if len(rules_any) > 0:
+            if len(rules_any) == 1:
                 msg = msg + "\nExpected the following rule to match: "
             else:
                 msg = msg + "\nExpected at least one of the following rules to match: "
-            msg = msg + self._get_rules_str(self._rules_any) + "."
+            msg = msg + self._get_rules_str(rules_any) + "."
         if self._msg:
             msg = msg + '\n' + str(self._msg)
         if self._is_errors() is True:
             msg = msg + "\nInner Error Message: " + self._get_inner_error_msg()
-        self.message = msg
-        super().__init__(self.message)
+        return msg
+
+    @property
+    def message(self) -> str:
+        """
+        Error message. Message is created when first read.
+
+        :getter: Gets error message
+        :setter: Sets error message
+        """
+        if self._message is None:
+            self._message = self._get_message()
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = str(value)
+
+    @property
+    def args(self) -> tuple:
+        """Gets args of exception. Contains :py:attr:`~.RuleError.message`"""
+        return (self.message,)
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        value = tuple(value)
+        self._message = str(value[0]) if len(value) == 1 else str(value)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.message!r})"
+
+    def __reduce__(self):
+        return (_rebuild_rule_error, (self.__class__, self._get_kwargs(), self._message))
+    # endregion Message
 
     # region private methods
     def _is_rule(self, rule) -> bool:
-        if isclass(rule) and issubclass(rule, IRule):
+        # rules are loaded by the time a rule error is created.
+        from ..rules import IRule
+        if isinstance(rule, type) and issubclass(rule, IRule):
             return True
         return False
 
-    def _get_rules(self, rules: Iterable[IRule]) -> List[IRule]:
+    def _get_rules(self, rules: Iterable['IRule']) -> List['IRule']:
         result = []
         if rules and is_iterable(rules):
             for rule in rules:
@@ -81,7 +126,7 @@ class RuleError(Exception):
                     result.append(rule)
         return result
 
-    def _get_rules_str(self, rules: List[IRule]) -> str:
+    def _get_rules_str(self, rules: List['IRule']) -> str:
         msg = ""
         for i, rule in enumerate(rules):
             if i > 0:
@@ -120,7 +165,7 @@ class RuleError(Exception):
         return self._msg
 
     @property
-    def err_rule(self) -> Union[Type[IRule], None]:
+    def err_rule(self) -> Union[Type['IRule'], None]:
         """Gets rule that caused exception."""
         return self._err_rule
 
@@ -130,13 +175,19 @@ class RuleError(Exception):
         return self._errors
 
     @property
-    def rules_all(self) -> List[Type[IRule]]:
+    def rules_all(self) -> List[Type['IRule']]:
         """Gets list of rules that were to all be matched."""
+        if self._rules_all is None:
+            self._rules_all = self._get_rules(self._raw_rules_all)
+            self._raw_rules_all = None
         return self._rules_all
 
     @property
-    def rules_any(self) -> List[Type[IRule]]:
+    def rules_any(self) -> List[Type['IRule']]:
         """Gets of rules that required one or more matches."""
+        if self._rules_any is None:
+            self._rules_any = self._get_rules(self._raw_rules_any)
+            self._raw_rules_any = None
         return self._rules_any
     
     @property
@@ -159,16 +210,27 @@ class RuleError(Exception):
         Returns:
             RuleError: New RuleError instance with updated properties included in ``**kwargs``.
         """
-        rule_dict = {
-            "err_rule": rule_error.err_rule,
-            "rules_all": rule_error.rules_all,
-            "rules_any": rule_error.rules_any,
-            "arg_name": rule_error.arg_name,
-            "errors": rule_error.errors,
-            "fn_name": rule_error.fn_name,
-            "msg": rule_error.msg
-        }
+        rule_dict = rule_error._get_kwargs()
         rule_dict.update({**kwargs})
         return RuleError(**rule_dict)
     # endregion Static Methods
+
+    def _get_kwargs(self) -> dict:
+        return {
+            "err_rule": self.err_rule,
+            "rules_all": self.rules_all,
+            "rules_any": self.rules_any,
+            "arg_name": self.arg_name,
+            "errors": self.errors,
+            "fn_name": self.fn_name,
+            "msg": self.msg
+        }
+
+
+def _rebuild_rule_error(cls: type, kwargs: dict, message: Union[str, None]) -> RuleError:
+    # used to unpickle RuleError
+    err = cls(**kwargs)
+    if message is not None:
+        err.message = message
+    return err
 # endregion Custom Errors
@@ -1,7 +1,7 @@
 # coding: utf-8
-from inspect import isclass
 import re
-from typing import Iterable, List, Optional, Iterator
+import weakref
+from typing import Dict, Iterable, List, Optional, Iterator, Tuple
 
 class Singleton(type):
     """Singleton abstrace class"""
@@ -18,6 +18,44 @@ class Singleton(type):
 class NoThing(metaclass=Singleton):
     '''Singleton Class to mimic null'''
 
+class _StarKey(str):
+    """
+    Key of a positional arg in format of ``'*#'``, eg: ``'*0'``, ``'*1'``.
+
+    Equal to and has the same hash as a plain ``str`` key. Position of arg is kept in ``index``
+    so key does not need to be parsed. Keys of the first ``_MAX_CACHED`` positions are created once on import
+    and reused. Keys are read only after import so they can be shared by threads without a lock.
+    """
+    _MAX_CACHED = 1024
+    _keys: Tuple["_StarKey", ...] = ()
+
+    def __new__(cls, index: int):
+        obj = super().__new__(cls, "*" + str(index))
+        obj.index = index
+        return obj
+
+    def __getnewargs__(self):
+        return (self.index,)
+
+    @staticmethod
+    def get(index: int) -> "_StarKey":
+        """
+        Gets key for a position.
+
+        Args:
+            index (int): Position of arg. Must be zero or more.
+
+        Returns:
+            _StarKey: key of position.
+        """
+        if index < _StarKey._MAX_CACHED:
+            return _StarKey._keys[index]
+        return _StarKey(index)
+
+
+_StarKey._keys = tuple(_StarKey(i) for i in range(_StarKey._MAX_CACHED))
+
+
 class Formatter:
     """String Fromat Methods"""
     _rx_star = re.compile("^\*(\d*)$")
@@ -36,8 +74,12 @@ class Formatter:
         Returns:
             bool: ``True`` if ``arg_name`` is a match; Otherwise, ``False``
         """
+        if type(name) is _StarKey:
+            return True
         if not isinstance(name, str):
             raise TypeError("'is_star_num()' error, arg 'name` must be of type `str`")
+        if name[:1] != "*":
+            return False
         m = Formatter._rx_star.match(name)
         if m:
             return True
@@ -54,6 +96,8 @@ class Formatter:
         Returns:
             str: [str in format of ``'*#'``
         """
+        if type(num) is int and num >= 0:
+            return _StarKey.get(num)
         return "*" + str(num)
 
     @staticmethod
@@ -154,6 +198,72 @@ Singleton Class instance that represents null object.
 """
 
 
+# region Type classification
+# type of a value is classified once and cached so that values can be classified
+# without raising and catching errors.
+_TYPE_PLAIN = 1
+_TYPE_NOT_ITERABLE = 2
+_TYPE_FLAGS_MAX_SIZE = 256
+# id() of type to weak reference of type and its flags. At most _TYPE_FLAGS_MAX_SIZE types,
+# types are not kept alive and their entry is removed when they are garbage collected.
+_type_flags: Dict[int, Tuple[weakref.ref, int]] = {}
+
+
+def _get_type_flags(tp: type) -> int:
+    entry = _type_flags.get(id(tp), None)
+    if entry is not None:
+        return entry[1]
+    flags = 0
+    # isinstance(obj, obj) raises TypeError for instances of a plain type.
+    # types, tuples, types with __instancecheck__ or __bases__ are tested by isinstance(obj, obj).
+    if not issubclass(tp, (type, tuple)):
+        flags = _TYPE_PLAIN
+        for t in tp.__mro__:
+            t_vars = vars(t)
+            if '__instancecheck__' in t_vars or '__bases__' in t_vars:
+                flags = 0
+                break
+    if not hasattr(tp, '__iter__') and not hasattr(tp, '__getitem__'):
+        flags |= _TYPE_NOT_ITERABLE
+    if len(_type_flags) >= _TYPE_FLAGS_MAX_SIZE:
+        # first in first out. Bounds cache when classes are created dynamically.
+        # iteration fails when another thread changes cache.
+        try:
+            del _type_flags[next(iter(_type_flags))]
+        except (StopIteration, RuntimeError, KeyError):
+            pass
+    tp_id = id(tp)
+    _type_flags[tp_id] = (weakref.ref(tp, lambda _, tp_id=tp_id: _type_flags.pop(tp_id, None)), flags)
+    return flags
+
+
+def _is_plain_type(tp: type) -> bool:
+    """Gets if instances of ``tp`` are never classes"""
+    return bool(_get_type_flags(tp) & _TYPE_PLAIN)
+
+
+def _is_instance(obj: object) -> bool:
+    """Gets if ``obj`` is an instance rather then a class"""
+    if _get_type_flags(type(obj)) & _TYPE_PLAIN:
+        return True
+    # when obj is instance then isinstance(obj, obj) raises TypeError
+    # when obj is not instance then isinstance(obj, obj) return False
+    try:
+        if not isinstance(obj, obj):
+            return False
+    except TypeError:
+        pass
+    return True
+
+
+def _get_type(obj: object) -> type:
+    """Gets ``obj`` if it is a class; Otherwise, type of ``obj``"""
+    if _is_instance(obj):
+        return type(obj)
+    return obj
+# endregion Type classification
+
+
 def _is_iterable_excluded(arg: object, excluded_types: Iterable) -> bool:
     try:
         isinstance(iter(excluded_types), Iterator)
@@ -163,22 +273,13 @@ def _is_iterable_excluded(arg: object, excluded_types: Iterable) -> bool:
     if len(excluded_types) == 0:
         return False
 
-    def _is_instance(obj: object) -> bool:
-        # when obj is instance then isinstance(obj, obj) raises TypeError
-        # when obj is not instance then isinstance(obj, obj) return False
-        try:
-            if not isinstance(obj, obj):
-                return False
-        except TypeError:
-            pass
-        return True
     ex_types = excluded_types if isinstance(excluded_types, tuple) else tuple(excluded_types)
     arg_instance = _is_instance(arg)
     if arg_instance is True:
         if isinstance(arg, ex_types):
             return True
         return False
-    if isclass(arg) and issubclass(arg, ex_types):
+    if isinstance(arg, type) and issubclass(arg, ex_types):
         return True
     return arg in ex_types
  
@@ -230,6 +331,8 @@ def is_iterable(arg: object, excluded_types: Iterable[type]=(str,)) -> bool:
     """
     # if isinstance(arg, str):
     #     return False
+    if _get_type_flags(type(arg)) & _TYPE_NOT_ITERABLE:
+        return False
     result = False
     try:
         result = isinstance(iter(arg), Iterator)
@@ -1,5 +1,4 @@
 # coding: utf-8
-from kwhelp.rules import RuleAttrExist
 from typing import Optional
 from abc import ABC, abstractmethod
 # region class HelperBase
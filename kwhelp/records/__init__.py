@@ -0,0 +1,388 @@
+# coding: utf-8
+import os
+import sys
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .. import AssignBuilder, HelperArgs
+from ..helper import NO_THING
+from ..checks import TypeChecker
+from ..rules import _get_rule_checks, _validate_checks_any
+from ..exceptions import RuleError
+
+RecordResult = namedtuple('RecordResult', ['index', 'valid', 'values', 'key', 'error'])
+"""
+Result of validating a record.
+
+``index`` is position of record in records. ``valid`` is ``True`` if record is valid.
+``values`` is a dictionary of validated values of record keys, including defaults, when record is valid;
+Otherwise, ``None``. ``key`` is key that is not valid; Otherwise, ``None``.
+``error`` is error that explains why record is not valid if any; Otherwise, ``None``.
+"""
+
+BatchResult = namedtuple('BatchResult', ['total', 'failed', 'first', 'mask', 'invalid'])
+"""
+Result of validating a batch of records.
+
+``total`` is number of records validated. ``failed`` is number of records that are not valid.
+``first`` is index of first record that is not valid; Otherwise, ``None``.
+``mask`` is a ``bytearray`` with ``1`` for each valid record and ``0`` for each record that is not valid
+when requested; Otherwise, ``None``.
+``invalid`` is a list of :py:data:`RecordResult` of records that are not valid in order of records.
+"""
+
+# region class _RecordField
+
+
+class _RecordField:
+    """Validation of a key of a record. Built once from a ``HelperArgs``"""
+    __slots__ = ('key', 'field', 'require', 'default', 'types',
+                 'type_checker', 'rules_all', 'checks_all', 'rules_any', 'checks_any')
+
+    def __init__(self, helper: HelperArgs, field_prefix: str, type_instance_check: bool):
+        self.key: str = helper.key
+        self.field: str = helper.field if helper.field else f"{field_prefix}{helper.key}"
+        self.require: bool = helper.require
+        self.default: object = helper.default
+        self.types = tuple(helper.types)
+        if len(self.types) > 0:
+            self.type_checker = TypeChecker(
+                *self.types, raise_error=False, type_instance_check=type_instance_check)
+        else:
+            self.type_checker = None
+        self.rules_all = helper.rules_all
+        self.rules_any = helper.rules_any
+        self.checks_all = _get_rule_checks(self.rules_all)
+        self.checks_any = _get_rule_checks(self.rules_any)
+        for _, check in self.checks_all + self.checks_any:
+            if check is None:
+                raise TypeError('Rules must implement IRule')
+
+# endregion class _RecordField
+
+# region class RecordValidator
+
+
+class RecordValidator:
+    """
+    Validates records such as rows of a csv or json lines file against an ``AssignBuilder``.
+
+    Records are validated with the same rules as :py:meth:`.KwargsHelper.assign`,
+    without creating an object and a :py:class:`~.KwargsHelper` for each record.
+    Schema of ``AssignBuilder`` is read once when validator is created.
+
+    A value that fails rules makes record not valid, even if its key is not required.
+    """
+
+    def __init__(self, builder: AssignBuilder, **kwargs):
+        """
+        Constructor
+
+        Args:
+            builder (AssignBuilder): schema of records.
+
+        Keyword Arguments:
+            field_prefix (str, optional): prefix of field name passed to rules of keys that do not have a ``field``.
+                Default ``_``.
+            name (str, optional): name used in error messages. Default ``record``.
+            rule_error (bool, optional): If ``True`` then rules that fail return error that explains
+                the failure in :py:class:`RecordResult`. Default ``True``.
+            type_instance_check (bool, optional): If ``True`` then values are tested also for isinstance
+                rather then just type check. Default ``True``.
+            originator (object, optional): object passed to rules as originator. Default ``None``.
+
+        Raises:
+            TypeError: if ``builder`` is not instance of ``AssignBuilder``.
+            TypeError: if a rule does not implement ``IRule``.
+        """
+        if not isinstance(builder, AssignBuilder):
+            raise TypeError(
+                f"{self.__class__.__name__}.__init__() arg 'builder' is expecting type of 'AssignBuilder'. Got type of '{type(builder).__name__}'")
+        # compact description of schema used to rebuild validator in worker processes.
+        self._schema: Tuple[dict] = tuple(helper.to_dict() for helper in builder)
+        self._kwargs: Dict[str, object] = kwargs
+        self._name: str = str(kwargs.get('name', 'record'))
+        self._rule_error: bool = bool(kwargs.get('rule_error', True))
+        self._originator: object = kwargs.get('originator', None)
+        field_prefix = str(kwargs.get('field_prefix', '_'))
+        type_instance_check = bool(kwargs.get('type_instance_check', True))
+        self._fields: Tuple[_RecordField] = tuple(
+            _RecordField(helper, field_prefix, type_instance_check) for helper in builder)
+
+    def __reduce__(self):
+        # rules and checkers are resolved again from schema when unpickled.
+        return (_rebuild_validator, (self._schema, self._kwargs))
+
+    # region internal validation methods
+    def _get_type_error(self, fld: _RecordField, value: object) -> TypeError:
+        # same message as KwargsHelper.assign()
+        types = ' | '.join(str(t) for t in fld.types)
+        return TypeError(
+            f"{self._name} arg '{fld.key}' is expected to be of '{types}' but got '{type(value).__name__}'")
+
+    def _validate_rules_all(self, fld: _RecordField, value: object) -> bool:
+        # results are combined the same as KwargsHelper so a rule gets the same verdict in both.
+        result = True
+        for rule, check in fld.checks_all:
+            try:
+                result = result & check(value, fld.key, fld.field, self._originator, self._rule_error)
+            except Exception as e:
+                raise RuleError(
+                    err_rule=rule, rules_all=fld.rules_all, arg_name=fld.key, errors=e) from e
+            if result is False:
+                break
+        return bool(result)
+
+    def _validate_rules_any(self, fld: _RecordField, value: object) -> bool:
+        if len(fld.checks_any) == 0:
+            return True
+        result, failed = _validate_checks_any(
+            fld.checks_any, value, fld.key, fld.field, self._originator, self._rule_error)
+        if result is False and self._rule_error is True:
+            error_lst = [r.error for r in failed if r.error is not None]
+            if len(error_lst) > 0:
+                failed_rules = [r.rule for r in failed if r.error is not None]
+                raise RuleError(rules_any=fld.rules_any,
+                                err_rule=failed_rules[0], arg_name=fld.key, errors=error_lst) from error_lst[0]
+        return result
+
+    # endregion internal validation methods
+
+    def validate(self, record: Mapping, index: int = 0) -> RecordResult:
+        """
+        Validates a record.
+
+        Args:
+            record (Mapping): key, value pairs of record such as a ``dict``.
+            index (int, optional): index of record that is included in result. Default ``0``.
+
+        Returns:
+            RecordResult: result of validation. Errors are returned in result and never raised.
+        """
+        if not isinstance(record, Mapping):
+            return RecordResult(index, False, None, None, TypeError(
+                f"{self._name} is expecting type of 'Mapping'. Got type of '{type(record).__name__}'"))
+        values = {}
+        fld = None
+        try:
+            for fld in self._fields:
+                if fld.key in record:
+                    value = record[fld.key]
+                    if fld.type_checker is not None and not fld.type_checker._is_type_valid(fld.key, value):
+                        raise self._get_type_error(fld, value)
+                elif fld.default is not NO_THING:
+                    value = fld.default
+                elif fld.require:
+                    # only test for required when default is not included
+                    raise ValueError(f"{self._name} arg '{fld.key}' is required")
+                else:
+                    continue
+                if not self._validate_rules_all(fld, value) or not self._validate_rules_any(fld, value):
+                    return RecordResult(index, False, None, fld.key, None)
+                values[fld.key] = value
+        except (TypeError, ValueError, RuleError) as e:
+            return RecordResult(index, False, None, fld.key, e)
+        return RecordResult(index, True, values, None, None)
+
+    def validate_records(self, records: Iterable[Mapping]) -> Iterator[RecordResult]:
+        """
+        Validates records one at a time.
+
+        Records are read from ``records`` only when next result is requested.
+
+        Args:
+            records (Iterable[Mapping]): records such as a generator of ``dict`` read from a json lines file.
+
+        Yields:
+            RecordResult: result of each record in order of ``records``.
+        """
+        validate = self.validate
+        for i, record in enumerate(records):
+            yield validate(record, i)
+
+    def _validate_chunk(self, records: List[Mapping], start: int, fail_fast: bool, mask: bool) -> BatchResult:
+        result_mask = bytearray() if mask else None
+        invalid = []
+        total = 0
+        for i, record in enumerate(records, start):
+            result = self.validate(record, i)
+            total += 1
+            if result_mask is not None:
+                result_mask.append(1 if result.valid else 0)
+            if not result.valid:
+                invalid.append(result)
+                if fail_fast:
+                    break
+        first = invalid[0].index if invalid else None
+        return BatchResult(total, len(invalid), first, result_mask, invalid)
+
+    def validate_batch(self, records: Iterable[Mapping], chunk_size: int = 1000, fail_fast: bool = False, mask: bool = False, max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Validates records in chunks using a pool of worker processes.
+
+        Chunks are read from ``records`` as workers are ready for them and results of chunks are merged
+        in order of records, so result is the same for any number of workers.
+
+        Rules of schema and ``originator`` must be picklable, such as built in rules or rules
+        that are defined at module level.
+
+        Args:
+            records (Iterable[Mapping]): records to validate.
+            chunk_size (int, optional): number of records sent to a worker at a time. Default ``1000``.
+            fail_fast (bool, optional): If ``True`` then validation stops at first record that is not valid.
+                Default ``False``.
+            mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+            max_workers (int, optional): max number of worker processes.
+                Default ``None`` which uses number of processors.
+
+        Raises:
+            ValueError: if ``chunk_size`` is less than ``1``.
+
+        Returns:
+            BatchResult: merged result of all chunks.
+        """
+        if chunk_size < 1:
+            raise ValueError(
+                f"{self.__class__.__name__}.validate_batch() arg 'chunk_size' must be greater than 0.")
+        it = iter(records)
+        total = 0
+        failed = 0
+        result_mask = bytearray() if mask else None
+        invalid = []
+        # bounded number of chunks in flight keeps memory constant for large record sets.
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+        if _POOL_INITIALIZER:
+            # validator is sent to each worker process once instead of with every chunk.
+            ex = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(self,))
+            submit_args = ()
+        else:
+            ex = ProcessPoolExecutor(max_workers=max_workers)
+            submit_args = (self,)
+        with ex:
+            pending = deque()
+            start = 0
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(it, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(ex.submit(_validate_worker_chunk, chunk, start, fail_fast, mask, *submit_args))
+                    start += len(chunk)
+                if not pending:
+                    break
+                # merged in order of records
+                result: BatchResult = pending.popleft().result()
+                total += result.total
+                failed += result.failed
+                invalid.extend(result.invalid)
+                if result_mask is not None:
+                    result_mask.extend(result.mask)
+                if fail_fast and result.failed > 0:
+                    for future in pending:
+                        future.cancel()
+                    break
+        first = invalid[0].index if invalid else None
+        return BatchResult(total, failed, first, result_mask, invalid)
+
+    # region Properties
+    @property
+    def keys(self) -> List[str]:
+        """Gets keys of schema in order"""
+        return [fld.key for fld in self._fields]
+    # endregion Properties
+
+# endregion class RecordValidator
+
+
+# ProcessPoolExecutor initializer requires python 3.7
+_POOL_INITIALIZER = sys.version_info >= (3, 7)
+# validator of a worker process, set once by _init_worker()
+_worker_validator: Optional[RecordValidator] = None
+
+
+def _init_worker(validator: RecordValidator) -> None:
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_worker_chunk(records: List[Mapping], start: int, fail_fast: bool, mask: bool, validator: Optional[RecordValidator] = None) -> BatchResult:
+    if validator is None:
+        validator = _worker_validator
+    return validator._validate_chunk(records, start, fail_fast, mask)
+
+
+def _rebuild_validator(schema: Tuple[dict], kwargs: Dict[str, object]) -> RecordValidator:
+    builder = AssignBuilder()
+    for item in schema:
+        builder.append_helper(HelperArgs(**item))
+    return RecordValidator(builder, **kwargs)
+
+
+def validate_records(builder: AssignBuilder, records: Iterable[Mapping], **kwargs) -> Iterator[RecordResult]:
+    """
+    Validates records such as rows of a json lines file against ``builder``.
+
+    Each record is validated with the same rules as :py:meth:`.KwargsHelper.assign`
+    for each item in ``builder``: ``require``, ``default``, ``types``, ``rules_all`` and ``rules_any``.
+    Records are read and validated one at a time so memory use does not grow with number of records.
+
+    Args:
+        builder (AssignBuilder): schema of records.
+        records (Iterable[Mapping]): records to validate.
+
+    Keyword Arguments:
+        kwargs: see :py:class:`RecordValidator` constructor.
+
+    Raises:
+        TypeError: if ``builder`` is not instance of ``AssignBuilder``.
+
+    Yields:
+        RecordResult: result of each record in order of ``records``.
+
+    Example:
+        .. code-block:: python
+
+            >>> from kwhelp import AssignBuilder
+            >>> from kwhelp.records import validate_records
+            >>> ab = AssignBuilder()
+            >>> ab.append(key="name", require=True, types=[str])
+            >>> ab.append(key="age", types=[int], default=0)
+            >>> for result in validate_records(ab, [{"name": "Ann", "age": 22}, {"age": 3}]):
+            ...     print(result.valid, result.values, result.key)
+            True {'name': 'Ann', 'age': 22} None
+            False None name
+    """
+    # validator is created before first record is requested so schema errors are raised on call.
+    return RecordValidator(builder, **kwargs).validate_records(records)
+
+
+def validate_batch(builder: AssignBuilder, records: Iterable[Mapping], chunk_size: int = 1000, fail_fast: bool = False, mask: bool = False, max_workers: Optional[int] = None, **kwargs) -> BatchResult:
+    """
+    Validates records against ``builder`` in chunks using a pool of worker processes.
+
+    See :py:meth:`RecordValidator.validate_batch`.
+
+    Args:
+        builder (AssignBuilder): schema of records.
+        records (Iterable[Mapping]): records to validate.
+        chunk_size (int, optional): number of records sent to a worker at a time. Default ``1000``.
+        fail_fast (bool, optional): If ``True`` then validation stops at first record that is not valid.
+            Default ``False``.
+        mask (bool, optional): If ``True`` then result includes a pass mask. Default ``False``.
+        max_workers (int, optional): max number of worker processes.
+            Default ``None`` which uses number of processors.
+
+    Keyword Arguments:
+        kwargs: see :py:class:`RecordValidator` constructor.
+
+    Raises:
+        TypeError: if ``builder`` is not instance of ``AssignBuilder``.
+        ValueError: if ``chunk_size`` is less than ``1``.
+
+    Returns:
+        BatchResult: merged result of all chunks.
+    """
+    return RecordValidator(builder, **kwargs).validate_batch(
+        records, chunk_size=chunk_size, fail_fast=fail_fast, mask=mask, max_workers=max_workers)
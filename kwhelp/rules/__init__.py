@@ -3,11 +3,29 @@ from abc import ABC, abstractmethod
 import numbers
 import os
 from pathlib import Path
-from typing import Optional
+from collections import namedtuple
+from inspect import isclass
+from typing import Dict, Iterable, List, Optional, Tuple
 from ..helper import is_iterable
 # region Interface
 
 
+def _get_type_error_msg(arg: object, arg_name: str, expected_type: Optional[str] = None) -> str:
+    if expected_type:
+        msg = f"Argument Error: '{arg_name}' is expecting type of '{expected_type}'. Got type of '{type(arg).__name__}'"
+    else:
+        msg = f"Argument Error: '{arg_name}' is not expecting '{type(arg).__name__}'"
+    return msg
+
+
+def _get_not_type_error_msg(arg: object, arg_name: str, not_type: Optional[str] = None) -> str:
+    if not_type:
+        msg = f"Argument Error: '{arg_name}' is expecting non '{not_type}'. Got type of '{type(arg).__name__}'"
+    else:
+        msg = f"Argument Error: '{arg_name}' is expecting non '{type(arg).__name__}'."
+    return msg
+
+
 class IRule(ABC):
     """
     Abstract Interface Class for rules
@@ -58,20 +76,12 @@ class IRule(ABC):
     def _get_type_error_msg(self, arg: Optional[object] = None, arg_name: Optional[str] = None, expected_type: Optional[str] = None) -> str:
         _arg = self.field_value if arg is None else arg
         _arg_name = self.key if arg_name is None else arg_name
-        if expected_type:
-            msg = f"Argument Error: '{_arg_name}' is expecting type of '{expected_type}'. Got type of '{type(_arg).__name__}'"
-        else:
-            msg = f"Argument Error: '{_arg_name}' is not expecting '{type(_arg).__name__}'"
-        return msg
+        return _get_type_error_msg(_arg, _arg_name, expected_type)
 
     def _get_not_type_error_msg(self, arg: Optional[object] = None, arg_name: Optional[str] = None, not_type: Optional[str] = None) -> str:
         _arg = self.field_value if arg is None else arg
         _arg_name = self.key if arg_name is None else arg_name
-        if not_type:
-            msg = f"Argument Error: '{_arg_name}' is expecting non '{not_type}'. Got type of '{type(_arg).__name__}'"
-        else:
-            msg = f"Argument Error: '{_arg_name}' is expecting non '{type(_arg).__name__}'."
-        return msg
+        return _get_not_type_error_msg(_arg, _arg_name, not_type)
     # region Properties
 
     @property
@@ -139,101 +149,259 @@ class IRule(ABC):
         '''Gets object that attributes validated for'''
         return self._originator
     # endregion Properties
+
+
+class _StatelessRule(IRule):
+    """
+    Base class of built in rules.
+
+    Built in rules are validated by :py:meth:`~._StatelessRule.check` class method without creating an instance
+    of rule. Subclasses of built in rules outside of this module are validated by creating an instance so
+    overridden ``validate()``, ``__init__()`` and properties are used.
+
+    Note:
+        ``check()`` builds error messages without calling ``_get_type_error_msg()`` or
+        ``_get_not_type_error_msg()``. Overriding these methods in a subclass of a built in rule does not change
+        its error messages; override ``validate()`` instead.
+    """
+
+    @classmethod
+    @abstractmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
+        """
+        Validates ``value`` without creating an instance of rule.
+
+        Args:
+            value (object): the value that is assigned to ``name``
+            key (str, optional): the key that rule is to apply to. Default ``arg``
+            name (str, optional): the name of the field that value was assigned. Default ``arg``
+            originator (object, optional): the object that attributes validated for. Default ``None``
+            raise_errors (bool, optional): determinins if rule could raise an error when validation fails.
+                Default ``True``
+
+        Returns:
+            bool: ``True`` if ``value`` is valid; Otherwise, ``False``.
+        """
+
+    def validate(self) -> bool:
+        """
+        Validates ``field_value`` of this instance.
+
+        Returns:
+            bool: ``True`` if ``field_value`` is valid; Otherwise, ``False``.
+        """
+        return self.check(value=self.field_value, key=self.key, name=self.field_name,
+                          originator=self.originator, raise_errors=self.raise_errors)
+
+
+_RULE_CHECKS_MAX_SIZE = 256
+_rule_checks: Dict[type, Optional[callable]] = {}
+
+
+def _get_rule_check(rule: object) -> Optional[callable]:
+    """
+    Gets function that validates a value with ``rule``.
+
+    Returned function has the same args as :py:meth:`~._StatelessRule.check`.
+    Built in rules of this module are validated by their ``check()`` class method.
+    All other rules are validated by creating an instance each call.
+
+    Args:
+        rule (object): Rule class.
+
+    Returns:
+        Optional[callable]: validation function, ``None`` if ``rule`` is not a class that implements ``IRule``.
+    """
+    try:
+        return _rule_checks[rule]
+    except (KeyError, TypeError):
+        pass
+    if not isclass(rule) or not issubclass(rule, IRule):
+        return None
+    if issubclass(rule, _StatelessRule) and rule.__module__ == __name__:
+        check = rule.check
+    else:
+        def check(value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
+            return rule(key=key, name=name, value=value, raise_errors=raise_errors, originator=originator).validate()
+    if len(_rule_checks) >= _RULE_CHECKS_MAX_SIZE:
+        # iteration fails when another thread changes cache.
+        try:
+            del _rule_checks[next(iter(_rule_checks))]
+        except (StopIteration, RuntimeError, KeyError):
+            pass
+    _rule_checks[rule] = check
+    return check
+
+
+def _is_pure_check(rule: object, check: Optional[callable]) -> bool:
+    # check of a built in rule is its class method and can be run again without side effects.
+    return getattr(check, '__self__', None) is rule
+
+
+def _get_rule_checks(rules: Iterable[object]) -> Tuple[Tuple[object, Optional[callable]]]:
+    """
+    Gets rules with their validation function. See :py:func:`_get_rule_check`.
+
+    Args:
+        rules (Iterable[object]): Rules.
+
+    Returns:
+        Tuple[Tuple[object, Optional[callable]]]: Tuple of rule and its validation function.
+    """
+    return tuple((rule, _get_rule_check(rule)) for rule in rules)
+
+
+RuleResult = namedtuple('RuleResult', ['valid', 'rule', 'error'])
+"""
+Result of validating a value with a rule.
+
+``valid`` is ``True`` if rule matched. ``rule`` is rule class.
+``error`` is exception that explains why rule did not match if any; Otherwise, ``None``.
+"""
+
+
+def _validate_checks_any(checks: Iterable[Tuple[object, Optional[callable]]], value: object, key: str, name: str, originator: object, raise_errors: bool) -> Tuple[bool, List[RuleResult]]:
+    """
+    Validates ``value`` against rules until one rule matches.
+
+    Built in rules are first run without raising errors. Only when no rule matches and ``raise_errors`` is ``True``
+    are failed built in rules run again to get errors that explain failure. Other rules are run once with
+    ``raise_errors`` so their side effects are not repeated.
+
+    Args:
+        checks (Iterable[Tuple[object, Optional[callable]]]): Rules from :py:func:`_get_rule_checks`.
+        value (object): value to validate.
+        key (str): the key that rules apply to.
+        name (str): the name of the field that value was assigned.
+        originator (object): the object that attributes validated for.
+        raise_errors (bool): If ``True`` then errors of failed rules are included in results.
+
+    Raises:
+        TypeError: If a rule does not implement ``IRule``.
+
+    Returns:
+        Tuple[bool, List[RuleResult]]: ``True`` if any rule matches and results of rules that did not match.
+    """
+    failed = []
+    for rule, check in checks:
+        if check is None:
+            raise TypeError('Rules must implement IRule')
+        try:
+            if check(value, key, name, originator, raise_errors and not _is_pure_check(rule, check)) is True:
+                return True, []
+            failed.append(RuleResult(False, rule, None))
+        except Exception as e:
+            failed.append(RuleResult(False, rule, e))
+    if raise_errors is False:
+        return False, failed
+    results = []
+    for result in failed:
+        if result.error is None and _is_pure_check(result.rule, _get_rule_check(result.rule)):
+            try:
+                result.rule.check(value, key, name, originator, True)
+            except Exception as e:
+                result = RuleResult(False, result.rule, e)
+        results.append(result)
+    return False, results
 # endregion Interface
 
 # region Attrib rules
 
 
-class RuleAttrNotExist(IRule):
+class RuleAttrNotExist(_StatelessRule):
     '''
     Rule to ensure an attribute does not exist before it is added to class.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
-        Validates that ``field_name`` is not an existing attribute of ``originator`` instance.
+        Validates that ``name`` is not an existing attribute of ``originator`` instance.
 
         Raises:
-            AttributeError: If ``raise_errors`` is ``True`` and ``field_name`` is already an attribue of ``originator`` instance.
+            AttributeError: If ``raise_errors`` is ``True`` and ``name`` is already an attribue of ``originator`` instance.
 
         Returns:
-            bool: ``True`` if ``field_name`` is not an existing attribue of ``originator`` instance;
+            bool: ``True`` if ``name`` is not an existing attribue of ``originator`` instance;
             Otherwise, ``False``.
         """
-        result = not hasattr(self.originator, self.field_name)
-        if result == False and self.raise_errors == True:
+        result = not hasattr(originator, name)
+        if result == False and raise_errors == True:
             raise AttributeError(
-                f"'{self.field_name}' attribute already exist in current instance of '{type(self.originator).__name__}'")
+                f"'{name}' attribute already exist in current instance of '{type(originator).__name__}'")
         return result
 
 
-class RuleAttrExist(IRule):
+class RuleAttrExist(_StatelessRule):
     '''
     Rule to ensure an attribute does exist before its value is set.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
-        Validates that ``field_name`` is an existing attribute of ``originator`` instance.
+        Validates that ``name`` is an existing attribute of ``originator`` instance.
 
         Raises:
-            AttributeError: If ``raise_errors`` is ``True`` and ``field_name`` is not an attribue of ``originator`` instance.
+            AttributeError: If ``raise_errors`` is ``True`` and ``name`` is not an attribue of ``originator`` instance.
 
         Returns:
-            bool: ``True`` if ``field_name`` is an existing attribue of ``originator`` instance;
+            bool: ``True`` if ``name`` is an existing attribue of ``originator`` instance;
             Otherwise, ``False``.
         """
-        result = hasattr(self.originator, self.field_name)
-        if result == False and self.raise_errors == True:
+        result = hasattr(originator, name)
+        if result == False and raise_errors == True:
             raise AttributeError(
-                f"'{self.field_name}' attribute does not exist in current instance of '{type(self.originator).__name__}'")
+                f"'{name}' attribute does not exist in current instance of '{type(originator).__name__}'")
         return result
 # endregion Attrib rules
 
 # region None
 
 
-class RuleNone(IRule):
+class RuleNone(_StatelessRule):
     '''
     Rule that matched only if value is ``None``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign to attribute is ``None``.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not ``None``.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not ``None``.
 
         Returns:
-            bool: ``True`` if ``field_value`` is ``None``; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is ``None``; Otherwise, ``False``.
         """
-        if self.field_value is not None:
-            if self.raise_errors:
+        if value is not None:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: {self.key} must be assigned a value")
+                    f"Arg error: {key} must be assigned a value")
             return False
         return True
 
-class RuleNotNone(IRule):
+class RuleNotNone(_StatelessRule):
     '''
     Rule that matched only if value is not ``None``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign to attribute is not ``None``.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is ``None``.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is ``None``.
 
         Returns:
-            bool: ``True`` if ``field_value`` is not ``None``; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is not ``None``; Otherwise, ``False``.
         """
-        if self.field_value is None:
-            if self.raise_errors:
+        if value is None:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: {self.key} must be assigned a value")
+                    f"Arg error: {key} must be assigned a value")
             return False
         return True
 
@@ -242,7 +410,7 @@ class RuleNotNone(IRule):
 # region Number
 
 
-class RuleNumber(IRule):
+class RuleNumber(_StatelessRule):
     '''
     Rule that matched only if value is a valid number.
 
@@ -250,30 +418,31 @@ class RuleNumber(IRule):
         If value is a of type ``bool`` then validation will fail for this rule.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a number
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not a number.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not a number.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a number; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a number; Otherwise, ``False``.
         """
         # isinstance(False, int) is True
         # print(int(True)) 1
         # print(int(False)) 0
-        if not isinstance(self.field_value, numbers.Number) or isinstance(self.field_value, bool):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(
-                    self.field_value, self.key, 'Number'))
+        if not isinstance(value, numbers.Number) or isinstance(value, bool):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(
+                    value, key, 'Number'))
             return False
         return True
 
 # region Integer
 
 
-class RuleInt(IRule):
+class RuleInt(_StatelessRule):
     '''
     Rule that matched only if value is instance of ``int``.
 
@@ -281,22 +450,23 @@ class RuleInt(IRule):
         If value is a of type ``bool`` then validation will fail for this rule.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is an int
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not an int.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not an int.
 
         Returns:
-            bool: ``True`` if ``field_value`` is an ``int``; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is an ``int``; Otherwise, ``False``.
         """
         # isinstance(False, int) is True
         # print(int(True)) 1
         # print(int(False)) 0
-        if not isinstance(self.field_value, int) or isinstance(self.field_value, bool):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(expected_type='int'))
+        if not isinstance(value, int) or isinstance(value, bool):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(value, key, 'int'))
             return False
         return True
 
@@ -306,22 +476,23 @@ class RuleIntZero(RuleInt):
     Rule that matched only if value is equal to ``0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is equal to ``0`` int.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not equal to ``0`` int.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not equal to ``0`` int.
 
         Returns:
-            bool: ``True`` if ``field_value`` equals ``0`` int; Otherwise, ``False``.
+            bool: ``True`` if ``value`` equals ``0`` int; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value != 0:
-            if self.raise_errors:
+        if value != 0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be equal to 0 int value")
+                    f"Arg error: '{key}' must be equal to 0 int value")
             return False
         return True
 
@@ -330,22 +501,23 @@ class RuleIntPositive(RuleInt):
     Rule that matched only if value is equal or greater than ``0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a posivite int
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not a positive int.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not a positive int.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a positive int; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a positive int; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value < 0:
-            if self.raise_errors:
+        if value < 0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a positive int value")
+                    f"Arg error: '{key}' must be a positive int value")
             return False
         return True
 
@@ -355,22 +527,23 @@ class RuleIntNegative(RuleInt):
     Rule that matched only if value is less than ``0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a negative int
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not a negative int.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not a negative int.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a negative int; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a negative int; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value >= 0:
-            if self.raise_errors:
+        if value >= 0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a negative int value")
+                    f"Arg error: '{key}' must be a negative int value")
             return False
         return True
 
@@ -380,22 +553,23 @@ class RuleIntNegativeOrZero(RuleInt):
     Rule that matched only if value is equal or less than ``0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is equal to zero or a negative int
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not a negative int.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not a negative int.
 
         Returns:
-            bool: ``True`` if ``field_value`` is equal to zero or a negative int; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is equal to zero or a negative int; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value > 0:
-            if self.raise_errors:
+        if value > 0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be equal to zero or a negative int value")
+                    f"Arg error: '{key}' must be equal to zero or a negative int value")
             return False
         return True
 
@@ -405,7 +579,8 @@ class RuleByteUnsigned(RuleInt):
     Unsigned Byte rule, range from ``0`` to ``255``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Valids
 
@@ -415,12 +590,12 @@ class RuleByteUnsigned(RuleInt):
         Returns:
             bool: ``True`` if Validation passes; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value < 0 or self.field_value > 255:
-            if self.raise_errors:
+        if value < 0 or value > 255:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a num from 0 to 255")
+                    f"Arg error: '{key}' must be a num from 0 to 255")
             return False
         return True
 
@@ -430,7 +605,8 @@ class RuleByteSigned(RuleInt):
     Signed Byte rule, range from ``-128`` to ``127``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Valids
 
@@ -440,12 +616,12 @@ class RuleByteSigned(RuleInt):
         Returns:
             bool: ``True`` if Validation passes; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value < -128 or self.field_value > 127:
-            if self.raise_errors:
+        if value < -128 or value > 127:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a num from -128 to 127")
+                    f"Arg error: '{key}' must be a num from -128 to 127")
             return False
         return True
 # endregion Integer
@@ -453,25 +629,26 @@ class RuleByteSigned(RuleInt):
 # region Float Rules
 
 
-class RuleFloat(IRule):
+class RuleFloat(_StatelessRule):
     '''
     Rule that matched only if value is to type ``float``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a float
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not a float.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not a float.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a positive float; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a positive float; Otherwise, ``False``.
         """
-        if not isinstance(self.field_value, float):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(
-                    self.field_value, self.key, 'float'))
+        if not isinstance(value, float):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(
+                    value, key, 'float'))
             return False
         return True
 
@@ -481,22 +658,23 @@ class RuleFloatZero(RuleFloat):
     Rule that matched only if value is equal to ``0.0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign equals ``0.0`` float
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not equal to ``0.0`` float.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not equal to ``0.0`` float.
 
         Returns:
-            bool: ``True`` if ``field_value`` equals ``0.0`` float; Otherwise, ``False``.
+            bool: ``True`` if ``value`` equals ``0.0`` float; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value != 0.0:
-            if self.raise_errors:
+        if value != 0.0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be equal to 0.0 float value")
+                    f"Arg error: '{key}' must be equal to 0.0 float value")
             return False
         return True
 
@@ -505,22 +683,23 @@ class RuleFloatPositive(RuleFloat):
     Rule that matched only if value is equal or greater than ``0.0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a positive float
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not a positive float.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not a positive float.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a positive float; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a positive float; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value < 0.0:
-            if self.raise_errors:
+        if value < 0.0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a positive float value")
+                    f"Arg error: '{key}' must be a positive float value")
             return False
         return True
 
@@ -530,22 +709,23 @@ class RuleFloatNegative(RuleFloat):
     Rule that matched only if value is less than ``0.0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a negative float
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not a negative float.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not a negative float.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a negative float; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a negative float; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value >= 0.0:
-            if self.raise_errors:
+        if value >= 0.0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be a negative float value")
+                    f"Arg error: '{key}' must be a negative float value")
             return False
         return True
 
@@ -555,22 +735,23 @@ class RuleFloatNegativeOrZero(RuleFloat):
     Rule that matched only if value is equal or less than ``0.0``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is equal to ``0.0`` or a negative float
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value`` is not a negative float.
+            ValueError: If ``raise_errors`` is ``True`` and ``value`` is not a negative float.
 
         Returns:
-            bool: ``True`` if ``field_value`` is equal to ``0.0`` or a negative float; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is equal to ``0.0`` or a negative float; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if self.field_value > 0.0:
-            if self.raise_errors:
+        if value > 0.0:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must be equal to 0.0 or a negative float value")
+                    f"Arg error: '{key}' must be equal to 0.0 or a negative float value")
             return False
         return True
 # endregion Float Rules
@@ -580,25 +761,26 @@ class RuleFloatNegativeOrZero(RuleFloat):
 # region String
 
 
-class RuleStr(IRule):
+class RuleStr(_StatelessRule):
     '''
     Rule that matched only if value is of type ``str``.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a string
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not instance of string.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not instance of string.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a string; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a string; Otherwise, ``False``.
         """
-        if not isinstance(self.field_value, str):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(
-                    self.field_value, self.key, 'str'))
+        if not isinstance(value, str):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(
+                    value, key, 'str'))
             return False
         return True
 
@@ -608,24 +790,24 @@ class RuleStrEmpty(RuleStr):
     Rule that matched only if value is equal to empty string.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a string and is an empty string.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value``
+            ValueError: If ``raise_errors`` is ``True`` and ``value``
                 is not an empty string.
 
         Returns:
             bool: ``True`` if value is an empty string; Otherwise; ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        value = self.field_value
         if len(value) != 0:
-            if self.raise_errors:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: {self.key} must be empty str")
+                    f"Arg error: {key} must be empty str")
             return False
         return True
 
@@ -635,24 +817,24 @@ class RuleStrNotNullOrEmpty(RuleStr):
     Rule that matched only if value is not ``None`` or empty string.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a string and is not a empty string.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value``
+            ValueError: If ``raise_errors`` is ``True`` and ``value``
                 is not instance of string or is empty string
 
         Returns:
             bool: ``True`` if value is valid; Otherwise; ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        value = self.field_value
         if len(value) == 0:
-            if self.raise_errors:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: {self.key} must not be empty str")
+                    f"Arg error: {key} must not be empty str")
             return False
         return True
 
@@ -662,24 +844,25 @@ class RuleStrNotNullEmptyWs(RuleStrNotNullOrEmpty):
     Rule that matched only if value is not ``None``, empty or whitespace.
     '''
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a string and is not a empty or whitespace string.
 
         Raises:
-            ValueError: If ``raise_errors`` is ``True`` and ``field_value``
+            ValueError: If ``raise_errors`` is ``True`` and ``value``
                 is not instance of string or is empty or whitespace string
 
         Returns:
             bool: ``True`` if value is valid; Otherwise; ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        value = self.field_value.strip()
+        value = value.strip()
         if len(value) == 0:
-            if self.raise_errors:
+            if raise_errors:
                 raise ValueError(
-                    f"Arg error: '{self.key}' must not be empty or whitespace str")
+                    f"Arg error: '{key}' must not be empty or whitespace str")
             return False
         return True
 # endregion String
@@ -687,24 +870,25 @@ class RuleStrNotNullEmptyWs(RuleStrNotNullOrEmpty):
 # region boolean
 
 
-class RuleBool(IRule):
+class RuleBool(_StatelessRule):
     """
      Rule that matched only if value is instance of bool.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a bool
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not instance of bool.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not instance of bool.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a bool; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a bool; Otherwise, ``False``.
         """
-        if not isinstance(self.field_value, bool):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(expected_type='bool'))
+        if not isinstance(value, bool):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(value, key, 'bool'))
             return False
         return True
 # endregion boolean
@@ -712,46 +896,48 @@ class RuleBool(IRule):
 # region Iterable
 
 
-class RuleIterable(IRule):
+class RuleIterable(_StatelessRule):
     """
      Rule that matched only if value is iterable such as list, tuple, set.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is iterable
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not iterable.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not iterable.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a iterable; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a iterable; Otherwise, ``False``.
         """
-        if not is_iterable(self.field_value):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(expected_type="iterable"))
+        if not is_iterable(value):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(value, key, "iterable"))
             return False
         return True
 
 
-class RuleNotIterable(IRule):
+class RuleNotIterable(_StatelessRule):
     """
      Rule that matched only if value is not iterable.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is not iterable
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is iterable.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is iterable.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a not iterable; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a not iterable; Otherwise, ``False``.
         """
-        if is_iterable(self.field_value):
-            if self.raise_errors:
-                raise TypeError(self._get_not_type_error_msg(not_type="iterable"))
+        if is_iterable(value):
+            if raise_errors:
+                raise TypeError(_get_not_type_error_msg(value, key, "iterable"))
             return False
         return True
     
@@ -759,24 +945,25 @@ class RuleNotIterable(IRule):
 # endregion Iterable
 
 # region Path
-class RulePath(IRule):
+class RulePath(_StatelessRule):
     """
      Rule that matched only if value is instance of ``Path``.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a Path
 
         Raises:
-            TypeError: If ``raise_errors`` is ``True`` and ``field_value`` is not instance of Path.
+            TypeError: If ``raise_errors`` is ``True`` and ``value`` is not instance of Path.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a bool; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a bool; Otherwise, ``False``.
         """
-        if not isinstance(self.field_value, Path):
-            if self.raise_errors:
-                raise TypeError(self._get_type_error_msg(expected_type='Path'))
+        if not isinstance(value, Path):
+            if raise_errors:
+                raise TypeError(_get_type_error_msg(value, key, 'Path'))
             return False
         return True
 
@@ -786,22 +973,23 @@ class RulePathExist(RulePath):
      Rule that matched only if value is instance of ``Path`` and path exist.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a path that exist
 
         Raises:
-            FileNotFoundError: If ``raise_errors`` is ``True`` and ``field_value`` is path does not exist.
+            FileNotFoundError: If ``raise_errors`` is ``True`` and ``value`` is path does not exist.
 
         Returns:
-            bool: ``True`` if ``field_value`` is an existing path; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is an existing path; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if not os.path.exists(self.field_value):
-            if self.raise_errors:
+        if not os.path.exists(value):
+            if raise_errors:
                 raise FileNotFoundError(
-                    f"Unable to find path: '{self.field_value}'")
+                    f"Unable to find path: '{value}'")
             return False
         return True
 
@@ -811,22 +999,23 @@ class RulePathNotExist(RulePath):
      Rule that matched only if value is instance of ``Path`` and path does not exist.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a Path that does not exist
 
         Raises:
-            FileExistsError: If ``raise_errors`` is ``True`` and ``field_value`` is path that is existing.
+            FileExistsError: If ``raise_errors`` is ``True`` and ``value`` is path that is existing.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a p    ath that does not exist; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a p    ath that does not exist; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if os.path.exists(self.field_value):
-            if self.raise_errors:
+        if os.path.exists(value):
+            if raise_errors:
                 raise FileExistsError(
-                    f"File already exist: '{self.field_value}'")
+                    f"File already exist: '{value}'")
             return False
         return True
 
@@ -836,22 +1025,23 @@ class RuleStrPathExist(RuleStr):
      Rule that matched only if value is instance of str and path exist.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a str path that exist
 
         Raises:
-            FileNotFoundError: If ``raise_errors`` is ``True`` and ``field_value`` is path does not exist.
+            FileNotFoundError: If ``raise_errors`` is ``True`` and ``value`` is path does not exist.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a path that does exist; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a path that does exist; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if not os.path.exists(self.field_value):
-            if self.raise_errors:
+        if not os.path.exists(value):
+            if raise_errors:
                 raise FileNotFoundError(
-                    f"Unable to find path: '{self.field_value}'")
+                    f"Unable to find path: '{value}'")
             return False
         return True
 
@@ -861,22 +1051,23 @@ class RuleStrPathNotExist(RuleStr):
      Rule that matched only if value is instance of str and path is not existing.
     """
 
-    def validate(self) -> bool:
+    @classmethod
+    def check(cls, value: object, key: str = 'arg', name: str = 'arg', originator: object = None, raise_errors: bool = True) -> bool:
         """
         Validates that value to assign is a path not existing
 
         Raises:
-            FileExistsError: If ``raise_errors`` is ``True`` and ``field_value`` is a path that is not existing.
+            FileExistsError: If ``raise_errors`` is ``True`` and ``value`` is a path that is not existing.
 
         Returns:
-            bool: ``True`` if ``field_value`` is a path that does not exist; Otherwise, ``False``.
+            bool: ``True`` if ``value`` is a path that does not exist; Otherwise, ``False``.
         """
-        if not super().validate():
+        if not super().check(value=value, key=key, name=name, originator=originator, raise_errors=raise_errors):
             return False
-        if os.path.exists(self.field_value):
-            if self.raise_errors:
+        if os.path.exists(value):
+            if raise_errors:
                 raise FileExistsError(
-                    f"File already exist: '{self.field_value}'")
+                    f"File already exist: '{value}'")
             return False
         return True
 # end Region Path
@@ -61,7 +61,7 @@ setup(
     license="MIT",
     # package_dir={'kwhelp': 'kwhelp'},
     packages=['kwhelp', 'kwhelp.rules', 'kwhelp.helper',
-              'kwhelp.decorator', 'kwhelp.exceptions', 'kwhelp.checks'],
+              'kwhelp.decorator', 'kwhelp.exceptions', 'kwhelp.checks', 'kwhelp.records'],
     py_modules=MODULES,
     keywords=['python', 'kwargs', 'args', 'parse', 'helper'],
     classifiers=[
@@ -1,5 +1,6 @@
 # coding: utf-8
 import unittest
+import gc
 if __name__ == '__main__':
     import os
     import sys
@@ -7,6 +8,7 @@ if __name__ == '__main__':
 
 from kwhelp.checks import SubClassChecker
 from enum import IntEnum, auto
+from abc import ABC
 
 
 class Color(IntEnum):
@@ -104,6 +106,67 @@ class TestSubClassChecker(unittest.TestCase):
         assert sc._is_instance(Color.GREEN) == True
         assert sc._is_instance(self) == True
 
+    def test_cache(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+        sc = SubClassChecker(Base)
+        assert sc.validate(Base(), Child(), Child())
+        assert sc.cache_info() == (1, 2, 128, 2)
+        # classes are not valid when instance only
+        with self.assertRaises(TypeError):
+            sc.validate(Child)
+        assert sc.cache_info().currsize == 2
+        sc.instance_only = False
+        assert sc.cache_info().currsize == 0
+        assert sc.validate(Child, Child, Child())
+        assert sc.cache_info().currsize == 2
+        # statistics are kept when cache is reset by setter
+        assert sc.cache_info().hits == 2
+        with self.assertRaises(TypeError):
+            sc.validate(int)
+        with self.assertRaises(TypeError):
+            sc.validate(1)
+        sc.cache_clear()
+        assert sc.cache_info() == (0, 0, 128, 0)
+
+    def test_cache_weak(self):
+        class Base:
+            pass
+        sc = SubClassChecker(Base, opt_inst_only=False)
+        child = type("Child", (Base,), {})
+        assert sc.validate(child, child())
+        assert sc.cache_info().currsize == 2
+        del child
+        gc.collect()
+        assert sc.cache_info().currsize == 0
+
+    def test_cache_abc(self):
+        class Base(ABC):
+            pass
+
+        class Other:
+            pass
+        sc = SubClassChecker(Base, raise_error=False)
+        assert sc.validate(Other()) is False
+        assert sc.cache_info().currsize == 0
+        Base.register(Other)
+        assert sc.validate(Other())
+        assert sc.validate(Other())
+        assert sc.cache_info().hits == 1
+
+    def test_validate_many(self):
+        sc = SubClassChecker(Foo)
+        values = [Foo(), Bar(), Base(), FooBar(), Foo, Obj()]
+        assert sc.validate_many(values, mask=True) == (6, 3, 2, bytearray([1, 1, 0, 1, 0, 0]))
+        sc = SubClassChecker(Foo, opt_inst_only=False)
+        assert sc.validate_many(values) == (6, 2, 2, None)
+        assert sc.validate_many(values, fail_fast=True) == (3, 1, 2, None)
+        assert sc.validate_items({"a": Bar, "b": Foo()}.items()) == (2, 0, None, None)
+        assert sc.validate_items({"a": Bar, "b": Obj}.items()).first == "b"
+        assert SubClassChecker().validate_many([1, "a"]).failed == 0
 
 
 if __name__ == '__main__':
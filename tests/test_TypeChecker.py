@@ -1,11 +1,14 @@
 # coding: utf-8
 import unittest
+import gc
 if __name__ == '__main__':
     import os
     import sys
     sys.path.append(os.path.realpath('.'))
 
-from kwhelp.checks import TypeChecker
+from kwhelp.checks import TypeChecker, BulkResult
+from kwhelp.helper import Formatter
+from unittest.mock import patch
 from pathlib import Path
 
 
@@ -66,6 +69,101 @@ class TestTypeChecker(unittest.TestCase):
         with self.assertRaises(TypeError):
             tc.validate(str_path, Path(str_path))
 
+    def test_cache(self):
+        tc = TypeChecker(int, Path)
+        assert tc.cache_info() == (0, 0, 128, 0)
+        assert tc.validate(1, 2, 3)
+        assert tc.cache_info() == (2, 1, 128, 1)
+        # PosixPath or WindowsPath is cached by instance check
+        assert tc.validate(Path('.'), Path('.'))
+        assert tc.cache_info().currsize == 2
+        assert tc.cache_info().hits == 3
+        # invalid values are not cached
+        with self.assertRaises(TypeError):
+            tc.validate(1.5)
+        with self.assertRaises(TypeError):
+            tc.validate(1.5)
+        assert tc.cache_info().currsize == 2
+        tc.type_instance_check = False
+        assert tc.cache_info().currsize == 0
+        with self.assertRaises(TypeError):
+            tc.validate(Path('.'))
+        tc.cache_clear()
+        assert tc.cache_info() == (0, 0, 128, 0)
+
+    def test_cache_bounded(self):
+        tc = TypeChecker(int)
+        classes = [type(f"Int{i}", (int,), {}) for i in range(200)]
+        for cls in classes:
+            assert tc.validate(cls(1))
+        info = tc.cache_info()
+        assert info.currsize == info.maxsize
+        assert info.misses == 200
+        # newest types are kept
+        assert tc.validate(classes[-1](1))
+        assert tc.cache_info().hits == 1
+
+    def test_cache_weak(self):
+        tc = TypeChecker(int)
+        cls = type("IntTmp", (int,), {})
+        assert tc.validate(cls(1))
+        assert tc.cache_info().currsize == 1
+        # cache does not keep class alive
+        del cls
+        gc.collect()
+        assert tc.cache_info().currsize == 0
+
+    def test_cache_instancecheck(self):
+        # verdict of a type with custom instance check can depend on instance and is never cached
+        class Meta(type):
+            def __instancecheck__(cls, instance):
+                return getattr(instance, 'valid', False)
+
+        class Valid(metaclass=Meta):
+            pass
+
+        class Obj:
+            pass
+        tc = TypeChecker(Valid)
+        o = Obj()
+        o.valid = True
+        assert tc.validate(o)
+        assert tc.cache_info().currsize == 0
+        with self.assertRaises(TypeError):
+            tc.validate(Obj())
+
+
+    def test_types_str(self):
+        tc = TypeChecker(int, float)
+        with patch.object(Formatter, 'get_formated_types', wraps=Formatter.get_formated_types) as fmt:
+            for _ in range(3):
+                with self.assertRaises(TypeError):
+                    tc.validate("a")
+            assert fmt.call_count == 1
+
+    def test_validate_many(self):
+        tc = TypeChecker(int, Path)
+        values = [1, Path('.'), "a", 2, 3.5, True]
+        result = tc.validate_many(values)
+        assert isinstance(result, BulkResult)
+        assert result == (6, 2, 2, None)
+        result = tc.validate_many(values, mask=True)
+        assert result.mask == bytearray([1, 1, 0, 1, 0, 1])
+        assert tc.validate_many(values, mask=True, fail_fast=True) == (3, 1, 2, bytearray([1, 1, 0]))
+        assert tc.validate_many(iter(range(1000))) == (1000, 0, None, None)
+        assert tc.validate_many([]) == (0, 0, None, None)
+        # cache is used as by validate()
+        assert tc.cache_info().hits > 1000
+        tc = TypeChecker(int, type_instance_check=False)
+        assert tc.validate_many([1, True]).first == 1
+        assert TypeChecker().validate_many(["a", 1]) == (2, 0, None, None)
+
+    def test_validate_items(self):
+        tc = TypeChecker(int, float)
+        data = {"a": 1, "b": "2", "c": 3.3, "*0": None}
+        assert tc.validate_items(data.items(), mask=True) == (4, 2, "b", bytearray([1, 0, 1, 0]))
+        assert tc.validate_items(zip("xyz", (1, 2, 3))).failed == 0
+
 
 if __name__ == '__main__':
     unittest.main()
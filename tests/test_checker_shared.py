@@ -0,0 +1,113 @@
+import unittest
+import gc
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+from kwhelp.checks import TypeChecker, RuleChecker, SubClassChecker, get_checker_stats, CheckerStats
+from kwhelp.decorator import TypeCheck, RuleCheckAll, SubClass, AcceptedTypes
+from kwhelp import rules
+
+
+class TestCheckerShared(unittest.TestCase):
+
+    def test_decorators_share(self):
+        @TypeCheck(int, float)
+        def foo(value):
+            return value
+
+        @TypeCheck(int, float)
+        def bar(value):
+            return value
+
+        @TypeCheck(int, float, type_instance_check=False)
+        def baz(value):
+            return value
+        decs = [TypeCheck(int, float, opt_return=None), TypeCheck(int, float), TypeCheck(float, int),
+                TypeCheck(int, float, raise_error=False)]
+        tcs = [dec._typechecker for dec in decs]
+        assert tcs[0] is tcs[1]
+        assert tcs[0] is not tcs[2]
+        assert tcs[0] is not tcs[3]
+        assert tcs[3].raise_error is False
+        assert foo(1) == 1
+        assert bar(1.5) == 1.5
+        with self.assertRaises(TypeError):
+            bar("1")
+
+        rcs = [RuleCheckAll(rules.RuleIntPositive)._rulechecker,
+               RuleCheckAll(rules.RuleIntPositive, opt_return=False)._rulechecker,
+               RuleCheckAll(rules.RuleIntPositive, rules.RuleInt)._rulechecker]
+        assert rcs[0] is rcs[1]
+        assert rcs[0] is not rcs[2]
+
+    def test_frozen(self):
+        tc = TypeChecker._get_shared(int, str)
+        with self.assertRaises(AttributeError):
+            tc.raise_error = False
+        with self.assertRaises(AttributeError):
+            tc.type_instance_check = False
+        sc = SubClassChecker._get_shared(int)
+        with self.assertRaises(AttributeError):
+            sc.instance_only = False
+        rc = RuleChecker._get_shared(rules_all=[rules.RuleInt])
+        with self.assertRaises(AttributeError):
+            rc.raise_error = False
+        # checkers that are not shared can still be changed.
+        tc = TypeChecker(int, str)
+        tc.raise_error = False
+        assert tc.validate("a", 1.1) is False
+
+    def test_rules_copied(self):
+        rules_all = [rules.RuleInt, rules.RuleIntPositive]
+        rules_any = [rules.RuleIntZero]
+        rc = RuleChecker._get_shared(rules_all=rules_all, rules_any=rules_any)
+        rules_all.append(rules.RuleIntZero)
+        rules_any.clear()
+        # changes to list of caller do not change rules of shared checker.
+        assert rc.rules_all == (rules.RuleInt, rules.RuleIntPositive)
+        assert rc.rules_any == (rules.RuleIntZero,)
+        assert rc is RuleChecker._get_shared(rules_all=(rules.RuleInt, rules.RuleIntPositive),
+                                             rules_any=[rules.RuleIntZero])
+        assert rc.validate_all(1) is True
+
+    def test_not_shared(self):
+        rc = RuleChecker._get_shared(rules_all=[rules.RuleInt, [rules.RuleStr]])
+        assert rc is not RuleChecker._get_shared(rules_all=[rules.RuleInt, [rules.RuleStr]])
+        with self.assertRaises(TypeError):
+            RuleChecker._get_shared(rules_all=rules.RuleInt)
+
+    def test_sub_class_raise_error(self):
+        # SubClass always raises errors, raise_error is not changed on shared checker.
+        dec = SubClass(int, opt_return=None)
+        other = SubClassChecker._get_shared(int, raise_error=False)
+
+        @SubClass(int, raise_error=False)
+        def foo(value):
+            return value
+        with self.assertRaises(TypeError):
+            foo("1")
+        assert other.raise_error is False
+        assert other.validate("1") is False
+
+    def test_stats(self):
+        gc.collect()
+        start = get_checker_stats()
+        assert isinstance(start, CheckerStats)
+
+        class Foo:
+            pass
+
+        @AcceptedTypes(Foo, (Foo, int), Foo)
+        def foo(one, two, three):
+            return one
+        stats = get_checker_stats()
+        assert stats.count == start.count + 2
+        assert stats.size > start.size
+        del foo
+        gc.collect()
+        assert get_checker_stats().count == start.count
+
+
+if __name__ == '__main__':
+    unittest.main()
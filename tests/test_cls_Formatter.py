@@ -6,6 +6,8 @@ if __name__ == '__main__':
 
 from kwhelp.helper import Formatter
 from typing import Iterator
+import copy
+import pickle
 
 class TestFormatter(unittest.TestCase):
     def test_ordianl(self):
@@ -73,6 +75,28 @@ class TestFormatter(unittest.TestCase):
         assert not result
         with self.assertRaises(TypeError):
             Formatter.is_star_num(name=22)
+        assert Formatter.is_star_num(name="*")
+        assert not Formatter.is_star_num(name="*a")
+        assert not Formatter.is_star_num(name="")
+
+    def test_get_star_num(self):
+        key = Formatter.get_star_num(3)
+        assert key == "*3"
+        assert hash(key) == hash("*3")
+        assert isinstance(key, str)
+        assert key.index == 3
+        assert {"*3": 1}[key] == 1
+        assert {key: 1}["*3"] == 1
+        assert f"Arg {key}" == "Arg *3"
+        # same key is reused for a position
+        assert Formatter.get_star_num(3) is key
+        assert Formatter.is_star_num(name=key)
+        big = Formatter.get_star_num(5000)
+        assert big == "*5000" and big.index == 5000
+        assert Formatter.get_star_num(-1) == "*-1"
+        result = pickle.loads(pickle.dumps(key))
+        assert result == "*3" and result.index == 3
+        assert copy.copy(key).index == 3
 
 if __name__ == '__main__':
     unittest.main()
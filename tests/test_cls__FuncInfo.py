@@ -3,8 +3,13 @@ if __name__ == '__main__':
     import os
     import sys
     sys.path.append(os.path.realpath('.'))
+import gc
 import unittest
-from kwhelp.decorator import _FuncInfo, DecFuncEnum
+from unittest.mock import patch
+from kwhelp import decorator
+from kwhelp.decorator import (_FuncInfo, DecFuncEnum, TypeCheck, TypeCheckKw, RequireArgs,
+                              RuleCheckAll, _get_func_info, _fn_info_registry)
+from kwhelp import rules
 
 
 class Test_FuncInfo(unittest.TestCase):
@@ -101,5 +106,95 @@ class Test_FuncInfo(unittest.TestCase):
                              'neg_two', 'neg_one'])
         assert info.is_noargs == True
 
+    def test_bind_plan(self):
+        def foo(neg_two, neg_one=-1, *args, one, two=2, **kwargs): pass
+        info = _FuncInfo(func=foo, ftype=DecFuncEnum.FUNCTION)
+        plan = info.bind_plan
+        assert plan is info.bind_plan
+        self.assertTupleEqual(plan.pos_names, ('neg_two', 'neg_one'))
+        self.assertTupleEqual(plan.names, ('neg_two', 'neg_one', 'one', 'two'))
+        self.assertTupleEqual(plan.pre_star_names, ('neg_two', 'neg_one'))
+        assert plan.args_start == 2
+        kw, args, kwargs, missing = plan.bind((-2, -1, 10, 11), {"one": 1, "extra": "e"})
+        self.assertListEqual(list(kw.items()), [
+            ('neg_two', -2), ('neg_one', -1), ('one', 1), ('two', 2)])
+        self.assertListEqual(args, [10, 11])
+        self.assertDictEqual(kwargs, {"extra": "e"})
+        assert missing is None
+        _, _, _, missing = plan.bind(tuple(), {})
+        self.assertListEqual(missing, ['neg_two', 'one'])
+
+    def test_bind_plan_kw_only_drop_first(self):
+        class Bar:
+            def foo(self, start, *, end="!"): pass
+        info = _FuncInfo(func=Bar.foo, ftype=DecFuncEnum.METHOD)
+        plan = info.bind_plan
+        assert plan.offset == 1
+        self.assertTupleEqual(plan.pre_star_names, tuple())
+        kw, args, kwargs, missing = plan.bind((Bar(), "go"), {})
+        self.assertListEqual(list(kw.items()), [('start', 'go'), ('end', '!')])
+        assert len(args) == 0
+        assert len(kwargs) == 0
+        assert missing is None
+
+
+class TestFuncInfoRegistry(unittest.TestCase):
+
+    def test_stacked_shared(self):
+        decs = (RequireArgs("one"), TypeCheckKw(arg_info={"one": int}),
+                RuleCheckAll(rules.RuleIntPositive), TypeCheck(int, raise_error=False))
+        calls = []
+        orig = decorator.signature
+
+        def sig(func):
+            calls.append(func)
+            return orig(func)
+
+        with patch.object(decorator, 'signature', sig):
+            def foo(one, two=2):
+                return one
+            fn = foo
+            for dec in reversed(decs):
+                fn = dec(fn)
+            assert fn(1) == 1
+            assert len(calls) == 1
+        infos = set(id(dec._get_fn_info()) for dec in decs)
+        assert len(infos) == 1
+
+    def test_ftype(self):
+        def foo(self, one):
+            return one
+        f_info = _get_func_info(func=foo, ftype=DecFuncEnum.FUNCTION)
+        m_info = _get_func_info(func=foo, ftype=DecFuncEnum.METHOD)
+        assert f_info is not m_info
+        assert m_info is _get_func_info(func=foo, ftype=DecFuncEnum.METHOD)
+        assert f_info.lst_pos_or_kw == ['self', 'one']
+        assert m_info.lst_pos_or_kw == ['one']
+
+    def test_same_code_defaults(self):
+        def get_fn(default):
+            def foo(one=default):
+                return one
+            return foo
+        fn1 = get_fn(1)
+        fn2 = get_fn("a")
+        assert fn1.__code__ is fn2.__code__
+        info1 = _get_func_info(func=fn1, ftype=DecFuncEnum.FUNCTION)
+        info2 = _get_func_info(func=fn2, ftype=DecFuncEnum.FUNCTION)
+        assert info1.defauts == {'one': 1}
+        assert info2.defauts == {'one': 'a'}
+
+    def test_released(self):
+        def foo(one):
+            return one
+        key = (foo.__code__, DecFuncEnum.FUNCTION, foo.__name__)
+        fn = TypeCheck(int, raise_error=False)(foo)
+        assert fn(1) == 1
+        assert key in _fn_info_registry
+        del fn
+        gc.collect()
+        assert key not in _fn_info_registry
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,175 @@
+# coding: utf-8
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+
+import unittest
+from unittest.mock import patch
+from kwhelp import AssignBuilder, AssignSchema, KwargsHelper, HelperArgs, CancelEventError
+from kwhelp.exceptions import RuleError
+import kwhelp
+import kwhelp.rules as rules
+
+
+class Runner:
+    pass
+
+
+def _get_builder() -> AssignBuilder:
+    ab = AssignBuilder()
+    ab.append(key="msg", field='test', types=[str], require=True)
+    ab.append(key="age", types=[int, float], require=True, rules_all=[rules.RuleNumber])
+    ab.append(key="name", rules_all=[rules.RuleStr], default="unknown")
+    ab.append(key="zip", rules_any=[rules.RuleStr, rules.RuleIntPositive], default=0)
+    ab.append(key="opt", types=[str])
+    return ab
+
+
+KWARGS = (
+    {"msg": "hi", "age": 2},
+    {"msg": "hi", "age": 2.5, "name": "Ann", "zip": "12345", "opt": "o"},
+    {"msg": "hi", "age": 2, "zip": -1},
+    {"msg": "hi", "age": 2, "name": 1},
+    {"msg": "hi", "age": "2"},
+    {"msg": "hi", "age": 2, "opt": 1},
+    {"age": 2},
+    {"msg": "hi", "age": 2, "other": 7},
+)
+
+
+class TestAssignSchema(unittest.TestCase):
+
+    def _assign(self, ab: AssignBuilder, kwargs: dict, **opts):
+        r = Runner()
+        kw = KwargsHelper(r, {**kwargs}, **opts)
+        try:
+            result = all([kw.assign_helper(helper) for helper in ab])
+        except Exception as e:
+            return type(e), str(e)
+        return result, r.__dict__, kw.unused_keys
+
+    def _assign_schema(self, schema: AssignSchema, kwargs: dict, **opts):
+        r = Runner()
+        kw = KwargsHelper(r, {**kwargs}, **opts)
+        try:
+            result = kw.assign_schema(schema)
+        except Exception as e:
+            return type(e), str(e)
+        return result, r.__dict__, kw.unused_keys
+
+    def test_same_as_assign(self):
+        ab = _get_builder()
+        schema = ab.compile()
+        for opts in ({}, {"rule_error": False}, {"assign_true_not_required": False},
+                     {"rule_test_before_assign": False, "rule_error": False}):
+            for kwargs in KWARGS:
+                assert self._assign_schema(schema, kwargs, **opts) == self._assign(ab, kwargs, **opts), \
+                    f"{kwargs} {opts}"
+
+    def test_field_prefix(self):
+        schema = _get_builder().compile(field_prefix='m_')
+        assert schema.field_prefix == 'm_'
+        assert schema.fields == {"msg": "test", "age": "m_age", "name": "m_name", "zip": "m_zip", "opt": "m_opt"}
+        r = Runner()
+        # field_prefix of schema is used
+        assert KwargsHelper(r, {"msg": "hi", "age": 1}, field_prefix="_").assign_schema(schema)
+        assert r.test == "hi"
+        assert r.m_age == 1
+        assert r.m_name == "unknown"
+        with self.assertRaises(TypeError):
+            _get_builder().compile(field_prefix=None)
+
+    def test_immutable(self):
+        ab = _get_builder()
+        schema = ab.compile()
+        ab.append(key="new")
+        ab[0].types.add(int)
+        assert schema.keys == ("msg", "age", "name", "zip", "opt")
+        assert "msg" in schema and "new" not in schema
+        assert len(schema) == 5
+        assert schema.required == frozenset(["msg", "age"])
+        item = next(iter(schema))
+        assert isinstance(item, HelperArgs)
+        assert item.types == frozenset([str])
+        with self.assertRaises(AttributeError):
+            item.require = False
+        with self.assertRaises(AttributeError):
+            item.types = [int]
+        with self.assertRaises(AttributeError):
+            schema.new_attr = 1
+        ab = AssignBuilder()
+        ab.append(key="bad", rules_all=[int])
+        with self.assertRaises(TypeError):
+            ab.compile()
+
+    def test_no_per_assign_work(self):
+        schema = _get_builder().compile()
+        # KwargsHelper keeps rule functions it resolved from rules module.
+        with patch.object(KwargsHelper, '_is_arg_str_empty_null') as str_check, \
+                patch.object(HelperArgs, 'to_dict') as to_dict, \
+                patch.object(kwhelp, '_get_rule_checks') as get_checks:
+            for _ in range(3):
+                assert KwargsHelper(Runner(), {"msg": "hi", "age": 2}).assign_schema(schema)
+            assert str_check.call_count == 0
+            assert to_dict.call_count == 0
+            assert get_checks.call_count == 0
+        with self.assertRaises(TypeError):
+            KwargsHelper(Runner(), {}).assign_schema(_get_builder())
+
+    def test_events(self):
+        schema = _get_builder().compile()
+        keys = []
+
+        def before(helper: KwargsHelper, args):
+            keys.append(args.key)
+            if args.key == "name":
+                args.field_value = args.field_value.upper()
+            if args.key == "zip":
+                args.cancel = True
+
+        def after(helper: KwargsHelper, args):
+            assert args.helper_args.key == args.key
+        r = Runner()
+        kw = KwargsHelper(r, {"msg": "hi", "age": 2, "name": "Ann"}, cancel_error=False)
+        kw.add_handler_before_assign(before)
+        kw.add_handler_after_assign(after)
+        assert kw.assign_schema(schema)
+        assert keys == ["msg", "age", "name", "zip"]
+        assert r._name == "ANN"
+        assert not hasattr(r, "_zip")
+        kw = KwargsHelper(Runner(), {"msg": "hi", "age": 2})
+        kw.add_handler_before_assign(before)
+        with self.assertRaises(CancelEventError):
+            kw.assign_schema(schema)
+
+    def test_events_change_helper_args(self):
+        schema = _get_builder().compile()
+
+        def before(helper: KwargsHelper, args):
+            # handlers can change helper args as they can with assign()
+            if args.key == "msg":
+                args.helper_args.field = "_message"
+                args.helper_args.types = {str, int}
+                args.helper_args.rules_all.append(rules.RuleStr)
+
+        for _ in range(2):
+            r = Runner()
+            kw = KwargsHelper(r, {"msg": "hi", "age": 2})
+            kw.add_handler_before_assign(before)
+            assert kw.assign_schema(schema)
+            assert r.test == "hi"
+        # schema is not changed by handlers
+        item = next(iter(schema))
+        assert item.field == "test"
+        assert item.types == frozenset({str})
+        assert item.rules_all == ()
+
+    def test_rule_error(self):
+        schema = _get_builder().compile()
+        with self.assertRaises(RuleError):
+            KwargsHelper(Runner(), {"msg": "hi", "age": 2, "zip": -1}).assign_schema(schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ if __name__ == '__main__':
     sys.path.append(os.path.realpath('.'))
 
 from enum import IntEnum, auto
+from unittest.mock import patch
 from kwhelp.decorator import AcceptedTypes, DecFuncEnum, DecArgEnum, RequireArgs, ReturnType
 from tests.ex_logger import test_logger, clear_log, get_logged_errors
 from tests.ex_log_adapter import LogIndentAdapter
@@ -794,5 +795,28 @@ class TestAcceptedTypesDecoratorsLog(unittest.TestCase):
             errors = get_logged_errors()
             assert len(errors) == 6
 
+    def test_checkers_reused(self):
+        calls = []
+        orig = AcceptedTypes._get_inst
+
+        def get_inst(dec, types):
+            calls.append(types)
+            return orig(dec, types=types)
+
+        with patch.object(AcceptedTypes, '_get_inst', get_inst):
+            @AcceptedTypes(int, (int, str), opt_all_args=True, opt_args_filter=DecArgEnum.ARGS)
+            def myfunc(*args):
+                return len(args)
+            assert len(calls) == 2
+            calls.clear()
+            assert myfunc(1, "2", 3, "4") == 4
+            assert myfunc(1, 2) == 2
+            with self.assertRaises(TypeError):
+                myfunc(1, 2, 3.3)
+            with self.assertRaises(TypeError):
+                myfunc("1", 2)
+            assert len(calls) == 0
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,9 @@ if __name__ == '__main__':
     sys.path.append(os.path.realpath('.'))
 from kwhelp.exceptions import RuleError
 from kwhelp import rules
+from unittest.mock import patch
+from kwhelp import decorator
+from kwhelp.checks import RuleChecker
 from kwhelp.decorator import DecFuncEnum, RuleCheckAnyKw
 from tests.ex_logger import test_logger, clear_log, get_logged_errors
 from tests.ex_log_adapter import LogIndentAdapter
@@ -253,5 +256,29 @@ class TestRuleCheckAnyKwLogger(unittest.TestCase):
             errors = get_logged_errors()
             assert len(errors) == 6
 
+    def test_checkers_reused(self):
+        created = []
+
+        class Checker(RuleChecker):
+            def __init__(self, *args, **kwargs):
+                created.append(kwargs)
+                super().__init__(*args, **kwargs)
+
+        with patch.object(decorator, 'RuleChecker', Checker):
+            @RuleCheckAnyKw(arg_info={"one": 0, "two": 0, "three": rules.RuleStr},
+                            rules=[(rules.RuleIntZero, rules.RuleIntPositive)])
+            def myfunc(one, two=2, **kwargs):
+                return one
+            # keys with the same types share a checker
+            assert len(created) == 2
+            created.clear()
+            assert myfunc(1, 0, three="3") == 1
+            with self.assertRaises(RuleError):
+                myfunc(1, -2)
+            with self.assertRaises(RuleError):
+                myfunc(1, three=3)
+            assert len(created) == 0
+
+
 if __name__ == '__main__':
     unittest.main()
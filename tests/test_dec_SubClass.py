@@ -6,6 +6,7 @@ if __name__ == '__main__':
     sys.path.append(os.path.realpath('.'))
 
 from enum import IntEnum, auto
+from unittest.mock import patch
 from kwhelp.decorator import DecArgEnum, SubClass, DecFuncEnum, RequireArgs, ReturnType
 from tests.ex_logger import test_logger, clear_log, get_logged_errors
 from tests.ex_log_adapter import LogIndentAdapter
@@ -1132,6 +1133,32 @@ class TestSubClassDecoratorsLogger(unittest.TestCase):
             errors = get_logged_errors()
             assert len(errors) == 4
 
+    def test_checkers_reused(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+        calls = []
+        orig = SubClass._get_inst
+
+        def get_inst(dec, types):
+            calls.append(types)
+            return orig(dec, types=types)
+
+        with patch.object(SubClass, '_get_inst', get_inst):
+            @SubClass(int, Base, opt_all_args=True, opt_args_filter=DecArgEnum.ARGS, raise_error=False)
+            def myfunc(*args):
+                return len(args)
+            assert len(calls) == 2
+            calls.clear()
+            assert myfunc(1, Base(), Child(), Child()) == 4
+            with self.assertRaises(TypeError):
+                myfunc(1, Base(), 3)
+            with self.assertRaises(TypeError):
+                myfunc(Base())
+            assert len(calls) == 0
+
 
 if __name__ == '__main__':
     unittest.main()
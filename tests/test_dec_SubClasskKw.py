@@ -4,6 +4,9 @@ if __name__ == '__main__':
     import os
     import sys
     sys.path.append(os.path.realpath('.'))
+from unittest.mock import patch
+from kwhelp import decorator
+from kwhelp.checks import SubClassChecker
 from kwhelp.decorator import DecFuncEnum, SubClasskKw, TypeCheck, ReturnType
 from tests.ex_logger import test_logger, clear_log, get_logged_errors
 from tests.ex_log_adapter import LogIndentAdapter
@@ -373,6 +376,29 @@ class TestSubClasskKwLogger(unittest.TestCase):
             errors = get_logged_errors()
             assert len(errors) == 2
 
+    def test_checkers_reused(self):
+        created = []
+
+        class Checker(SubClassChecker):
+            def __init__(self, *args, **kwargs):
+                created.append(args)
+                super().__init__(*args, **kwargs)
+
+        with patch.object(decorator, 'SubClassChecker', Checker):
+            @SubClasskKw(arg_info={"one": 0, "two": 0, "three": (str,)}, types=[int])
+            def myfunc(one, two=2, **kwargs):
+                return one
+            # keys with the same types share a checker
+            assert len(created) == 2
+            created.clear()
+            assert myfunc(1, three="3") == 1
+            assert myfunc(1, 2, three="3") == 1
+            assert len(created) == 0
+            with self.assertRaises(TypeError):
+                myfunc(1, "2")
+            with self.assertRaises(TypeError):
+                myfunc(1, three=3)
+
 
 if __name__ == '__main__':
     unittest.main()
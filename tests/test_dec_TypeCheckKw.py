@@ -4,6 +4,9 @@ if __name__ == '__main__':
     import os
     import sys
     sys.path.append(os.path.realpath('.'))
+from unittest.mock import patch
+from kwhelp import decorator
+from kwhelp.checks import TypeChecker
 from kwhelp.decorator import DecFuncEnum, TypeCheckKw, TypeCheck, ReturnType
 from tests.ex_logger import test_logger, clear_log, get_logged_errors
 from tests.ex_log_adapter import LogIndentAdapter
@@ -404,6 +407,29 @@ class TestTypeCheckKwLogger(unittest.TestCase):
             errors = get_logged_errors()
             assert len(errors) == 2
 
+    def test_checkers_reused(self):
+        created = []
+
+        class Checker(TypeChecker):
+            def __init__(self, *args, **kwargs):
+                created.append(args)
+                super().__init__(*args, **kwargs)
+
+        with patch.object(decorator, 'TypeChecker', Checker):
+            @TypeCheckKw(arg_info={"one": 0, "two": 0, "three": (str,), "four": 1}, types=[int, []])
+            def myfunc(one, two=2, **kwargs):
+                return one
+            # keys with the same types share a checker
+            assert len(created) == 2
+            created.clear()
+            assert myfunc(1, three="3") == 1
+            assert myfunc(1, 2, three="3", four=4.4) == 1
+            with self.assertRaises(TypeError):
+                myfunc(1, "2")
+            with self.assertRaises(TypeError):
+                myfunc(1, three=3)
+            assert len(created) == 0
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,184 @@
+import unittest
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+from unittest.mock import patch
+from kwhelp.exceptions import RuleError
+from kwhelp import rules
+from kwhelp.decorator import (DecFuncEnum, Validate, RequireArgs, TypeCheck, TypeCheckKw, RuleCheckAll,
+                              RuleCheckAllKw, RuleCheckAny, AcceptedTypes, ArgsMinMax, ReturnType,
+                              ReturnRuleAll, DefaultArgs, _ArgBindPlan)
+
+
+def _speed_decorators(**kwargs):
+    return (
+        RequireArgs("speed", "limit", "name", **kwargs),
+        TypeCheckKw(arg_info={"speed": 0, "limit": 0, "hours": 0, "name": 1},
+                    types=[(int, float), str], **kwargs),
+        RuleCheckAllKw(arg_info={"speed": 0, "limit": 0, "name": 1},
+                       rules=[rules.RuleNumber, rules.RuleStrNotNullEmptyWs], **kwargs),
+        ReturnType(str, **kwargs)
+    )
+
+
+def _stack(decorators, func):
+    for dec in reversed(decorators):
+        func = dec(func)
+    return func
+
+
+def _speed_msg(**kwargs):
+    if kwargs['speed'] < 0:
+        # invalid return type
+        return 0
+    return f"{kwargs['name']} speed is {kwargs['speed']}, limit is {kwargs['limit']}."
+
+
+class TestValidate(unittest.TestCase):
+
+    def _assert_same(self, fn_stack, fn_validate, *args, **kwargs):
+        try:
+            expected = fn_stack(*args, **kwargs)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                fn_validate(*args, **kwargs)
+            assert str(cm.exception) == str(e)
+            return e
+        result = fn_validate(*args, **kwargs)
+        assert result == expected
+        return result
+
+    def test_validate_gen(self):
+        fn_stack = _stack(_speed_decorators(), _speed_msg)
+        fn_validate = Validate(*_speed_decorators())(_speed_msg)
+        result = self._assert_same(fn_stack, fn_validate, speed=45, limit=60, name="John")
+        assert result == "John speed is 45, limit is 60."
+        e = self._assert_same(fn_stack, fn_validate, speed=45, limit=60)
+        assert isinstance(e, ValueError)
+        e = self._assert_same(fn_stack, fn_validate, speed="Fast", limit=60, name="John")
+        assert isinstance(e, TypeError)
+        e = self._assert_same(fn_stack, fn_validate, speed=45, limit=60, name=" ")
+        assert isinstance(e, RuleError)
+        e = self._assert_same(fn_stack, fn_validate, speed=45, limit=60, name="John", hours="1")
+        assert isinstance(e, TypeError)
+        e = self._assert_same(fn_stack, fn_validate, speed=-1, limit=60, name="John")
+        assert isinstance(e, TypeError)
+
+    def test_validate_opt_return(self):
+        # opt_return of a check is validated by return checks of outer decorators.
+        fn_stack = _stack((ReturnType(str), TypeCheck(int, opt_return=1)), lambda x: str(x))
+        fn_validate = Validate(ReturnType(str), TypeCheck(int, opt_return=1))(lambda x: str(x))
+        assert self._assert_same(fn_stack, fn_validate, 2) == "2"
+        e = self._assert_same(fn_stack, fn_validate, "2")
+        assert isinstance(e, TypeError)
+
+        fn_stack = _stack((TypeCheck(int, opt_return=1), ReturnType(str)), lambda x: str(x))
+        fn_validate = Validate(TypeCheck(int, opt_return=1), ReturnType(str))(lambda x: str(x))
+        assert self._assert_same(fn_stack, fn_validate, "2") == 1
+
+        decs = _speed_decorators(opt_return=False)
+        fn_validate = Validate(*decs)(_speed_msg)
+        assert fn_validate(speed=45, limit=60) is False
+        assert fn_validate(speed="Fast", limit=60, name="John") is False
+        assert fn_validate(speed=-1, limit=60, name="John") is False
+
+    def test_validate_order(self):
+        def foo(*args):
+            return sum(args)
+        decs = (ArgsMinMax(max=3), AcceptedTypes(int, int, int), RuleCheckAll(rules.RuleIntPositive))
+        fn_stack = _stack(decs, foo)
+        fn_validate = Validate(*(ArgsMinMax(max=3), AcceptedTypes(int, int, int),
+                                 RuleCheckAll(rules.RuleIntPositive)))(foo)
+        assert self._assert_same(fn_stack, fn_validate, 1, 2, 3) == 6
+        # first failing decorator in order raises.
+        e = self._assert_same(fn_stack, fn_validate, -1, 2, 3, 4)
+        assert isinstance(e, ValueError)
+        e = self._assert_same(fn_stack, fn_validate, -1, 2.2, 3)
+        assert isinstance(e, TypeError)
+        e = self._assert_same(fn_stack, fn_validate, -1, 2, 3)
+        assert isinstance(e, RuleError)
+
+    def test_validate_method(self):
+        class Bar:
+            @Validate(TypeCheck(int, ftype=DecFuncEnum.METHOD),
+                      RuleCheckAny(rules.RuleIntPositive, rules.RuleIntZero, ftype=DecFuncEnum.METHOD),
+                      ReturnRuleAll(rules.RuleIntPositive))
+            def foo(self, value):
+                return value + 1
+
+            @classmethod
+            @Validate(TypeCheck(str, ftype=DecFuncEnum.METHOD_CLASS))
+            def bar(cls, value):
+                return value
+        b = Bar()
+        assert b.foo(0) == 1
+        with self.assertRaises(TypeError):
+            b.foo("1")
+        with self.assertRaises(RuleError):
+            b.foo(-1)
+        assert Bar.bar("a") == "a"
+        with self.assertRaises(TypeError):
+            Bar.bar(1)
+
+    def test_validate_raise_error(self):
+        @Validate(TypeCheck(int, raise_error=False),
+                  RuleCheckAll(rules.RuleIntPositive, raise_error=False))
+        def foo(value):
+            return value
+        assert foo.is_types_valid
+        assert foo.is_rules_all_valid
+        foo(1)
+        assert foo.is_types_valid
+        assert foo.is_rules_all_valid
+        foo(-1)
+        assert foo.is_types_valid
+        assert foo.is_rules_all_valid is False
+        foo("1")
+        assert foo.is_types_valid is False
+
+    def test_validate_bind_once(self):
+        orig = _ArgBindPlan.bind
+        calls = []
+
+        def bind(plan, args, kwargs):
+            calls.append(plan)
+            return orig(plan, args, kwargs)
+
+        def get_decorators():
+            return (RuleCheckAll(rules.RuleNotNone), TypeCheck(int, raise_error=False),
+                    RuleCheckAny(rules.RuleIntPositive))
+
+        def foo(a, *args):
+            return a
+        fn_stack = _stack(get_decorators(), foo)
+        fn_validate = Validate(*get_decorators())(foo)
+        with patch.object(_ArgBindPlan, 'bind', bind):
+            fn_stack(1, 2)
+            assert len(calls) == 3
+            calls.clear()
+            fn_validate(1, 2)
+            assert len(calls) == 1
+            calls.clear()
+            # Kw decorators only get values of the keys they check.
+            _stack(_speed_decorators(), _speed_msg)(speed=45, limit=60, name="John")
+            Validate(*_speed_decorators())(_speed_msg)(speed=45, limit=60, name="John")
+            assert len(calls) == 0
+
+    def test_validate_return_only(self):
+        @Validate(ReturnType(int))
+        def foo(value):
+            return value
+        assert foo(1) == 1
+        with self.assertRaises(TypeError):
+            foo("1")
+
+    def test_validate_err(self):
+        with self.assertRaises(TypeError):
+            Validate(TypeCheck(int), DefaultArgs(value=1))
+        with self.assertRaises(TypeError):
+            Validate(int)
+
+
+if __name__ == '__main__':
+    unittest.main()
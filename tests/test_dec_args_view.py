@@ -0,0 +1,217 @@
+import unittest
+import tracemalloc
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+from unittest.mock import patch
+from collections.abc import Mapping
+from kwhelp.decorator import (DecArgEnum, DecFuncEnum, TypeCheck, RuleCheckAll, RuleCheckAny,
+                              _DecBase, _FnInstInfo, _FuncInfo, _ArgsView, _ArgSelectPlan,
+                              _get_args_filter, RequireArgs, TypeCheckKw)
+from kwhelp import decorator
+from kwhelp import rules
+from kwhelp.exceptions import RuleError
+
+
+def _fn_all(a, b=2, *args, c, d=4, **kwargs):
+    pass
+
+
+def _fn_plain(a, b=2, c=3):
+    pass
+
+
+FILTERS = (DecArgEnum.ARGS, DecArgEnum.KWARGS, DecArgEnum.NAMED_ARGS, DecArgEnum.NO_ARGS,
+           DecArgEnum.All_ARGS, DecArgEnum.ARGS | DecArgEnum.KWARGS,
+           DecArgEnum.ARGS | DecArgEnum.NAMED_ARGS, DecArgEnum.KWARGS | DecArgEnum.NAMED_ARGS)
+
+
+def _get_expected(info: _FnInstInfo, opt_filter: DecArgEnum) -> dict:
+    # filtered args as built before views.
+    if opt_filter & DecArgEnum.All_ARGS == DecArgEnum.All_ARGS:
+        return info.get_all_args()
+    if opt_filter & DecArgEnum.NO_ARGS == DecArgEnum.NO_ARGS:
+        return info.get_filter_noargs()
+    result = {}
+    if DecArgEnum.ARGS in opt_filter:
+        result.update(info.get_filter_arg())
+    if DecArgEnum.KWARGS in opt_filter and info.info.is_kwargs:
+        result.update(info.get_filtered_kwargs())
+    if DecArgEnum.NAMED_ARGS in opt_filter:
+        result.update(info.get_filtered_key_word_args())
+    return result
+
+
+class TestArgsView(unittest.TestCase):
+
+    def test_views(self):
+        calls = (
+            (_fn_all, (1,), {'c': 3}),
+            (_fn_all, (1, 2, 'x', 'y'), {'c': 3, 'e': 5, 'f': 6}),
+            (_fn_plain, (1,), {'c': 'c'}),
+            (_fn_plain, (), {'a': 1, 'b': 2}),
+        )
+        for func, args, kwargs in calls:
+            info = _FnInstInfo(fninfo=_FuncInfo(func=func, ftype=DecFuncEnum.FUNCTION),
+                               fn_args=args, fn_kwargs=kwargs)
+            for opt_filter in FILTERS:
+                view = _get_args_filter(opt_filter)(info)
+                expected = _get_expected(info, opt_filter)
+                assert isinstance(view, Mapping)
+                assert list(view.items()) == list(expected.items()), f"{func.__name__} {opt_filter}"
+                assert list(view._iter_items()) == list(expected.items())
+                assert len(view) == len(expected)
+                assert view == expected
+                for key, value in expected.items():
+                    assert key in view
+                    assert view[key] is value
+                assert 'zz' not in view
+                assert 1 not in view
+                assert dict(**view) == expected
+
+    def test_star_keys(self):
+        info = _FnInstInfo(fninfo=_FuncInfo(func=_fn_all, ftype=DecFuncEnum.FUNCTION),
+                           fn_args=(1, 2, 'x', 'y'), fn_kwargs={'c': 3})
+        view = info.get_view_all()
+        assert view['*2'] == 'x'
+        assert view['*3'] == 'y'
+        with self.assertRaises(KeyError):
+            view['*0']
+        with self.assertRaises(KeyError):
+            view['*4']
+        assert list(view.keys()) == ['a', 'b', '*2', '*3', 'c', 'd']
+
+    def test_read_only(self):
+        info = _FnInstInfo(fninfo=_FuncInfo(func=_fn_plain, ftype=DecFuncEnum.FUNCTION),
+                           fn_args=(1,), fn_kwargs={})
+        view = info.get_view_all()
+        with self.assertRaises(TypeError):
+            view['a'] = 2
+        assert not hasattr(view, '__dict__')
+        # view reads bound args, no copy is made.
+        assert view._kw is info.key_word_args
+
+    def test_filter_resolved_once(self):
+        calls = []
+        orig = decorator._get_args_filter
+
+        def get_args_filter(opt_filter):
+            calls.append(opt_filter)
+            return orig(opt_filter)
+
+        with patch.object(decorator, '_get_args_filter', get_args_filter):
+            @RuleCheckAll(rules.RuleIntPositive, opt_args_filter=DecArgEnum.NAMED_ARGS)
+            def foo(value, *args):
+                return value
+            assert len(calls) == 1
+            for i in range(3):
+                assert foo(1, -1) == 1
+            assert len(calls) == 1
+        with self.assertRaises(RuleError):
+            foo(-1)
+
+    def test_no_copy(self):
+        names = ('get_all_args', 'get_filter_arg', 'get_filter_noargs', 'get_filtered_kwargs',
+                 'get_filtered_key_word_args')
+
+        def fail(*args, **kwargs):
+            raise AssertionError("args dictionary is copied")
+
+        @TypeCheck(int, raise_error=False, opt_args_filter=DecArgEnum.ARGS)
+        @RuleCheckAll(rules.RuleIntPositive, opt_args_filter=DecArgEnum.NAMED_ARGS | DecArgEnum.KWARGS)
+        @RuleCheckAny(rules.RuleIntPositive, rules.RuleIntZero, opt_args_filter=DecArgEnum.NO_ARGS)
+        def foo(value, *args, **kwargs):
+            return value
+        with patch.multiple(_FnInstInfo, **{n: fail for n in names}):
+            assert foo(1, 2, 3, other=0) == 1
+            foo(1, "2")
+            assert foo.is_types_valid is False
+        with self.assertRaises(RuleError):
+            foo(1, other=-1)
+
+    def test_tracemalloc(self):
+        @RuleCheckAll(rules.RuleIntPositive, opt_args_filter=DecArgEnum.NAMED_ARGS)
+        def foo(a, b, c, d, e, f, g, h, *args):
+            return a
+        args = tuple(range(1, 9))
+        foo(*args)
+        tracemalloc.start()
+        try:
+            foo(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # bound args plus call state only, no filtered copies of bound args.
+        assert peak < 4096, peak
+
+
+class TestArgSelectPlan(unittest.TestCase):
+
+    def test_select(self):
+        keys = ('a', 'b', 'c', 'd', 'e', 'zz')
+        calls = (
+            (_fn_all, (1,), {'c': 3}),
+            (_fn_all, (1, 2, 'x', 'y'), {'c': 3, 'e': 5, 'f': 6}),
+            (_fn_all, (), {'a': 1, 'c': 3, 'd': 'd'}),
+            (_fn_plain, (1,), {'c': 'c'}),
+            (_fn_plain, (), {'a': 1, 'b': 2}),
+        )
+        for func, args, kwargs in calls:
+            fninfo = _FuncInfo(func=func, ftype=DecFuncEnum.FUNCTION)
+            plan = _ArgSelectPlan(bind_plan=fninfo.bind_plan, keys=keys)
+            view = _FnInstInfo(fninfo=fninfo, fn_args=args, fn_kwargs=kwargs).get_view_all()
+            expected = {key: view[key] for key in keys if key in view}
+            assert plan.is_bound(args, kwargs)
+            assert plan.select(args, kwargs) == expected, f"{func.__name__}{args}{kwargs}"
+
+    def test_missing(self):
+        fninfo = _FuncInfo(func=_fn_all, ftype=DecFuncEnum.FUNCTION)
+        plan = _ArgSelectPlan(bind_plan=fninfo.bind_plan, keys=('a', 'e'))
+        assert plan.static_keys == ('a',)
+        assert plan.dynamic_keys == ('e',)
+        assert plan.is_bound((), {'c': 1}) is False
+        assert plan.is_bound((1,), {}) is False
+        assert plan.select((1,), {}) is None
+
+    def test_method(self):
+        class Foo:
+            @TypeCheckKw(arg_info={"value": int, "other": str}, ftype=DecFuncEnum.METHOD)
+            def foo(self, value, **kwargs):
+                return value
+        f = Foo()
+        assert f.foo(1, other="a") == 1
+        assert f.foo(value=1) == 1
+        with self.assertRaises(TypeError):
+            f.foo("1")
+        with self.assertRaises(TypeError):
+            f.foo(1, other=2)
+
+    def test_no_bind(self):
+        calls = []
+        orig = _FnInstInfo.__init__
+
+        def init(info, *args, **kwargs):
+            calls.append(info)
+            orig(info, *args, **kwargs)
+
+        @RequireArgs("a", "e")
+        @TypeCheckKw(arg_info={"a": int, "e": int})
+        def foo(a, *args, **kwargs):
+            return a
+        with patch.object(_FnInstInfo, '__init__', init):
+            assert foo(1, 2, 3, e=5) == 1
+            with self.assertRaises(ValueError):
+                foo(1, 2)
+            with self.assertRaises(TypeError):
+                foo(1, 2, e="5")
+            assert len(calls) == 0
+            # missing args are reported by binding all args.
+            with self.assertRaises(TypeError) as cm:
+                foo(e=5)
+            assert "a" in str(cm.exception)
+            assert len(calls) > 0
+
+
+if __name__ == '__main__':
+    unittest.main()
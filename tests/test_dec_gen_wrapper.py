@@ -0,0 +1,226 @@
+import unittest
+import sys
+from abc import ABC
+from pathlib import Path, PurePath
+if __name__ == '__main__':
+    import os
+    sys.path.append(os.path.realpath('.'))
+from kwhelp.decorator import DecArgEnum, DecFuncEnum, TypeCheck, AcceptedTypes, SubClass, Validate
+
+
+def _fn_args(a, b, *args):
+    return (a, b, args)
+
+
+def _fn_default(a, b=1, c="c"):
+    return (a, b, c)
+
+
+def _fn_bad_default(a, b=1.5):
+    return (a, b)
+
+
+def _fn_kw(a, *, b, c=2):
+    return (a, b, c)
+
+
+def _fn_all(a, b=2, *args, c, d=4, **kwargs):
+    return (a, b, args, c, d, kwargs)
+
+
+def _fn_kwargs(a, **kwargs):
+    return (a, kwargs)
+
+
+def _fn_type(type, value=1):
+    return (type, value)
+
+
+CALLS = (
+    ((), {}),
+    ((1,), {}),
+    ((1, 2), {}),
+    ((1, 2, 3), {}),
+    ((1, 2, 3, 4), {}),
+    ((1, "2"), {}),
+    (("1", 2), {}),
+    ((1, 2.5), {}),
+    ((1, 2, "3"), {}),
+    ((1, 2, 3.3), {}),
+    ((1,), {'b': 2}),
+    ((1,), {'b': "2"}),
+    ((1,), {'b': 2, 'c': 3}),
+    ((1,), {'c': 3, 'd': 4}),
+    ((1,), {'c': "3", 'd': 4}),
+    ((1,), {'c': 3, 'e': 5}),
+    ((1,), {'c': 3, 'e': 5.5}),
+    ((), {'a': 1, 'b': 2}),
+    ((), {'a': 1, 'b': 2, 'c': 3}),
+    ((1, 2), {'a': 1}),
+    ((True, 2), {}),
+    ((None, 2), {}),
+)
+
+
+class TestGenWrapper(unittest.TestCase):
+
+    def _assert_same(self, get_dec, func, calls=CALLS):
+        fn_gen = get_dec()(func)
+        fn_interp = Validate(get_dec())(func)
+        assert hasattr(fn_gen, '__kwhelp_source__'), f"no generated wrapper for {func.__name__}"
+        assert not hasattr(fn_interp, '__kwhelp_source__')
+        for args, kwargs in calls:
+            try:
+                expected = fn_interp(*args, **kwargs)
+            except Exception as e:
+                with self.assertRaises(type(e), msg=f"{func.__name__}{args}{kwargs}") as cm:
+                    fn_gen(*args, **kwargs)
+                assert str(cm.exception) == str(e), f"{func.__name__}{args}{kwargs}"
+                continue
+            assert fn_gen(*args, **kwargs) == expected, f"{func.__name__}{args}{kwargs}"
+
+    def test_type_check(self):
+        for func in (_fn_args, _fn_default, _fn_bad_default, _fn_kw, _fn_all, _fn_kwargs, _fn_type):
+            self._assert_same(lambda: TypeCheck(int), func)
+            self._assert_same(lambda: TypeCheck(int, str), func)
+            self._assert_same(lambda: TypeCheck(int, type_instance_check=False), func)
+            self._assert_same(lambda: TypeCheck(int, opt_return="bad"), func)
+            for opt_filter in (DecArgEnum.ARGS, DecArgEnum.KWARGS, DecArgEnum.NAMED_ARGS, DecArgEnum.NO_ARGS):
+                self._assert_same(lambda: TypeCheck(int, opt_args_filter=opt_filter), func)
+
+    def test_accepted_types(self):
+        self._assert_same(lambda: AcceptedTypes(int, (int, str)), _fn_args)
+        self._assert_same(lambda: AcceptedTypes(int, int, (int, str)), _fn_args)
+        self._assert_same(lambda: AcceptedTypes(int, (int, str), opt_all_args=True), _fn_args)
+        self._assert_same(lambda: AcceptedTypes(int, int, int, str, opt_all_args=True), _fn_args)
+        self._assert_same(lambda: AcceptedTypes(int, int, str), _fn_default)
+        self._assert_same(lambda: AcceptedTypes(int, str, str), _fn_default)
+        self._assert_same(lambda: AcceptedTypes(int, int, opt_all_args=True), _fn_default)
+        self._assert_same(lambda: AcceptedTypes(int, (int, float)), _fn_bad_default)
+        self._assert_same(lambda: AcceptedTypes(int, int), _fn_bad_default)
+        self._assert_same(lambda: AcceptedTypes(int, int, int), _fn_kw)
+        self._assert_same(lambda: AcceptedTypes(int, opt_return=None), _fn_kwargs)
+        self._assert_same(lambda: AcceptedTypes(int, (int, str), opt_all_args=True), _fn_kwargs)
+        self._assert_same(lambda: AcceptedTypes(str, int), _fn_type)
+        self._assert_same(lambda: AcceptedTypes(int, int, type_instance_check=False), _fn_type)
+
+    def test_sub_class(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        def fn(a, b=Child(), *args):
+            return (a, b, args)
+        calls = (
+            ((Base(),), {}),
+            ((Child(), Base()), {}),
+            ((Child(), 1), {}),
+            ((Base, Child), {}),
+            ((Child(), Child(), Child()), {}),
+            ((Child(), Child(), 1), {}),
+            ((Base(),), {'b': Child()}),
+            ((), {'b': Child()}),
+        )
+        self._assert_same(lambda: SubClass(Base, opt_all_args=True), fn, calls=calls)
+        self._assert_same(lambda: SubClass(Base, Child), fn, calls=calls)
+        self._assert_same(lambda: SubClass(Base, Child, Base), fn, calls=calls)
+        self._assert_same(lambda: SubClass(Base, (Base, int), opt_all_args=True), fn, calls=calls)
+        self._assert_same(lambda: SubClass(Base, opt_all_args=True, opt_inst_only=False), fn, calls=calls)
+        self._assert_same(lambda: SubClass(Child, opt_all_args=True, opt_return=False), fn, calls=calls)
+        self._assert_same(lambda: SubClass(PurePath, opt_all_args=True), _fn_args,
+                          calls=(((Path('.'), PurePath('.')), {}), ((Path('.'), '.'), {})))
+
+    def test_sub_class_abc_register(self):
+        class Base(ABC):
+            pass
+
+        class Other:
+            pass
+
+        @SubClass(Base)
+        def foo(value):
+            return value
+        assert hasattr(foo, '__kwhelp_source__')
+        with self.assertRaises(TypeError):
+            foo(Other())
+        Base.register(Other)
+        o = Other()
+        assert foo(o) is o
+
+    def test_method(self):
+        class Bar:
+            @TypeCheck(int, ftype=DecFuncEnum.METHOD)
+            def foo(self, value, other=2):
+                return value + other
+
+            @classmethod
+            @AcceptedTypes(int, str, ftype=DecFuncEnum.METHOD_CLASS)
+            def bar(cls, value, other):
+                return other * value
+
+            @staticmethod
+            @SubClass(int, opt_all_args=True, ftype=DecFuncEnum.METHOD_STATIC)
+            def baz(*args):
+                return sum(args)
+        assert hasattr(Bar.foo, '__kwhelp_source__')
+        b = Bar()
+        assert b.foo(1) == 3
+        with self.assertRaises(TypeError):
+            b.foo("1")
+        with self.assertRaises(TypeError):
+            b.foo(1, other="2")
+        assert Bar.bar(2, "a") == "aa"
+        with self.assertRaises(TypeError):
+            Bar.bar("2", "a")
+        assert Bar.baz(1, 2, True) == 4
+        with self.assertRaises(TypeError):
+            Bar.baz(1, 2.0)
+
+    @unittest.skipIf(sys.version_info < (3, 8), "positional only args require python 3.8")
+    def test_pos_only(self):
+        ns = {}
+        exec("def fn(a, b=1, /, c=2, *, d=3):\n    return (a, b, c, d)\n", ns)
+        calls = (((1,), {}), ((1, 2, 3), {}), ((1,), {'b': 2}), ((1,), {'d': "4"}),
+                 (("1",), {}), ((1, 2), {'c': 3, 'd': 4}))
+        self._assert_same(lambda: TypeCheck(int), ns['fn'], calls=calls)
+        self._assert_same(lambda: AcceptedTypes(int, int, int, int), ns['fn'], calls=calls)
+
+    def test_fallback_to_interpreted(self):
+        @TypeCheck(int, raise_error=False)
+        def foo(value):
+            return value
+        assert not hasattr(foo, '__kwhelp_source__')
+        foo("1")
+        assert foo.is_types_valid is False
+
+        @AcceptedTypes(int, opt_args_filter=DecArgEnum.NAMED_ARGS)
+        def bar(value):
+            return value
+        assert not hasattr(bar, '__kwhelp_source__')
+
+        # names that are used by generated code
+        ns = {}
+        exec("def baz(__kw_value):\n    return __kw_value\n", ns)
+        baz = TypeCheck(int)(ns['baz'])
+        assert not hasattr(baz, '__kwhelp_source__')
+        assert baz(1) == 1
+
+        @AcceptedTypes(int, int, int)
+        def qux(a, *args, b):
+            return a
+        assert not hasattr(qux, '__kwhelp_source__')
+
+    def test_source(self):
+        @TypeCheck(int, str)
+        def foo(a, b=1, *args, **kwargs):
+            return a
+        src = foo.__kwhelp_source__
+        assert src.startswith("def __kw_check(a, b=__kw_ns, *args, **kwargs):")
+        assert "__kw_isinstance(a, " in src
+        assert foo.__wrapped__.__name__ == "foo"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+import gc
+import tracemalloc
+import weakref
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+from kwhelp.decorator import (DecFuncEnum, TypeCheck, TypeCheckKw, AcceptedTypes, ArgsLen, ArgsMinMax,
+                              RuleCheckAll, RuleCheckAny, RuleCheckAllKw, RuleCheckAnyKw, RequireArgs,
+                              SubClass, SubClasskKw, ReturnType, ReturnRuleAll, ReturnRuleAny,
+                              DefaultArgs, calltracker, callcounter, _DecBase)
+from kwhelp import rules
+
+BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class Buffer:
+    def __init__(self, size: int = BUFFER_SIZE):
+        self.data = bytearray(size)
+
+
+def _get_decorators():
+    return [
+        TypeCheck(Buffer),
+        AcceptedTypes(Buffer),
+        RuleCheckAll(rules.RuleNotNone),
+        RuleCheckAny(rules.RuleNotNone),
+        RuleCheckAllKw(arg_info={"value": 0}, rules=[(rules.RuleNotNone,)]),
+        RuleCheckAnyKw(arg_info={"value": 0}, rules=[(rules.RuleNotNone,)]),
+        TypeCheckKw(arg_info={"value": 0}, types=[Buffer]),
+        RequireArgs("value"),
+        SubClass(Buffer),
+        SubClasskKw(arg_info={"value": 0}, types=[Buffer]),
+        ReturnType(Buffer),
+        ReturnRuleAll(rules.RuleNotNone),
+        ReturnRuleAny(rules.RuleNotNone),
+        DefaultArgs(other=None),
+        calltracker,
+        callcounter
+    ]
+
+
+class TestDecMemory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # reference counting alone must release args.
+        gc.disable()
+
+    def tearDown(self) -> None:
+        gc.enable()
+
+    def test_args_released(self):
+        for dec in _get_decorators():
+            @dec
+            def foo(value, **kwargs):
+                return value
+            buf = Buffer(size=8)
+            ref = weakref.ref(buf)
+            assert foo(buf) is buf
+            assert foo(value=buf) is buf
+            del buf
+            assert ref() is None, f"{dec} keeps a reference to args"
+
+    def test_star_args_released(self):
+        for dec in (ArgsLen(1), ArgsMinMax(min=1), TypeCheck(Buffer), SubClass(Buffer, opt_all_args=True)):
+            @dec
+            def foo(*args, **kwargs):
+                return len(args)
+            buf = Buffer(size=8)
+            kw_buf = Buffer(size=8)
+            refs = (weakref.ref(buf), weakref.ref(kw_buf))
+            assert foo(buf, key=kw_buf) == 1
+            del buf, kw_buf
+            assert refs[0]() is None, f"{dec} keeps a reference to args"
+            assert refs[1]() is None, f"{dec} keeps a reference to kwargs"
+
+    def test_method_self_released(self):
+        class Bar:
+            @TypeCheck(int, ftype=DecFuncEnum.METHOD)
+            @RuleCheckAll(rules.RuleIntPositive, ftype=DecFuncEnum.METHOD)
+            def foo(self, value):
+                return value
+        bar = Bar()
+        ref = weakref.ref(bar)
+        assert bar.foo(1) == 1
+        del bar
+        assert ref() is None
+
+    def test_failed_args_released(self):
+        @TypeCheck(Buffer, opt_return=False)
+        def foo(value, other):
+            return True
+        buf = Buffer(size=8)
+        ref = weakref.ref(buf)
+        assert foo(buf, 1) is False
+        del buf
+        assert ref() is None
+
+    def test_raised_args_released(self):
+        @TypeCheck(int)
+        def foo(value):
+            return value
+        buf = Buffer(size=8)
+        ref = weakref.ref(buf)
+        with self.assertRaises(TypeError):
+            foo(buf)
+        del buf
+        # traceback of a raised error references wrapper frame, released on collect.
+        gc.collect()
+        assert ref() is None
+
+    def test_tracemalloc(self):
+        @RuleCheckAll(rules.RuleNotNone)
+        @TypeCheck(Buffer, int)
+        def foo(value, size):
+            return len(value.data) == size
+
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            buf = Buffer()
+            assert foo(buf, BUFFER_SIZE)
+            assert foo(value=buf, size=BUFFER_SIZE)
+            del buf
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak - start >= BUFFER_SIZE
+        assert current - start < BUFFER_SIZE // 4
+
+    def test_wrapper_end(self):
+        class Dec(_DecBase):
+            def __call__(self, func):
+                super()._call_init(func=func)
+
+                def wrapper(*args, **kwargs):
+                    self._wrapper_init(args=args, kwargs=kwargs)
+                    assert self.fn_inst_info.get_all_args()['value'] is args[0]
+                    self._wrapper_end()
+                    return func(*args, **kwargs)
+                return wrapper
+
+        @Dec()
+        def foo(value):
+            return value
+        buf = Buffer(size=8)
+        ref = weakref.ref(buf)
+        assert foo(buf) is buf
+        del buf
+        assert ref() is None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+from unittest.mock import patch
+from kwhelp.decorator import (SamplePolicy, set_sample_policy, get_sample_policy, clear_sample_policies,
+                              TypeCheck, AcceptedTypes, RuleCheckAll, ReturnType, Validate, DecFuncEnum,
+                              _ArgBindPlan)
+from kwhelp import rules
+from kwhelp.exceptions import RuleError
+
+
+def _count_fails(fn, calls: int) -> int:
+    fails = 0
+    for _ in range(calls):
+        try:
+            fn("a")
+        except (TypeError, RuleError):
+            fails += 1
+    return fails
+
+
+class TestDecSample(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        clear_sample_policies()
+
+    def test_every(self):
+        @TypeCheck(int)
+        def foo(value):
+            return value
+        assert hasattr(foo, '__kwhelp_source__')
+
+        @RuleCheckAll(rules.RuleInt)
+        def bar(value):
+            return value
+
+        @Validate(TypeCheck(int), ReturnType(int))
+        def baz(value):
+            return value
+        for fn in (foo, bar, baz):
+            assert _count_fails(fn, 10) == 10
+        set_sample_policy(SamplePolicy(every=5))
+        for fn in (foo, bar, baz):
+            assert _count_fails(fn, 10) == 2, fn.__name__
+        set_sample_policy(SamplePolicy(every=1))
+        for fn in (foo, bar, baz):
+            assert _count_fails(fn, 10) == 10
+        set_sample_policy(None)
+        assert get_sample_policy() is None
+        for fn in (foo, bar, baz):
+            assert _count_fails(fn, 10) == 10
+
+    def test_rate(self):
+        @AcceptedTypes(int)
+        def foo(value):
+            return value
+        set_sample_policy(SamplePolicy(rate=0.0))
+        assert _count_fails(foo, 20) == 0
+        set_sample_policy(SamplePolicy(rate=1.0))
+        assert _count_fails(foo, 20) == 20
+        set_sample_policy(SamplePolicy(rate=0.5))
+        with patch('random.random', side_effect=[0.1, 0.9] * 10):
+            set_sample_policy(SamplePolicy(rate=0.5))
+            assert _count_fails(foo, 20) == 10
+
+    def test_targets(self):
+        @TypeCheck(int)
+        def foo(value):
+            return value
+
+        @TypeCheck(int)
+        def bar(value):
+            return value
+        set_sample_policy(SamplePolicy(rate=0.0), __name__)
+        assert _count_fails(foo, 5) == 0
+        assert _count_fails(bar, 5) == 0
+        # function policy is used before module policy
+        set_sample_policy(SamplePolicy(every=1), foo)
+        assert get_sample_policy(foo).every == 1
+        assert _count_fails(foo, 5) == 5
+        assert _count_fails(bar, 5) == 0
+        # module policy is used before global policy
+        set_sample_policy(SamplePolicy(every=1))
+        assert _count_fails(bar, 5) == 0
+        set_sample_policy(None, __name__)
+        assert _count_fails(bar, 5) == 5
+        # parent package policy
+        clear_sample_policies()
+        set_sample_policy(SamplePolicy(rate=0.0), __name__.rpartition('.')[0] or __name__)
+        assert _count_fails(bar, 5) == 0
+        # function by name
+        clear_sample_policies()
+        set_sample_policy(SamplePolicy(rate=0.0), f"{bar.__module__}:{bar.__qualname__}")
+        assert _count_fails(bar, 5) == 0
+        assert _count_fails(foo, 5) == 5
+
+    def test_method(self):
+        class Bar:
+            @TypeCheck(int, ftype=DecFuncEnum.METHOD)
+            def foo(self, value):
+                return value
+        set_sample_policy(SamplePolicy(rate=0.0), Bar.foo)
+        assert _count_fails(Bar().foo, 5) == 0
+        set_sample_policy(SamplePolicy(every=2), Bar().foo)
+        assert _count_fails(Bar().foo, 5) == 3
+
+    def test_skip_binding(self):
+        @RuleCheckAll(rules.RuleIntPositive)
+        def foo(value):
+            return value
+        set_sample_policy(SamplePolicy(every=4), foo)
+        with patch.object(_ArgBindPlan, 'bind', autospec=True, side_effect=_ArgBindPlan.bind) as bind:
+            for i in range(8):
+                assert foo(i + 1) == i + 1
+            assert bind.call_count == 2
+
+    def test_policy_err(self):
+        with self.assertRaises(ValueError):
+            SamplePolicy()
+        with self.assertRaises(ValueError):
+            SamplePolicy(every=2, rate=0.5)
+        with self.assertRaises(ValueError):
+            SamplePolicy(every=0)
+        with self.assertRaises(ValueError):
+            SamplePolicy(rate=1.5)
+        with self.assertRaises(TypeError):
+            SamplePolicy(every=2.0)
+        with self.assertRaises(TypeError):
+            SamplePolicy(rate="0.5")
+        with self.assertRaises(TypeError):
+            set_sample_policy(2)
+        with self.assertRaises(TypeError):
+            set_sample_policy(SamplePolicy(every=2), 2)
+        with self.assertRaises(ValueError):
+            set_sample_policy(SamplePolicy(every=2), " ")
+        assert repr(SamplePolicy(every=3)) == "SamplePolicy(every=3)"
+        assert repr(SamplePolicy(rate=0.5)) == "SamplePolicy(rate=0.5)"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+import subprocess
+if __name__ == '__main__':
+    sys.path.append(os.path.realpath('.'))
+from kwhelp.decorator import (TypeCheck, AcceptedTypes, RuleCheckAll, RuleCheckAllKw, ReturnType, SubClass,
+                              RequireArgs, ArgsLen, Validate, DefaultArgs, calltracker,
+                              set_strip_mode, is_strip_mode, STRIP_ENV_VAR)
+from kwhelp import rules
+from tests.util import get_project_root_dir
+
+
+def _run_code(code: str, env_value=None, optimize: bool = False) -> str:
+    env = dict(os.environ)
+    env.pop(STRIP_ENV_VAR, None)
+    if env_value is not None:
+        env[STRIP_ENV_VAR] = env_value
+    root = str(get_project_root_dir())
+    env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+    cmd = [sys.executable]
+    if optimize:
+        cmd.append('-O')
+    cmd.extend(['-c', code])
+    return subprocess.run(cmd, env=env, cwd=root, check=True,
+                          stdout=subprocess.PIPE).stdout.decode().strip()
+
+
+class TestDecStrip(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._mode = is_strip_mode()
+        set_strip_mode(True)
+
+    def tearDown(self) -> None:
+        set_strip_mode(self._mode)
+
+    def test_strip_returns_func(self):
+        def foo(value, **kwargs):
+            return value
+        decorators = (TypeCheck(int), AcceptedTypes(int), RuleCheckAll(rules.RuleInt),
+                      RuleCheckAllKw(arg_info={"value": 0}, rules=[rules.RuleInt]), ReturnType(int),
+                      SubClass(int), RequireArgs("value"), ArgsLen(0),
+                      Validate(TypeCheck(int), ReturnType(int)))
+        for dec in decorators:
+            assert dec(foo) is foo
+        assert TypeCheck(int)(foo)("not valid") == "not valid"
+
+    def test_strip_attributes(self):
+        @Validate(TypeCheck(int, raise_error=False), RuleCheckAll(rules.RuleIntPositive, raise_error=False))
+        @TypeCheck(int, raise_error=False)
+        def foo(value):
+            return value
+        assert foo("1") == "1"
+        assert foo.is_types_valid
+        assert foo.is_rules_all_valid
+        assert foo.__wrapped__.__wrapped__.__name__ == "foo"
+
+    def test_strip_not_affected(self):
+        @calltracker
+        @DefaultArgs(value=2)
+        def foo(**kwargs):
+            return kwargs["value"]
+        assert foo() == 2
+        assert foo.has_been_called
+
+    def test_strict(self):
+        set_strip_mode(False)
+
+        @TypeCheck(int)
+        def foo(value):
+            return value
+        with self.assertRaises(TypeError):
+            foo("1")
+
+    def test_env(self):
+        code = "from kwhelp.decorator import is_strip_mode; print(is_strip_mode())"
+        assert _run_code(code) == "False"
+        assert _run_code(code, env_value="1") == "True"
+        assert _run_code(code, env_value="true") == "True"
+        assert _run_code(code, env_value="0") == "False"
+        assert _run_code(code, optimize=True) == "True"
+        assert _run_code(code, env_value="0", optimize=True) == "False"
+
+
+if __name__ == '__main__':
+    unittest.main()
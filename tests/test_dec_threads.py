@@ -0,0 +1,194 @@
+import unittest
+import sys
+import threading
+if __name__ == '__main__':
+    import os
+    sys.path.append(os.path.realpath('.'))
+from kwhelp.decorator import (DecFuncEnum, TypeCheck, TypeCheckKw, AcceptedTypes, ArgsLen, ArgsMinMax,
+                              RuleCheckAll, RuleCheckAny, RuleCheckAllKw, RequireArgs, SubClass,
+                              ReturnType, ReturnRuleAll, _DecBase)
+from kwhelp import rules
+from kwhelp.exceptions import RuleError
+from kwhelp.helper import Formatter
+
+THREAD_COUNT = 8
+CALL_COUNT = 300
+
+
+def _run_threads(target, count: int = THREAD_COUNT):
+    errors = []
+    barrier = threading.Barrier(count)
+
+    def runner(i):
+        try:
+            barrier.wait()
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+    threads = [threading.Thread(target=runner, args=(i,)) for i in range(count)]
+    interval = sys.getswitchinterval()
+    # force frequent thread switches so call state of different threads interleaves.
+    sys.setswitchinterval(1e-6)
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return errors
+
+
+class TestDecThreads(unittest.TestCase):
+
+    def test_type_check_threads(self):
+        @TypeCheck(int, str)
+        def foo(first, second, *args, **kwargs):
+            return (first, second, args, kwargs)
+
+        def work(i):
+            for j in range(CALL_COUNT):
+                assert foo(i, str(j), i, j, key=i) == (i, str(j), (i, j), {'key': i})
+                # each thread has its own invalid arg, error must be for that arg.
+                if i % 2 == 0:
+                    name, bad_args = 'first', (float(j), str(j))
+                else:
+                    name, bad_args = 'second', (j, float(j))
+                with self.assertRaises(TypeError) as cm:
+                    foo(*bad_args)
+                assert str(cm.exception).startswith(f"Arg '{name}'")
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_many_dec_threads(self):
+        @RequireArgs("first", "second")
+        @AcceptedTypes(int, (int, str), float)
+        @RuleCheckAll(rules.RuleNotNone)
+        @RuleCheckAny(rules.RuleInt, rules.RuleStr, rules.RuleFloat)
+        @RuleCheckAllKw(arg_info={"first": 0}, rules=[(rules.RuleIntPositive,)])
+        @TypeCheckKw(arg_info={"second": 0}, types=[(int, str)])
+        @ReturnType(tuple)
+        @ReturnRuleAll(rules.RuleIterable)
+        def foo(first, second, third):
+            return (first, second, third)
+
+        def work(i):
+            for j in range(CALL_COUNT):
+                assert foo(i + 1, j, 1.5) == (i + 1, j, 1.5)
+                assert foo(first=i + 1, second=str(j), third=0.5) == (i + 1, str(j), 0.5)
+                with self.assertRaises(RuleError):
+                    foo(-(i + 1), j, 1.5)
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_args_len_threads(self):
+        @ArgsMinMax(min=1, max=3)
+        @ArgsLen(1, 2, 3)
+        @SubClass(int, opt_all_args=True)
+        def foo(*args):
+            return len(args)
+
+        def work(i):
+            for j in range(CALL_COUNT):
+                n = (i + j) % 3 + 1
+                assert foo(*range(n)) == n
+                with self.assertRaises(ValueError):
+                    foo(*range(4))
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_method_threads(self):
+        class Bar:
+            @TypeCheck(int, ftype=DecFuncEnum.METHOD)
+            def foo(self, value):
+                return value
+
+        bars = [Bar() for _ in range(THREAD_COUNT)]
+
+        def work(i):
+            for j in range(CALL_COUNT):
+                assert bars[i].foo(j) == j
+                with self.assertRaises(TypeError):
+                    bars[i].foo(str(j))
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_recursive(self):
+        @RuleCheckAll(rules.RuleIntPositive)
+        @TypeCheck(int)
+        def fact(value, acc=1):
+            if value == 1:
+                return acc
+            return fact(value - 1, acc * value)
+
+        assert fact(10) == 3628800
+        with self.assertRaises(RuleError):
+            fact(0)
+
+    def test_recursive_custom_dec(self):
+        class Dec(_DecBase):
+            def __call__(self, func):
+                super()._call_init(func=func)
+
+                def wrapper(*args, **kwargs):
+                    ctx = self._get_call_context(args=args, kwargs=kwargs)
+                    before = self._get_args_dict(ctx=ctx)
+                    result = func(*args, **kwargs)
+                    # recursive calls and other threads do not change state of this call.
+                    assert self._get_args_dict(ctx=ctx) == before
+                    assert before['value'] == args[0]
+                    return result
+                return wrapper
+
+        @Dec()
+        def countdown(value):
+            if value == 0:
+                return 0
+            return countdown(value - 1) + 1
+
+        def work(i):
+            for j in range(20):
+                assert countdown(i + j) == i + j
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_star_key_threads(self):
+        # keys past cached range are created on demand, each thread asks for positions in a different order.
+        count = 1500
+
+        def work(i):
+            order = range(count) if i % 2 == 0 else range(count - 1, -1, -1)
+            for j in order:
+                key = Formatter.get_star_num(j)
+                assert key == f'*{j}'
+                assert key.index == j
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_star_args_threads(self):
+        @TypeCheck(int)
+        def foo(*args):
+            return len(args)
+        args = tuple(range(1100))
+
+        def work(i):
+            for j in range(20):
+                assert foo(*args) == len(args)
+                with self.assertRaises(TypeError):
+                    foo(*args, 'x')
+        errors = _run_threads(work)
+        assert len(errors) == 0, errors
+
+    def test_no_instance_state(self):
+        dec = TypeCheck(int)
+
+        @dec
+        def foo(value):
+            return value
+        foo(1)
+        # built in decorators do not store call state on decorator instance.
+        assert getattr(dec._local, 'ctx', None) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
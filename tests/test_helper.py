@@ -1,12 +1,17 @@
 # coding: utf-8
 import unittest
+import gc
+import weakref
 if __name__ == '__main__':
     import os
     import sys
     sys.path.append(os.path.realpath('.'))
 
-from kwhelp.helper import is_iterable
+from kwhelp.helper import is_iterable, _is_instance, _get_type
+from kwhelp import helper
 from enum import Enum, auto
+from pathlib import Path
+from abc import ABC
 
 
 class Color(Enum):
@@ -31,5 +36,74 @@ class TestIsIterable(unittest.TestCase):
         assert not is_iterable(arg=Color, excluded_types=(Enum, str))    # Enum
         assert is_iterable(arg=Color, excluded_types=())
         assert is_iterable(arg=Color, excluded_types=2)
+
+
+def _ref_is_instance(obj: object) -> bool:
+    try:
+        if not isinstance(obj, obj):
+            return False
+    except TypeError:
+        pass
+    return True
+
+
+class _Meta(type):
+    def __instancecheck__(cls, instance):
+        return True
+
+
+class _Custom(metaclass=_Meta):
+    pass
+
+
+class _Abstract(ABC):
+    pass
+
+
+class _Bases:
+    __bases__ = ()
+
+
+class _Seq:
+    def __getitem__(self, index):
+        if index > 2:
+            raise IndexError()
+        return index
+
+
+class TestTypeClassification(unittest.TestCase):
+    def test_is_instance(self):
+        values = (1, 1.5, "a", b"a", None, True, [], {}, (), (1, 2), (int,), (int, (str,)), Path('.'),
+                  Color.RED, Color, int, type, object, Enum, Path, _Meta, _Custom, _Custom(),
+                  _Abstract, _Bases(), _Bases, is_iterable, _Seq(), iter([]), range(2), self)
+        for value in values:
+            assert _is_instance(value) == _ref_is_instance(value), repr(value)
+            # again from cache
+            assert _is_instance(value) == _ref_is_instance(value), repr(value)
+            expected = type(value) if _ref_is_instance(value) else value
+            assert _get_type(value) is expected, repr(value)
+
+    def test_is_iterable_classified(self):
+        assert not is_iterable(1)
+        assert not is_iterable(None)
+        assert not is_iterable(self)
+        assert is_iterable(_Seq())
+        assert is_iterable(Color)
+        assert is_iterable(range(2))
+        assert not is_iterable(int)
+
+    def test_flags_weak(self):
+        cls = type("Tmp", (), {})
+        assert _is_instance(cls())
+        assert id(cls) in helper._type_flags
+        ref = weakref.ref(cls)
+        cls_id = id(cls)
+        # classification cache does not keep class alive
+        del cls
+        gc.collect()
+        assert ref() is None
+        assert cls_id not in helper._type_flags
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,99 @@
+# coding: utf-8
+if __name__ == '__main__':
+    import os
+    import sys
+    sys.path.append(os.path.realpath('.'))
+
+import unittest
+from pathlib import Path, PurePath
+from unittest.mock import patch
+import kwhelp
+from kwhelp import KwargsHelper, HelperArgs, BeforeAssignEventArgs, AfterAssignEventArgs
+import kwhelp.rules as rules
+
+
+class Runner:
+    pass
+
+
+KWARGS = {"msg": "hi", "age": 2, "speed": -1.5, "path": Path('.'), "name": " ", "none": None}
+
+ASSIGNS = (
+    dict(key="msg", types=[str], require=True),
+    dict(key=" msg ", field=" test ", types=(str,)),
+    dict(key="msg", field="  "),
+    dict(key="age", types={int, float}, rules_all=[rules.RuleIntPositive]),
+    dict(key="age", types=[str, float, bytes]),
+    dict(key="speed", rules_any=[rules.RuleIntPositive, rules.RuleFloatPositive]),
+    dict(key="speed", rules_all=[rules.RuleFloatNegative], rules_any=[rules.RuleFloat]),
+    dict(key="path", types=[PurePath]),
+    dict(key="name", rules_all=[rules.RuleStrNotNullEmptyWs]),
+    dict(key="none", types=[int]),
+    dict(key="missing", require=True),
+    dict(key="missing", require=True, default=1, rules_all=[rules.RuleIntNegative]),
+    dict(key="missing", default=None, field="x"),
+    dict(key="missing"),
+    dict(key="age", rules_all=[int]),
+    dict(key="age", rules_all=(rules.RuleInt,)),
+    dict(key="age", types=int),
+    dict(key="age", field=1),
+    dict(key=" "),
+    dict(key="age", require=1),
+)
+
+OPTIONS = (
+    {},
+    {"rule_error": False},
+    {"assign_true_not_required": False, "rule_error": False},
+    {"rule_test_before_assign": False, "rule_error": False},
+    {"type_instance_check": False},
+    {"field_prefix": "m_", "name": "Runner"},
+)
+
+
+class TestKwargsHelperNoCb(unittest.TestCase):
+
+    def _assign(self, opts: dict, assign: dict, handler: bool):
+        r = Runner()
+        kw = KwargsHelper(r, {**KWARGS}, **opts)
+        if handler:
+            kw.add_handler_after_assign(lambda helper, args: None)
+        try:
+            result = kw.assign(**assign)
+        except Exception as e:
+            return type(e), str(e)
+        return result, r.__dict__, kw.unused_keys
+
+    def test_same_as_with_handlers(self):
+        for opts in OPTIONS:
+            for assign in ASSIGNS:
+                assert self._assign(opts, assign, False) == self._assign(opts, assign, True), f"{assign} {opts}"
+
+    def test_no_event_args(self):
+        r = Runner()
+        kw = KwargsHelper(r, {**KWARGS})
+        with patch.object(kwhelp, 'HelperArgs', wraps=HelperArgs) as helper, \
+                patch.object(kwhelp, 'BeforeAssignEventArgs', wraps=BeforeAssignEventArgs) as before, \
+                patch.object(kwhelp, 'AfterAssignEventArgs', wraps=AfterAssignEventArgs) as after:
+            assert kw.assign(key="msg", types=[str], require=True)
+            assert kw.assign(key="age", rules_all=[rules.RuleIntPositive])
+            assert kw.assign(key="missing", default=3)
+            assert helper.call_count == 0
+            assert before.call_count == 0
+            assert after.call_count == 0
+            # auto assign handlers do not change assign()
+            kw.add_handler_before_assign_auto(lambda helper, args: None)
+            assert kw.assign(key="speed")
+            assert before.call_count == 0
+            kw.add_handler_before_assign(lambda helper, args: None)
+            assert kw.assign(key="path")
+            assert helper.call_count == 1
+            assert before.call_count == 1
+            assert after.call_count == 1
+        assert r._msg == "hi"
+        assert r._missing == 3
+        assert r._path == Path('.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import subprocess
+import sys
+if __name__ == '__main__':
+    sys.path.append(os.path.realpath('.'))
+import kwhelp
+
+
+ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _run(stmt: str) -> str:
+    proc = subprocess.run([sys.executable, "-c", stmt], cwd=ROOT, stdout=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    return proc.stdout.strip()
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_kwhelp(self):
+        stmt = ("import sys\n"
+                "from kwhelp import KwargsHelper\n"
+                "kw = KwargsHelper(type('Foo', (), {})(), {'a': 1})\n"
+                "kw.assign(key='a', types=[int])\n"
+                "print(sorted(m for m in ('kwhelp.rules', 'kwhelp.checks', 'kwhelp.decorator', 'inspect') if m in sys.modules))\n")
+        assert _run(stmt) == "[]"
+
+    def test_rules_loaded_on_use(self):
+        stmt = ("import sys\n"
+                "from kwhelp import KwargsHelper\n"
+                "import kwhelp\n"
+                "kw = KwargsHelper(type('Foo', (), {})(), {'a': 1})\n"
+                "kw.assign(key='a', rules_all=[kwhelp.rules.RuleInt])\n"
+                "print('kwhelp.rules' in sys.modules, 'kwhelp.decorator' in sys.modules)\n"
+                "# rule functions are resolved once and kept\n"
+                "print(kwhelp._get_rule_checks is kwhelp.rules._get_rule_checks)\n")
+        assert _run(stmt) == "True False\nTrue"
+
+    def test_getattr(self):
+        from kwhelp import decorator, checks, rules
+        assert kwhelp.decorator is decorator
+        assert kwhelp.checks is checks
+        assert kwhelp.rules is rules
+        assert 'decorator' in dir(kwhelp)
+        with self.assertRaises(AttributeError):
+            kwhelp.no_such_module
+
+    def test_irule(self):
+        from kwhelp import IRule
+        from kwhelp import rules
+        assert IRule is rules.IRule
+        assert kwhelp.IRule is rules.IRule
+        assert 'IRule' in dir(kwhelp)
+
+    def test_irule_lazy(self):
+        stmt = ("import sys\n"
+                "import kwhelp\n"
+                "before = 'kwhelp.rules' in sys.modules\n"
+                "from kwhelp import IRule\n"
+                "print(before, IRule is sys.modules['kwhelp.rules'].IRule)\n")
+        assert _run(stmt) == "False True"
+
+
+if __name__ == '__main__':
+    unittest.main()
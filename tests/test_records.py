@@ -0,0 +1,198 @@
+import unittest
+import pickle
+import sys
+from pathlib import Path, PurePath
+if __name__ == '__main__':
+    import os
+    sys.path.append(os.path.realpath('.'))
+from kwhelp import AssignBuilder, KwargsHelper, HelperArgs
+from kwhelp.helper import NO_THING
+from kwhelp.records import RecordValidator, RecordResult, BatchResult, validate_records, validate_batch
+from kwhelp.exceptions import RuleError
+from kwhelp import rules
+
+
+def _get_builder() -> AssignBuilder:
+    ab = AssignBuilder()
+    ab.append(key="name", require=True, types=[str], rules_all=[rules.RuleStrNotNullEmptyWs])
+    ab.append(key="age", types=[int], default=18, rules_all=[rules.RuleIntPositive])
+    ab.append(key="speed", field="_fast", rules_any=[rules.RuleIntNegative, rules.RuleFloatNegative])
+    ab.append(key="path", types=[PurePath, str])
+    return ab
+
+
+class _CountValidator(RecordValidator):
+    pickled = 0
+
+    def __reduce__(self):
+        _CountValidator.pickled += 1
+        return super().__reduce__()
+
+
+RECORDS = (
+    {"name": "Ann", "age": 22, "speed": -1, "path": Path('.')},
+    {"name": "Bob"},
+    {"age": 3},
+    {"name": 1},
+    {"name": " "},
+    {"name": "Ann", "age": -2},
+    {"name": "Ann", "age": "2"},
+    {"name": "Ann", "speed": 1},
+    {"name": "Ann", "speed": -2.5, "path": "."},
+    {"name": "Ann", "path": 1, "other": None},
+)
+
+
+class Obj:
+    pass
+
+
+class RuleNoneResult(rules.IRule):
+    '''Rule that returns a falsy result that is not a bool'''
+
+    def validate(self):
+        if self.field_value == 0:
+            return 0
+        if self.field_value == 1:
+            return None
+        return True
+
+
+class TestRecords(unittest.TestCase):
+
+    def _assign(self, ab: AssignBuilder, record: dict, **kwargs):
+        # result of KwargsHelper.assign() for each item of builder.
+        # a value that is not assigned because rules fail is not valid, even if key is not required.
+        kw = KwargsHelper(Obj(), record, name="record", assign_true_not_required=False, **kwargs)
+        for helper in ab:
+            try:
+                if kw.assign_helper(helper) is False and (helper.key in record or helper.default is not NO_THING):
+                    return (False, helper.key, None)
+            except Exception as e:
+                return (False, helper.key, e)
+        return (True, None, None)
+
+    def test_same_as_assign(self):
+        ab = _get_builder()
+        for rule_error in (True, False):
+            results = list(validate_records(ab, RECORDS, rule_error=rule_error))
+            assert len(results) == len(RECORDS)
+            for i, (record, result) in enumerate(zip(RECORDS, results)):
+                assert isinstance(result, RecordResult)
+                assert result.index == i
+                valid, key, err = self._assign(ab, record, rule_error=rule_error)
+                msg = f"record {i}: {record}, rule_error={rule_error}"
+                assert result.valid is valid, msg
+                assert result.key == key, msg
+                if err is None:
+                    assert result.error is None, msg
+                else:
+                    assert type(result.error) is type(err), msg
+                    assert str(result.error) == str(err), msg
+        result = RecordValidator(ab).validate(RECORDS[1])
+        assert result.values == {"name": "Bob", "age": 18}
+        assert RecordValidator(ab).validate(RECORDS[0]).values == RECORDS[0]
+        assert isinstance(RecordValidator(ab).validate(RECORDS[4]).error, RuleError)
+
+    def test_rule_not_bool(self):
+        ab = AssignBuilder()
+        ab.append(key="num", rules_all=[RuleNoneResult])
+        records = ({"num": 0}, {"num": 1}, {"num": 2})
+        for rule_error in (True, False):
+            results = list(validate_records(ab, records, rule_error=rule_error))
+            for record, result in zip(records, results):
+                valid, key, err = self._assign(ab, record, rule_error=rule_error)
+                assert result.valid is valid, record
+                assert type(result.error) is type(err), record
+        assert [r.valid for r in results] == [False, False, True]
+
+    def test_lazy(self):
+        read = []
+
+        def records():
+            for i in range(1000):
+                read.append(i)
+                yield {"name": f"n{i}", "age": i + 1}
+        results = validate_records(_get_builder(), records())
+        assert read == []
+        first = next(results)
+        assert first.valid and first.values == {"name": "n0", "age": 1}
+        assert read == [0]
+        assert sum(1 for r in results if r.valid) == 999
+
+    def test_type_instance_check(self):
+        ab = AssignBuilder()
+        ab.append(key="path", types=[PurePath])
+        assert RecordValidator(ab).validate({"path": Path('.')}).valid
+        result = RecordValidator(ab, type_instance_check=False).validate({"path": Path('.')}, index=3)
+        assert result.valid is False
+        assert result.index == 3
+        assert isinstance(result.error, TypeError)
+
+    def test_not_mapping(self):
+        result = RecordValidator(_get_builder()).validate(None)
+        assert result.valid is False
+        assert isinstance(result.error, TypeError)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            RecordValidator([])
+        ab = AssignBuilder()
+        ab.append(key="name", rules_all=[int])
+        with self.assertRaises(TypeError):
+            validate_records(ab, [])
+        assert RecordValidator(_get_builder()).keys == ["name", "age", "speed", "path"]
+
+    def test_pickle(self):
+        ab = _get_builder()
+        ab.append_helper(HelperArgs(key="color", default=None, field="col"))
+        validator = pickle.loads(pickle.dumps(RecordValidator(ab, rule_error=False, name="row")))
+        assert validator.keys == ["name", "age", "speed", "path", "color"]
+        assert validator.validate({"name": "Ann"}).values == {"name": "Ann", "age": 18, "color": None}
+        result = validator.validate({"name": "Ann", "age": -1})
+        assert result.valid is False and result.error is None
+        assert str(validator.validate({}).error) == "row arg 'name' is required"
+
+    def test_batch(self):
+        records = [dict(r) for r in RECORDS] * 7
+        expected = [r for r in validate_records(_get_builder(), records) if not r.valid]
+        for chunk_size, max_workers in ((1, 2), (4, 3), (100, None)):
+            result = validate_batch(_get_builder(), iter(records), chunk_size=chunk_size,
+                                    max_workers=max_workers, mask=True)
+            assert isinstance(result, BatchResult)
+            assert result.total == len(records)
+            assert result.failed == len(expected)
+            assert result.first == expected[0].index
+            assert list(result.mask) == [0 if any(r.index == i for r in expected) else 1 for i in range(len(records))]
+            assert [(r.index, r.key, str(r.error)) for r in result.invalid] == \
+                [(r.index, r.key, str(r.error)) for r in expected]
+            assert all(type(a.error) is type(b.error) for a, b in zip(result.invalid, expected))
+        valid = [{"name": f"n{i}"} for i in range(50)]
+        assert validate_batch(_get_builder(), valid, chunk_size=7, max_workers=2) == (50, 0, None, None, [])
+        assert validate_batch(_get_builder(), [], max_workers=1) == (0, 0, None, None, [])
+
+    @unittest.skipIf(sys.version_info < (3, 7), "pool initializer requires python 3.7")
+    def test_batch_validator_per_worker(self):
+        records = [{"name": f"n{i}"} for i in range(40)]
+        _CountValidator.pickled = 0
+        result = _CountValidator(_get_builder()).validate_batch(records, chunk_size=1, max_workers=2)
+        assert result.total == 40 and result.failed == 0
+        # validator is sent to each worker once, not with each chunk
+        assert _CountValidator.pickled <= 2
+
+    def test_batch_fail_fast(self):
+        records = [{"name": f"n{i}"} for i in range(100)]
+        records[37] = {"name": 1}
+        records[80] = {}
+        for chunk_size in (1, 10, 1000):
+            result = validate_batch(_get_builder(), records, chunk_size=chunk_size, fail_fast=True,
+                                    mask=True, max_workers=2)
+            assert result[:3] == (38, 1, 37)
+            assert len(result.mask) == 38 and result.mask[37] == 0
+            assert isinstance(result.invalid[0].error, TypeError)
+        with self.assertRaises(ValueError):
+            validate_batch(_get_builder(), records, chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
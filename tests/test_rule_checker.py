@@ -7,6 +7,7 @@ if __name__ == '__main__':
 from kwhelp.checks import RuleChecker
 from kwhelp.decorator import DecFuncEnum, RuleCheckAny, RuleCheckAll, RuleCheckAllKw, RuleCheckAnyKw, TypeCheckKw
 from kwhelp import rules
+from unittest.mock import patch
 from kwhelp.exceptions import RuleError
 
 
@@ -76,6 +77,75 @@ class TestRuleChecker(unittest.TestCase):
         with self.assertRaises(TypeError):
             rc.validate_all(1)
 
+    def test_any_no_raise(self):
+        calls = []
+
+        class MyRule(rules.IRule):
+            def validate(self) -> bool:
+                calls.append(self.raise_errors)
+                if self.field_value == 7:
+                    return True
+                if self.raise_errors:
+                    raise ValueError("Not 7")
+                return False
+        rc = RuleChecker(rules_any=[MyRule, rules.RuleInt])
+        assert rc.validate_any(7, 1)
+        # rules that are not built in are run once with raise errors
+        assert calls == [True, True]
+        calls.clear()
+        with self.assertRaises(RuleError) as cm:
+            rc.validate_any("a")
+        assert calls == [True]
+        assert isinstance(cm.exception.errors[0], ValueError)
+        assert isinstance(cm.exception.errors[1], TypeError)
+        assert cm.exception.err_rule is MyRule
+        assert isinstance(cm.exception.__cause__, ValueError)
+        calls.clear()
+        rc.raise_error = False
+        assert rc.validate_any("a") is False
+        assert calls == [False]
+
+    def test_no_rule_instance(self):
+        class MyRule(rules.IRule):
+            def validate(self) -> bool:
+                return self.field_value != 7
+        rc = RuleChecker(rules_all=[rules.RuleIntPositive, MyRule],
+                         rules_any=[rules.RuleIntZero, rules.RuleIntPositive], raise_error=False)
+        with patch.object(rules.IRule, '__init__', autospec=True, side_effect=rules.IRule.__init__) as init:
+            assert rc.validate_all(1, 2, three=3)
+            assert rc.validate_any(0, 1, two=2)
+            # only MyRule is created
+            assert init.call_count == 3
+            assert rc.validate_all(1, 7) is False
+
+    def test_validate_many(self):
+        rc = RuleChecker(rules_all=[rules.RuleInt, rules.RuleIntPositive],
+                         rules_any=[rules.RuleIntNegative, rules.RuleStr])
+        values = [1, 0, -1, "a", 5]
+        assert rc.validate_many_all(values, mask=True) == (5, 2, 2, bytearray([1, 1, 0, 0, 1]))
+        assert rc.validate_many_any(values, mask=True) == (5, 3, 0, bytearray([0, 0, 1, 1, 0]))
+        assert rc.validate_many_all(values, fail_fast=True) == (3, 1, 2, None)
+        data = {"a": 1, "b": -2, "c": "c"}
+        assert rc.validate_items_all(data.items()) == (3, 2, "b", None)
+        assert rc.validate_items_any(data.items()) == (3, 1, "a", None)
+        # no rules, all values are valid
+        assert RuleChecker().validate_many_all(values).failed == 0
+        assert RuleChecker().validate_many_any(values).failed == 0
+
+    def test_validate_many_rule_err(self):
+        class MyRule(rules.IRule):
+            def validate(self) -> bool:
+                raise ValueError("Bad Rule")
+        rc = RuleChecker(rules_all=[MyRule], rules_any=[MyRule, rules.RuleStr])
+        with self.assertRaises(RuleError):
+            rc.validate_many_all([1])
+        # errors of rules any are failed matches
+        assert rc.validate_many_any([1, "a"]) == (2, 1, 0, None)
+        rc = RuleChecker(rules_all=[int])
+        with self.assertRaises(TypeError):
+            rc.validate_many_all([1])
+
+
 class TestRuleDecorators(unittest.TestCase):
 
     def test_rule_check_any_dec(self):
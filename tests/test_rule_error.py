@@ -1,5 +1,7 @@
 import unittest
 import re
+import pickle
+from unittest.mock import patch
 if __name__ == '__main__':
     import os
     import sys
@@ -75,5 +77,47 @@ class TestRuleError(unittest.TestCase):
         err = RuleError()
         self.assertIsNone(err.arg_name)
 
+    def test_lazy_message(self):
+        inner = ValueError("bad value")
+        with patch.object(RuleError, '_get_message', autospec=True, side_effect=RuleError._get_message) as get_msg:
+            err = RuleError(err_rule=rules.RuleInt, rules_all=[rules.RuleInt], arg_name="test", errors=[inner])
+            assert get_msg.call_count == 0
+            msg = str(err)
+            assert err.args == (msg,)
+            assert err.message == msg
+            assert get_msg.call_count == 1
+        assert msg.startswith("RuleError: Argument: 'test' failed validation.")
+        assert msg.endswith("Inner Error Message: ValueError: bad value")
+        assert repr(err) == f"RuleError({msg!r})"
+
+    def test_message_set(self):
+        err = RuleError(arg_name="test")
+        err.message = "Custom"
+        assert str(err) == "Custom"
+        err.args = ("Other",)
+        assert str(err) == "Other"
+        assert err.args == ("Other",)
+
+    def test_pickle(self):
+        err = RuleError(err_rule=rules.RuleInt, rules_any=[rules.RuleInt, rules.RuleFloat], arg_name="test",
+                        errors=[ValueError("bad value")], fn_name="foo", msg="More")
+        result = pickle.loads(pickle.dumps(err))
+        assert type(result) is RuleError
+        assert str(result) == str(err)
+        assert result.rules_any == [rules.RuleInt, rules.RuleFloat]
+        assert result.err_rule is rules.RuleInt
+        assert result.fn_name == "foo"
+        err.message = "Custom"
+        assert str(pickle.loads(pickle.dumps(err))) == "Custom"
+
+    def test_from_rule_error(self):
+        err = RuleError(rules_all=[rules.RuleInt], arg_name="test")
+        result = RuleError.from_rule_error(err, fn_name="foo")
+        assert result.fn_name == "foo"
+        assert result.arg_name == "test"
+        assert "'foo' error." in str(result)
+
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -621,5 +621,79 @@ class TestRules(unittest.TestCase):
             self.assertFalse(r.validate())
     # endregion Path
 
+    # region check
+    def _get_builtin_rules(self):
+        return [r for r in vars(rules).values()
+                if isinstance(r, type) and issubclass(r, rules._StatelessRule) and r is not rules._StatelessRule]
+
+    def test_check(self):
+        values = (None, 0, 1, -1, 300, -200, True, 0.0, 1.5, -1.5, "", " ", "a", [], [1], Path('.'),
+                  Path("/no/such/path"), "/no/such/path", ".", self)
+        builtin = self._get_builtin_rules()
+        assert len(builtin) > 20
+        for rule in builtin:
+            for value in values:
+                r = self.create(rule=rule, val=value, err=False)
+                assert rule.check(value, "test", "default", self.obj, False) == r.validate(), f"{rule.__name__} {value!r}"
+                r = self.create(rule=rule, val=value, err=True)
+                try:
+                    expected = r.validate()
+                except Exception as e:
+                    with self.assertRaises(type(e)) as cm:
+                        rule.check(value, "test", "default", self.obj, True)
+                    assert str(cm.exception) == str(e)
+                    continue
+                assert rule.check(value, "test", "default", self.obj, True) == expected
+
+    def test_get_rule_check(self):
+        class MyInt(rules.RuleInt):
+            def validate(self) -> bool:
+                return super().validate() and self.field_value != 7
+
+        class MyIntCheck(rules.RuleInt):
+            @classmethod
+            def check(cls, value, key='arg', name='arg', originator=None, raise_errors=True) -> bool:
+                return super().check(value, key, name, originator, raise_errors) and value != 7
+        assert rules._get_rule_check(rules.RuleInt) == rules.RuleInt.check
+        assert rules._get_rule_check(int) is None
+        assert rules._get_rule_check(None) is None
+        assert rules._get_rule_check([]) is None
+        for rule in (TestRule, MyInt, MyIntCheck):
+            check = rules._get_rule_check(rule)
+            assert check is not None
+        assert rules._get_rule_check(MyInt)(7, raise_errors=False) is False
+        assert rules._get_rule_check(MyInt)(8, raise_errors=False) is True
+        assert rules._get_rule_check(MyIntCheck)(7, raise_errors=False) is False
+        # subclasses of built in rules are validated by an instance
+        assert rules._get_rule_check(MyIntCheck) != MyIntCheck.check
+        assert rules._get_rule_check(TestRule)(None) is True
+
+    def test_get_rule_check_subclass(self):
+        class MyIntValue(rules.RuleInt):
+            @property
+            def field_value(self) -> object:
+                return int(self._value)
+
+        check = rules._get_rule_check(MyIntValue)
+        assert check("3", raise_errors=False) is True
+        assert rules.RuleInt.check("3", raise_errors=False) is False
+
+    def test_validate_checks_any_once(self):
+        calls = []
+
+        class MyRule(rules.IRule):
+            def validate(self) -> bool:
+                calls.append(self.raise_errors)
+                return False
+        checks = rules._get_rule_checks([MyRule, rules.RuleInt])
+        valid, results = rules._validate_checks_any(checks, "a", "key", "field", None, True)
+        assert valid is False
+        # rule that is not built in is not run again to get its error.
+        assert calls == [True]
+        assert results[0].error is None
+        assert isinstance(results[1].error, TypeError)
+    # endregion check
+
+
 if __name__ == '__main__':
     unittest.main()